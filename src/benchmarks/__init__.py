@@ -0,0 +1,11 @@
+"""The benchmarks package contains micro-benchmarks and profiling harnesses
+measuring the hot paths of visualchess, workside and chessgpt."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from ._squarelookup import squareLookupBenchmark
+from ._perftbenchmark import perftBenchmark, perftPositions
+from ._searchbenchmark import searchBenchmark
+from ._renderbenchmark import renderBenchmark
+from ._startupprofile import startupProfile
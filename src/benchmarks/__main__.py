@@ -0,0 +1,67 @@
+"""Runs the benchmarks from the command line:
+  python -m benchmarks squares
+  python -m benchmarks perft --depth 3 --compare
+  python -m benchmarks search --depth 4
+  python -m benchmarks render --fens positions.txt --out thumbnails
+  python -m benchmarks startup --json startup.json"""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import argparse
+import os
+
+#  The backend requested by the user, which the startup profile uses
+audioBackend = os.environ.get('WORKSIDE_AUDIO_BACKEND')
+os.environ.setdefault('WORKSIDE_AUDIO_BACKEND', 'null')
+
+from benchmarks import squareLookupBenchmark, perftBenchmark
+from benchmarks import searchBenchmark, renderBenchmark, startupProfile
+
+parser = argparse.ArgumentParser(prog='benchmarks')
+commands = parser.add_subparsers(dest='command', required=True)
+squaresParser = commands.add_parser(
+  'squares', help='Lookups per second for the Square constructors')
+squaresParser.add_argument('-n', type=int, default=100000)
+perftParser = commands.add_parser(
+  'perft', help='Leaf nodes per second on the standard perft positions')
+perftParser.add_argument('--depth', type=int, default=3)
+perftParser.add_argument('--fen', type=str, default=None)
+perftParser.add_argument('--compare', action='store_true')
+searchParser = commands.add_parser(
+  'search', help='Nodes per second of the chessgpt search')
+searchParser.add_argument('--depth', type=int, default=4)
+searchParser.add_argument('--time', type=float, default=None)
+searchParser.add_argument('--fen', type=str, default=None)
+searchParser.add_argument('--hash', type=float, default=16)
+searchParser.add_argument('--workers', type=int, default=None)
+renderParser = commands.add_parser(
+  'render', help='Images per second of the offscreen board renderer')
+renderParser.add_argument('-n', type=int, default=200)
+renderParser.add_argument('--size', type=int, default=256)
+renderParser.add_argument('--workers', type=int, default=None)
+renderParser.add_argument('--out', type=str, default=None)
+renderParser.add_argument('--fens', type=str, default=None)
+startupParser = commands.add_parser(
+  'startup', help='Import, class setup and first paint times at startup')
+startupParser.add_argument('--no-memory', action='store_true')
+startupParser.add_argument('--no-window', action='store_true')
+startupParser.add_argument('--audio', type=str, default=None)
+startupParser.add_argument('--top', type=int, default=25)
+startupParser.add_argument('--json', type=str, default=None)
+namespace = parser.parse_args()
+
+if namespace.command == 'squares':
+  squareLookupBenchmark(namespace.n)
+elif namespace.command == 'perft':
+  perftBenchmark(namespace.depth, namespace.fen, namespace.compare)
+elif namespace.command == 'search':
+  searchBenchmark(namespace.depth, namespace.time, namespace.fen,
+                  hashMegabytes=namespace.hash, workers=namespace.workers)
+elif namespace.command == 'render':
+  renderBenchmark(namespace.n, namespace.size, namespace.workers,
+                  namespace.out, namespace.fens)
+elif namespace.command == 'startup':
+  startupProfile(not namespace.no_memory, not namespace.no_window,
+                 namespace.audio or audioBackend, namespace.top,
+                 namespace.json)
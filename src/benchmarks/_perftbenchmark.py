@@ -0,0 +1,120 @@
+"""The perftBenchmark runs perft on the standard test positions and
+reports the leaf nodes, whether they match the known counts and the
+nodes per second. Optionally the same counts are computed with
+python-chess for comparison, and on a mismatch the divided counts that
+disagree are printed to locate the offending move."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import time
+
+import chess
+from icecream import ic
+
+from visualchess import BoardState, perft, perftDivide
+
+ic.configureOutput(includeContext=True)
+
+#  The standard perft positions with the known counts at depth 1, 2, ...
+perftPositions = {
+  'initial': (
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1',
+    (20, 400, 8902, 197281, 4865609)),
+  'kiwipete': (
+    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+    (48, 2039, 97862, 4085603)),
+  'position3': (
+    '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+    (14, 191, 2812, 43238, 674624)),
+  'position4': (
+    'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+    (6, 264, 9467, 422333)),
+  'position5': (
+    'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+    (44, 1486, 62379, 2103487)),
+  'position6': (
+    'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+    (46, 2079, 89890, 3894594)),
+}
+
+
+def _referencePerft(board: chess.Board, depth: int) -> int:
+  """Perft using python-chess"""
+  if depth < 2:
+    return board.legal_moves.count() if depth == 1 else 1
+  out = 0
+  for move in board.legal_moves:
+    board.push(move)
+    out += _referencePerft(board, depth - 1)
+    board.pop()
+  return out
+
+
+def _referenceDivide(board: chess.Board, depth: int) -> dict[str, int]:
+  """Perft divide using python-chess"""
+  out = {}
+  for move in board.legal_moves:
+    board.push(move)
+    out[move.uci()] = _referencePerft(board, depth - 1)
+    board.pop()
+  return out
+
+
+def _timePerft(fen: str, depth: int) -> tuple[int, float]:
+  """Returns the perft count and the seconds spent"""
+  state = BoardState.fromFen(fen)
+  tic = time.perf_counter()
+  nodes = perft(state, depth)
+  return nodes, time.perf_counter() - tic
+
+
+def _timeReference(fen: str, depth: int) -> tuple[int, float]:
+  """Returns the python-chess perft count and the seconds spent"""
+  board = chess.Board(fen)
+  tic = time.perf_counter()
+  nodes = _referencePerft(board, depth)
+  return nodes, time.perf_counter() - tic
+
+
+def _printMismatch(fen: str, depth: int) -> None:
+  """Prints the divided counts disagreeing with python-chess"""
+  mine = perftDivide(BoardState.fromFen(fen), depth)
+  theirs = _referenceDivide(chess.Board(fen), depth)
+  for move in sorted({*mine.keys(), *theirs.keys()}):
+    if mine.get(move) != theirs.get(move):
+      print('  %-6s %10s %10s' % (move, mine.get(move), theirs.get(move)))
+
+
+def perftBenchmark(depth: int = 3, fen: str = None, compare: bool = False,
+                   report: bool = True) -> dict:
+  """Runs perft to the given depth on the standard positions or on the
+  given fen only. Returns a dictionary mapping the name of each position
+  to a dictionary with the nodes, whether they are correct, the seconds
+  and the nodes per second. The expected count is taken from the known
+  counts or, when unknown or compare is True, from python-chess. If
+  report is True, the results are printed as a table."""
+  positions = {'custom': (fen, ())} if fen else perftPositions
+  out = {}
+  for (name, (positionFen, counts)) in positions.items():
+    nodes, seconds = _timePerft(positionFen, depth)
+    entry = dict(nodes=nodes, seconds=seconds,
+                 nps=nodes / max(seconds, 1e-9))
+    expected = counts[depth - 1] if 0 < depth <= len(counts) else None
+    if compare or expected is None:
+      expected, refSeconds = _timeReference(positionFen, depth)
+      entry['referenceNps'] = expected / max(refSeconds, 1e-9)
+    entry['ok'] = nodes == expected
+    out[name] = entry
+    if report:
+      if len(out) == 1:
+        print('%-10s %5s %10s %4s %9s %11s %11s' % (
+          'position', 'depth', 'nodes', 'ok', 'seconds', 'nps',
+          'python-chess'))
+      reference = entry.get('referenceNps')
+      print('%-10s %5d %10d %4s %9.3f %11.0f %11s' % (
+        name, depth, nodes, 'yes' if entry['ok'] else 'NO', seconds,
+        entry['nps'], '-' if reference is None else '%.0f' % reference))
+      if not entry['ok']:
+        _printMismatch(positionFen, depth)
+  return out
@@ -0,0 +1,42 @@
+"""The renderBenchmark renders positions to PNG files with the offscreen
+board renderer and reports the images per second. Positions are read
+from a file with one FEN per line, or taken from the standard perft
+positions."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import sys
+import tempfile
+from itertools import cycle, islice
+
+from icecream import ic
+
+import visualchess
+from benchmarks import perftPositions
+
+ic.configureOutput(includeContext=True)
+
+
+def renderBenchmark(count: int = 200, size: int = 256, workers: int = None,
+                    directory: str = None, fenFile: str = None,
+                    report: bool = True) -> list[str]:
+  """Renders positions to PNG files in the directory and returns the
+  file paths. If fenFile is given, every line of it is rendered, where
+  '-' reads standard input. Otherwise, count positions are taken in turn
+  from the standard perft positions. Without a directory, the images are
+  written to a temporary directory which is removed afterwards."""
+  if fenFile == '-':
+    fens = [*sys.stdin]
+  elif fenFile:
+    with open(fenFile, 'r', encoding='utf-8') as file:
+      fens = [*file]
+  else:
+    fens = [*islice(cycle(
+      [fen for (fen, _) in perftPositions.values()]), count)]
+  if directory:
+    return visualchess.renderPositions(fens, directory, size,
+                                       workers=workers, report=report)
+  with tempfile.TemporaryDirectory() as temporary:
+    return visualchess.renderPositions(fens, temporary, size,
+                                       workers=workers, report=report)
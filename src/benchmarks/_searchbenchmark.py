@@ -0,0 +1,54 @@
+"""The searchBenchmark runs the chessgpt search on the standard perft
+positions, or on a given FEN, and reports the nodes searched and the
+nodes per second. This is the number to use when sizing hardware."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from icecream import ic
+
+from chessgpt import Search, SearchResult, ParallelSearch
+from benchmarks import perftPositions
+
+ic.configureOutput(includeContext=True)
+
+
+def searchBenchmark(depth: int = 4, maxTime: float = None, fen: str = None,
+                    report: bool = True, hashMegabytes: float = 16,
+                    workers: int = None) -> dict[str, SearchResult]:
+  """Searches each position to the given depth or for the given time and
+  returns a dictionary mapping the name of each position to the search
+  result. Each position gets a fresh transposition table of the given
+  size. If workers is given, the parallel search runs with that many
+  worker processes and the nodes are summed over the workers. If report
+  is True, the results are printed as a table including the hit rate of
+  the transposition table."""
+  positions = {'custom': fen} if fen else {
+    name: positionFen for (name, (positionFen, _)) in perftPositions.items()}
+  out = {}
+  for (name, positionFen) in positions.items():
+    if workers:
+      with ParallelSearch(workers, depth, None, maxTime,
+                          hashMegabytes) as search:
+        result = search.run(positionFen)
+        counters = search.counters
+    else:
+      search = Search(depth, None, maxTime, hashMegabytes=hashMegabytes)
+      result = search.run(positionFen)
+      counters = search.table.counters
+    hitRate = counters['hits'] / max(counters['probes'], 1)
+    out[name] = result
+    if report:
+      if len(out) == 1:
+        print('%-10s %5s %7s %6s %10s %9s %9s %7s' % (
+          'position', 'depth', 'move', 'score', 'nodes', 'seconds', 'nps',
+          'tt hit'))
+      print('%-10s %5d %7s %6d %10d %9.3f %9.0f %6.1f%%' % (
+        name, result.depth, result.uci, result.score, result.nodes,
+        result.seconds, result.nps, 100 * hitRate))
+  if report and len(out) > 1:
+    nodes = sum(result.nodes for result in out.values())
+    seconds = sum(result.seconds for result in out.values())
+    print('%-10s %5s %7s %6s %10d %9.3f %9.0f' % (
+      'total', '', '', '', nodes, seconds, nodes / max(seconds, 1e-9)))
+  return out
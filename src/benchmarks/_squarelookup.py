@@ -0,0 +1,78 @@
+"""The squareLookupBenchmark measures the lookups per second achieved by
+the Square constructors. The linear scanning implementations that were
+replaced by the lookup tables are retained here as reference, such that
+the benchmark shows the numbers before and after."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from icecream import ic
+
+from visualchess import File, Rank, Square
+
+ic.configureOutput(includeContext=True)
+
+
+def _linearFromFileRank(file: File, rank: Rank) -> Square:
+  """Reference implementation scanning all members of Square"""
+  if not (file and rank):
+    return Square.NULL
+  for square in Square:
+    if square.value[0] == file and square.value[1] == rank:
+      return square
+  raise TypeError
+
+
+def _linearFromInts(x: int, y: int) -> Square:
+  """Reference implementation going through File and Rank"""
+  return _linearFromFileRank(File.fromValue(x), Rank.fromValue(y))
+
+
+def _linearFromStr(code: str) -> Square:
+  """Reference implementation parsing file and rank separately"""
+  return _linearFromFileRank(File.fromStr(code[0]), Rank.fromStr(code[1]))
+
+
+def _timeCalls(func: Callable, argList: list[tuple], n: int) -> float:
+  """Calls func on the arguments in argList until n calls have been made
+  and returns the number of calls per second"""
+  rounds = max(n // len(argList), 1)
+  tic = time.perf_counter()
+  for _ in range(rounds):
+    for args in argList:
+      func(*args)
+  toc = time.perf_counter()
+  return rounds * len(argList) / max(toc - tic, 1e-9)
+
+
+def squareLookupBenchmark(n: int = None, report: bool = True) -> dict:
+  """Times the Square constructors before and after the lookup tables.
+  Returns a dictionary mapping the name of each constructor to a pair of
+  lookups per second in the form (before, after). If report is True,
+  the results are printed as a table."""
+  n = 100000 if n is None else n
+  squares = [square for square in Square if square]
+  fileRanks = [(square.file, square.rank) for square in squares]
+  ints = [(square.x, square.y) for square in squares]
+  codes = [(square.name,) for square in squares]
+  cases = dict(
+    fromFileRank=(_linearFromFileRank, Square.fromFileRank, fileRanks),
+    fromInts=(_linearFromInts, Square.fromInts, ints),
+    fromStr=(_linearFromStr, Square.fromStr, codes),
+  )
+  out = {}
+  for (name, (before, after, argList)) in cases.items():
+    for args in argList:
+      if before(*args) is not after(*args):
+        raise ValueError('%s disagrees at %s' % (name, args))
+    out[name] = (_timeCalls(before, argList, n),
+                 _timeCalls(after, argList, n))
+  if report:
+    print('%-14s %14s %14s %8s' % ('lookup', 'before/s', 'after/s', 'gain'))
+    for (name, (before, after)) in out.items():
+      print('%-14s %14.0f %14.0f %7.1fx' % (
+        name, before, after, after / before))
+  return out
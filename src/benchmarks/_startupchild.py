@@ -0,0 +1,181 @@
+"""The startup child runs in a fresh interpreter started by the
+startupProfile. It imports moreworktoy, workside and visualchess while
+timing every module executed, optionally shows the MainWindow until its
+first paint and writes the measurements as JSON to the file given on the
+command line. Only the standard library is imported before the
+measurement begins, such that no import is hidden from it."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.abc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+#  The packages imported in turn
+startupPackages = ('moreworktoy', 'workside', 'visualchess')
+
+
+def _peakMemory() -> float:
+  """Returns the peak resident memory of the process in kilobytes"""
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return peak / 1024 if sys.platform == 'darwin' else float(peak)
+
+
+def _tracedMemory() -> float:
+  """Returns the memory allocated by Python in kilobytes, or zero when
+  tracemalloc is not tracing"""
+  if tracemalloc.is_tracing():
+    return tracemalloc.get_traced_memory()[0] / 1024
+  return 0.
+
+
+class _TimedLoader(importlib.abc.Loader):
+  """Loader wrapping the loader found for a module, such that executing
+  the module is timed by the import timer"""
+
+  def __init__(self, loader: importlib.abc.Loader, timer: _ImportTimer,
+               name: str) -> None:
+    self._loader = loader
+    self._timer = timer
+    self._name = name
+
+  def create_module(self, spec: object) -> object:
+    """Creates the module with the wrapped loader"""
+    return self._loader.create_module(spec)
+
+  def exec_module(self, module: object) -> None:
+    """Executes the module with the wrapped loader while timing it"""
+    self._timer.enter()
+    try:
+      self._loader.exec_module(module)
+    finally:
+      self._timer.exit(self._name)
+
+  def __getattr__(self, key: str) -> object:
+    """Everything else is answered by the wrapped loader"""
+    return getattr(self._loader, key)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+  """Meta path finder recording the wall time and the memory allocated
+  by the execution of each module imported. The time of a module
+  includes the modules it imports, while the self time does not."""
+
+  def __init__(self) -> None:
+    self.records = []
+    self._stack = []
+
+  def find_spec(self, name: str, path: object, target: object = None):
+    """Finds the spec with the other finders and wraps its loader"""
+    for finder in sys.meta_path:
+      if finder is self or not hasattr(finder, 'find_spec'):
+        continue
+      spec = finder.find_spec(name, path, target)
+      if spec is not None:
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+          spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+    return None
+
+  def enter(self) -> None:
+    """Begins timing a module"""
+    self._stack.append([time.perf_counter(), _tracedMemory(), 0.])
+
+  def exit(self, name: str) -> None:
+    """Completes timing a module"""
+    start, memory, children = self._stack.pop()
+    total = 1000 * (time.perf_counter() - start)
+    if self._stack:
+      self._stack[-1][2] += total
+    self.records.append(dict(
+      module=name, self=total - children, total=total,
+      memory=_tracedMemory() - memory, depth=len(self._stack)))
+
+
+def _profileWindow() -> dict:
+  """Creates the application and the MainWindow and shows it until the
+  first paint has been processed. Returns the milliseconds of each
+  step."""
+  from PySide6.QtCore import QObject, QEvent
+  from PySide6.QtWidgets import QApplication
+
+  class PaintWatcher(QObject):
+    """Records the time of the first paint event"""
+
+    firstPaint = None
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+      """Records the time of the first paint event"""
+      if event.type() == QEvent.Type.Paint and self.firstPaint is None:
+        self.firstPaint = time.perf_counter()
+      return False
+
+  tic = time.perf_counter()
+  app = QApplication.instance() or QApplication([])
+  applicationTime = time.perf_counter()
+  from workside.windows import MainWindow
+  importTime = time.perf_counter()
+  window = MainWindow()
+  constructTime = time.perf_counter()
+  watcher = PaintWatcher()
+  app.installEventFilter(watcher)
+  window.show()
+  while watcher.firstPaint is None and time.perf_counter() - tic < 30:
+    app.processEvents()
+  app.processEvents()
+  paintTime = time.perf_counter()
+  app.removeEventFilter(watcher)
+  window.close()
+  return dict(
+    application=1000 * (applicationTime - tic),
+    importWindows=1000 * (importTime - applicationTime),
+    construction=1000 * (constructTime - importTime),
+    firstPaint=1000 * (paintTime - constructTime),
+    total=1000 * (paintTime - tic))
+
+
+def main() -> None:
+  """Profiles the startup and writes the JSON file"""
+  parser = argparse.ArgumentParser(prog='startupchild')
+  parser.add_argument('output', type=str)
+  parser.add_argument('--memory', action='store_true')
+  parser.add_argument('--window', action='store_true')
+  namespace = parser.parse_args()
+  if namespace.memory:
+    tracemalloc.start()
+  timer = _ImportTimer()
+  sys.meta_path.insert(0, timer)
+  packages = {}
+  for name in startupPackages:
+    tic, memory = time.perf_counter(), _tracedMemory()
+    importlib.import_module(name)
+    packages[name] = dict(total=1000 * (time.perf_counter() - tic),
+                          memory=_tracedMemory() - memory)
+  from moreworktoy import classSetupTimings
+  out = dict(packages=packages, classes=dict(classSetupTimings),
+             window=None, error=None, memoryTraced=namespace.memory)
+  if namespace.window:
+    try:
+      out['window'] = _profileWindow()
+    except Exception as e:
+      out['error'] = '%s: %s' % (type(e).__name__, e)
+  sys.meta_path.remove(timer)
+  out['modules'] = timer.records
+  out['peakMemory'] = _peakMemory()
+  out['interpreter'] = sys.version.split()[0]
+  out['audioBackend'] = os.environ.get('WORKSIDE_AUDIO_BACKEND')
+  with open(namespace.output, 'w', encoding='utf-8') as file:
+    json.dump(out, file)
+  #  Skips the teardown of Qt, which is not part of the startup
+  os._exit(0)
+
+
+if __name__ == '__main__':
+  main()
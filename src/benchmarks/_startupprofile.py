@@ -0,0 +1,109 @@
+"""The startupProfile measures the cold start of the application. A fresh
+interpreter imports moreworktoy, workside and visualchess module by
+module and optionally shows the MainWindow until its first paint. The
+wall time and memory of each step are reported as a table or as JSON."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from icecream import ic
+
+from workside.audio import Settings
+
+ic.configureOutput(includeContext=True)
+
+
+def _runChild(memory: bool, window: bool, audio: str) -> dict:
+  """Runs the startup child in a fresh interpreter with the given audio
+  backend and returns its measurements"""
+  here = os.path.dirname(os.path.abspath(__file__))
+  root = os.path.dirname(here)
+  env = dict(os.environ)
+  env['PYTHONPATH'] = os.pathsep.join(
+    [root, *filter(None, [env.get('PYTHONPATH')])])
+  env['WORKSIDE_AUDIO_BACKEND'] = audio
+  if window:
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+  with tempfile.TemporaryDirectory() as directory:
+    output = os.path.join(directory, 'startup.json')
+    args = [sys.executable, os.path.join(here, '_startupchild.py'), output]
+    args += ['--memory'] if memory else []
+    args += ['--window'] if window else []
+    result = subprocess.run(args, env=env, capture_output=True, text=True)
+    if not os.path.exists(output):
+      msg = """The startup child failed with exit code %d:\n%s"""
+      raise RuntimeError(msg % (result.returncode, result.stderr[-2000:]))
+    with open(output, 'r', encoding='utf-8') as file:
+      return json.load(file)
+
+
+def _mergeMemory(data: dict, traced: dict) -> dict:
+  """Copies the traced memory of each package and module into the
+  measurements of the run without tracing"""
+  for (name, entry) in data['packages'].items():
+    entry['memory'] = traced['packages'][name]['memory']
+  memory = {entry['module']: entry['memory'] for entry in traced['modules']}
+  for entry in data['modules']:
+    entry['memory'] = memory.get(entry['module'], 0.)
+  data['memoryTraced'] = True
+  return data
+
+
+def _printReport(data: dict, top: int) -> None:
+  """Prints the measurements as tables"""
+  unit = 'KB' if data['memoryTraced'] else ''
+  print('Cold start with Python %s, peak resident memory %.0f KB' % (
+    data['interpreter'], data['peakMemory']))
+  print('Audio backend: %s' % data['audioBackend'])
+  print('%-36s %9s %9s %9s' % ('package', 'ms', '', unit))
+  for (name, entry) in data['packages'].items():
+    print('%-36s %9.1f %9s %9s' % (
+      name, entry['total'], '', '%.0f' % entry['memory'] if unit else ''))
+  modules = sorted(data['modules'], key=lambda m: m['self'], reverse=True)
+  print('%-36s %9s %9s %9s' % ('module', 'self ms', 'total ms', unit))
+  for entry in modules[:top]:
+    print('%-36s %9.1f %9.1f %9s' % (
+      entry['module'], entry['self'], entry['total'],
+      '%.0f' % entry['memory'] if unit else ''))
+  print('%-36s %9s %9s' % ('class', 'setup ms', 'createAll'))
+  for (name, entry) in data['classes'].items():
+    print('%-36s %9.1f %9.1f' % (name, entry['setup'], entry['createAll']))
+  if data['window'] is not None:
+    print('%-36s %9s' % ('window', 'ms'))
+    for (step, value) in data['window'].items():
+      print('%-36s %9.1f' % (step, value))
+  if data['error'] is not None:
+    print('The window could not be shown: %s' % data['error'])
+
+
+def startupProfile(memory: bool = True, window: bool = True,
+                   audio: str = None, top: int = 25, jsonPath: str = None,
+                   report: bool = True) -> dict:
+  """Profiles the startup in a fresh interpreter and returns the
+  measurements. The import of each module is timed with and without the
+  modules it imports. If memory is True, the memory allocated by each
+  import is traced in a second interpreter, since tracing slows the
+  imports down many times over. If window is True, the MainWindow is
+  constructed and shown until its first paint, on the offscreen platform
+  unless another is set in QT_QPA_PLATFORM. The audio backend may be
+  given by name and defaults to the one in the audio settings. Also
+  recorded are the setup of each class using IterMeta, including the
+  time spent in createAll, and the peak resident memory. If jsonPath is
+  given, the measurements are written to it. If report is True, the
+  slowest top modules are printed along with the rest."""
+  audio = Settings.backend if audio is None else audio
+  data = _runChild(False, window, audio)
+  if memory:
+    data = _mergeMemory(data, _runChild(True, window, audio))
+  if jsonPath:
+    with open(jsonPath, 'w', encoding='utf-8') as file:
+      json.dump(data, file, indent=2)
+  if report:
+    _printReport(data, top)
+  return data
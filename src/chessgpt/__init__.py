@@ -3,3 +3,9 @@ and to play chess"""
 #  MIT Licence
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
+
+from ._evaluation import evaluate
+from ._searchresult import SearchResult
+from ._transpositiontable import TranspositionTable
+from ._search import Search, searchPosition
+from ._parallelsearch import ParallelSearch
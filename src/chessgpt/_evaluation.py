@@ -0,0 +1,100 @@
+"""The evaluation scores a position statically in centipawns from the
+point of view of the side to move. It adds material and piece-square
+bonuses, both kept as tables indexed by piece code and square index."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from icecream import ic
+
+from visualchess import BoardCore
+
+ic.configureOutput(includeContext=True)
+
+#  Material values indexed by piece type
+pieceValues = (0, 100, 320, 330, 500, 900, 20000)
+#  Piece-square bonuses for white written from rank 8 down to rank 1 as
+#  seen from the white side of the board.
+_pawnTable = (
+  0, 0, 0, 0, 0, 0, 0, 0,
+  50, 50, 50, 50, 50, 50, 50, 50,
+  10, 10, 20, 30, 30, 20, 10, 10,
+  5, 5, 10, 25, 25, 10, 5, 5,
+  0, 0, 0, 20, 20, 0, 0, 0,
+  5, -5, -10, 0, 0, -10, -5, 5,
+  5, 10, 10, -20, -20, 10, 10, 5,
+  0, 0, 0, 0, 0, 0, 0, 0)
+_knightTable = (
+  -50, -40, -30, -30, -30, -30, -40, -50,
+  -40, -20, 0, 0, 0, 0, -20, -40,
+  -30, 0, 10, 15, 15, 10, 0, -30,
+  -30, 5, 15, 20, 20, 15, 5, -30,
+  -30, 0, 15, 20, 20, 15, 0, -30,
+  -30, 5, 10, 15, 15, 10, 5, -30,
+  -40, -20, 0, 5, 5, 0, -20, -40,
+  -50, -40, -30, -30, -30, -30, -40, -50)
+_bishopTable = (
+  -20, -10, -10, -10, -10, -10, -10, -20,
+  -10, 0, 0, 0, 0, 0, 0, -10,
+  -10, 0, 5, 10, 10, 5, 0, -10,
+  -10, 5, 5, 10, 10, 5, 5, -10,
+  -10, 0, 10, 10, 10, 10, 0, -10,
+  -10, 10, 10, 10, 10, 10, 10, -10,
+  -10, 5, 0, 0, 0, 0, 5, -10,
+  -20, -10, -10, -10, -10, -10, -10, -20)
+_rookTable = (
+  0, 0, 0, 0, 0, 0, 0, 0,
+  5, 10, 10, 10, 10, 10, 10, 5,
+  -5, 0, 0, 0, 0, 0, 0, -5,
+  -5, 0, 0, 0, 0, 0, 0, -5,
+  -5, 0, 0, 0, 0, 0, 0, -5,
+  -5, 0, 0, 0, 0, 0, 0, -5,
+  -5, 0, 0, 0, 0, 0, 0, -5,
+  0, 0, 0, 5, 5, 0, 0, 0)
+_queenTable = (
+  -20, -10, -10, -5, -5, -10, -10, -20,
+  -10, 0, 0, 0, 0, 0, 0, -10,
+  -10, 0, 5, 5, 5, 5, 0, -10,
+  -5, 0, 5, 5, 5, 5, 0, -5,
+  0, 0, 5, 5, 5, 5, 0, -5,
+  -10, 5, 5, 5, 5, 5, 0, -10,
+  -10, 0, 5, 0, 0, 0, 0, -10,
+  -20, -10, -10, -5, -5, -10, -10, -20)
+_kingTable = (
+  -30, -40, -40, -50, -50, -40, -40, -30,
+  -30, -40, -40, -50, -50, -40, -40, -30,
+  -30, -40, -40, -50, -50, -40, -40, -30,
+  -30, -40, -40, -50, -50, -40, -40, -30,
+  -20, -30, -30, -40, -40, -30, -30, -20,
+  -10, -20, -20, -20, -20, -20, -20, -10,
+  20, 20, 0, 0, 0, 0, 20, 20,
+  20, 30, 10, 0, 0, 10, 30, 20)
+_tables = (_pawnTable, _knightTable, _bishopTable, _rookTable,
+           _queenTable, _kingTable)
+
+
+def _squareScores() -> tuple[tuple[int, ...], ...]:
+  """Creates the table of material and bonus indexed by piece code and
+  square index. White pieces count positive and black pieces negative,
+  with the board mirrored for black."""
+  out = [(0,) * 64]
+  for sign in [1, -1]:
+    for (pieceType, table) in enumerate(_tables, 1):
+      value = pieceValues[pieceType]
+      out.append(tuple(
+        sign * (value + table[index ^ 56 if sign > 0 else index])
+        for index in range(64)))
+  return tuple(out)
+
+
+squareScores = _squareScores()
+
+
+def evaluate(core: BoardCore, turn: int) -> int:
+  """Returns the static evaluation in centipawns from the point of view
+  of the side to move. The turn is 0 for white and 1 for black."""
+  out = 0
+  for (index, code) in enumerate(core.mailbox):
+    if code:
+      out += squareScores[code][index]
+  return -out if turn else out
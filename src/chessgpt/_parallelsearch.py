@@ -0,0 +1,167 @@
+"""ParallelSearch runs the search on the same root position in several
+worker processes sharing a single transposition table placed in shared
+memory. The workers differ in the depth of their first iteration and in
+the order of quiet moves, such that they fill the table with different
+parts of the tree and help each other through it (Lazy SMP). The result
+of the deepest completed iteration is returned."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+from typing import Never, Any
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import BoardState
+from visualchess._movegen import isCheck
+from chessgpt import Search, SearchResult, TranspositionTable
+from chessgpt._search import MATE
+from chessgpt._transpositiontable import tableBytes
+
+ic.configureOutput(includeContext=True)
+
+#  The shared memory and the stop event attached in each worker process
+_workerMemory = None
+_workerStop = None
+
+
+def _attachWorker(name: str, stopEvent: Any) -> None:
+  """Initializer attaching the worker process to the shared memory"""
+  global _workerMemory, _workerStop
+  try:
+    _workerMemory = SharedMemory(name, track=False)
+  except TypeError:
+    _workerMemory = SharedMemory(name)
+  _workerStop = stopEvent
+
+
+def _workerSearch(fen: str, worker: int, maxDepth: int, maxNodes: int,
+                  maxTime: float, generation: int) -> tuple:
+  """Searches the position in a worker process. The result is returned
+  as a tuple of move, score, depth, principal variation, nodes and
+  seconds followed by the counters of the transposition table."""
+  table = TranspositionTable(buffer=_workerMemory.buf, generation=generation)
+  search = Search(maxDepth, maxNodes, maxTime, table=table,
+                  depthOffset=worker % 2, seed=worker,
+                  stopEvent=_workerStop)
+  result = search.run(fen)
+  _workerStop.set()
+  return (result.move, result.score, result.depth, result.pv, result.nodes,
+          result.seconds, table.counters)
+
+
+class ParallelSearch:
+  """ParallelSearch runs the search in a pool of worker processes sharing
+  a transposition table of hashMegabytes in shared memory. The number of
+  workers defaults to the number of cores. The node budget is shared
+  evenly between the workers, while the depth and time budgets apply to
+  each. The first worker to finish stops the others. The pool and the
+  shared memory are kept between runs until close is called.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, workers: int = None, maxDepth: int = None,
+               maxNodes: int = None, maxTime: float = None,
+               hashMegabytes: float = 64, report: bool = False) -> None:
+    self._workers = workers or os.cpu_count() or 1
+    self._maxDepth = maxDepth
+    self._maxNodes = maxNodes
+    self._maxTime = maxTime
+    self._hashMegabytes = hashMegabytes
+    self._report = report
+    self._generation = 0
+    self._memory = None
+    self._stopEvent = None
+    self._pool = None
+    self._counters = {}
+
+  def _createPool(self) -> None:
+    """Creates the shared memory, the stop event and the worker pool"""
+    context = multiprocessing.get_context()
+    size = tableBytes(self._hashMegabytes)
+    self._memory = SharedMemory(create=True, size=size)
+    self._memory.buf[:size] = bytes(size)
+    self._stopEvent = context.Event()
+    self._pool = ProcessPoolExecutor(
+      self._workers, context, _attachWorker,
+      (self._memory.name, self._stopEvent))
+
+  def run(self, position: BoardState | str) -> SearchResult:
+    """Searches the position given as a board state or as FEN. A root
+    without legal moves is scored without starting the workers, as
+    checkmate when in check and as a draw otherwise."""
+    fen = position if isinstance(position, str) else position.toFen()
+    state = BoardState.fromFen(fen)
+    if not state.getLegalMoves():
+      score = -MATE if isCheck(state.core, state.turnIndex) else 0
+      return SearchResult(0, score, 0, [], 0, 0.)
+    if self._pool is None:
+      self._createPool()
+    maxNodes = None
+    if self._maxNodes is not None:
+      maxNodes = max(self._maxNodes // self._workers, 1)
+    self._stopEvent.clear()
+    tic = time.perf_counter()
+    futures = [self._pool.submit(_workerSearch, fen, worker,
+                                 self._maxDepth, maxNodes, self._maxTime,
+                                 self._generation)
+               for worker in range(self._workers)]
+    self._generation += 1
+    results, nodes, counters = [], 0, {}
+    for future in as_completed(futures):
+      worker = futures.index(future)
+      move, score, depth, pv, workerNodes, seconds, workerCounters = (
+        future.result())
+      nodes += workerNodes
+      for (name, value) in workerCounters.items():
+        counters[name] = counters.get(name, 0) + value
+      if depth:
+        results.append((depth, -worker, move, score, pv))
+      if self._report:
+        print('worker %d depth %d score %d nodes %d pv %s' % (
+          worker, depth, score, workerNodes,
+          ' '.join(SearchResult(move, score, depth, pv, 0, 0.).pvUci)))
+    self._counters = counters
+    seconds = time.perf_counter() - tic
+    if not results:
+      return SearchResult(0, 0, 0, [], nodes, seconds)
+    depth, _, move, score, pv = max(results)
+    return SearchResult(move, score, depth, pv, nodes, seconds)
+
+  def close(self) -> None:
+    """Shuts down the workers and releases the shared memory"""
+    if self._pool is not None:
+      self._pool.shutdown()
+      self._memory.close()
+      self._memory.unlink()
+    self._pool, self._memory, self._stopEvent = None, None, None
+
+  def __enter__(self) -> ParallelSearch:
+    """Context manager entry"""
+    return self
+
+  def __exit__(self, *_) -> None:
+    """Context manager exit closing the pool"""
+    self.close()
+
+  def _getWorkers(self) -> int:
+    """Getter-function for the number of worker processes"""
+    return self._workers
+
+  def _getCounters(self) -> dict[str, int]:
+    """Getter-function for the transposition table counters summed over
+    the workers in the most recent run"""
+    return self._counters
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  workers = property(_getWorkers, _noAcc, _noAcc)
+  counters = property(_getCounters, _noAcc, _noAcc)
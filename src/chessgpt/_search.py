@@ -0,0 +1,289 @@
+"""Search finds the best move in a position using iterative deepening
+negamax with alpha-beta pruning and a quiescence search on captures. The
+search stops at the first of a maximum depth, a node budget and a time
+budget and returns the result of the deepest completed iteration."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import time
+from random import Random
+from typing import Never, Any
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import BoardState
+from visualchess._movegen import isCheck
+from chessgpt import evaluate, SearchResult, TranspositionTable
+from chessgpt._evaluation import pieceValues
+from chessgpt._transpositiontable import EXACT, LOWER_BOUND, UPPER_BOUND
+
+ic.configureOutput(includeContext=True)
+
+MATE = 100000
+INFINITE = 1000000
+MAX_PLY = 128
+#  The budget is checked once every this many nodes
+_checkInterval = 1023
+
+
+def _scoreToTable(score: int, ply: int) -> int:
+  """Mate scores are stored relative to the node rather than the root"""
+  if score > MATE - MAX_PLY:
+    return score + ply
+  if score < MAX_PLY - MATE:
+    return score - ply
+  return score
+
+
+def _scoreFromTable(score: int, ply: int) -> int:
+  """Inverse of _scoreToTable"""
+  if score > MATE - MAX_PLY:
+    return score - ply
+  if score < MAX_PLY - MATE:
+    return score + ply
+  return score
+
+
+class _BudgetExhausted(Exception):
+  """Raised inside the search when the node or time budget runs out"""
+
+
+class Search:
+  """Search finds the best move in a position. The budget is given by
+  the maximum depth, the maximum number of nodes and the maximum time in
+  seconds, where None means unlimited. The first iteration always
+  completes, such that a move is returned even for tiny budgets. Unless
+  a transposition table is given, one of hashMegabytes is created. The
+  table is kept between runs. For parallel search, the depth offset
+  skips the first iterations, a nonzero seed perturbs the order of quiet
+  moves and the search stops once the stop event is set.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, maxDepth: int = None, maxNodes: int = None,
+               maxTime: float = None, report: bool = False,
+               table: TranspositionTable = None,
+               hashMegabytes: float = 16, depthOffset: int = 0,
+               seed: int = 0, stopEvent: Any = None) -> None:
+    self._maxDepth = min(maxDepth or MAX_PLY - 1, MAX_PLY - 1)
+    self._maxNodes = maxNodes
+    self._maxTime = maxTime
+    self._report = report
+    self._table = table or TranspositionTable(hashMegabytes)
+    self._depthOffset = min(depthOffset, self._maxDepth - 1)
+    self._stopEvent = stopEvent
+    self._noise = [0] * 4096
+    if seed:
+      random = Random(seed)
+      self._noise = [random.randrange(1000) for _ in range(4096)]
+    self._nodes = 0
+    self._deadline = None
+    self._mayStop = False
+    self._pvTable = [[0] * MAX_PLY for _ in range(MAX_PLY)]
+    self._pvLength = [0] * MAX_PLY
+    self._killers = [[0, 0] for _ in range(MAX_PLY)]
+    self._previousPV = []
+    self._path = []
+
+  def run(self, position: BoardState | str) -> SearchResult:
+    """Searches the position given as a board state or as FEN. A board
+    state is copied and left unchanged."""
+    if isinstance(position, str):
+      state = BoardState.fromFen(position)
+    else:
+      state = position.copy()
+    tic = time.perf_counter()
+    self._nodes, self._mayStop = 0, False
+    self._deadline = None if self._maxTime is None else tic + self._maxTime
+    self._killers = [[0, 0] for _ in range(MAX_PLY)]
+    self._previousPV = []
+    self._path = [state.zobristKey]
+    self._table.newSearch()
+    result = SearchResult(0, 0, 0, [], 0, 0.)
+    if not state.getLegalMoves():
+      score = -MATE if isCheck(state.core, state.turnIndex) else 0
+      return SearchResult(0, score, 0, [], 0, time.perf_counter() - tic)
+    for depth in range(1 + self._depthOffset, self._maxDepth + 1):
+      try:
+        score = self._negamax(state, depth, -INFINITE, INFINITE, 0)
+      except _BudgetExhausted:
+        break
+      pv = self._pvTable[0][:self._pvLength[0]]
+      self._previousPV = pv
+      result = SearchResult(pv[0], score, depth, pv, self._nodes,
+                            time.perf_counter() - tic)
+      if self._report:
+        print(result)
+      self._mayStop = True
+      if abs(score) > MATE - MAX_PLY:
+        break
+      if self._maxTime is not None:
+        if time.perf_counter() - tic > self._maxTime / 2:
+          break
+    return SearchResult(result.move, result.score, result.depth, result.pv,
+                        self._nodes, time.perf_counter() - tic)
+
+  def _checkBudget(self) -> None:
+    """Raises _BudgetExhausted if the stop event is set or if the node or
+    time budget is spent. Only the stop event may interrupt the first
+    iteration."""
+    if self._stopEvent is not None and self._stopEvent.is_set():
+      raise _BudgetExhausted
+    if not self._mayStop:
+      return
+    if self._maxNodes is not None and self._nodes >= self._maxNodes:
+      raise _BudgetExhausted
+    if self._deadline is not None and time.perf_counter() > self._deadline:
+      raise _BudgetExhausted
+
+  def _orderMoves(self, state: BoardState, moves: list[int], ply: int,
+                  hashMove: int = 0) -> list[int]:
+    """Orders the moves with the move from the transposition table first,
+    then the move from the principal variation, then captures by most
+    valuable victim and least valuable attacker, then killer moves and
+    then the remaining quiet moves."""
+    mailbox = state.core.mailbox
+    pvMove = self._previousPV[ply] if ply < len(self._previousPV) else 0
+    killers = self._killers[ply]
+    noise = self._noise
+
+    def key(move: int) -> int:
+      """Sorting key where larger values are searched first"""
+      if move == hashMove:
+        return 1000000
+      if move == pvMove:
+        return 900000
+      victim = mailbox[move >> 6 & 63]
+      if victim or move >> 12:
+        attacker = (mailbox[move & 63] - 1) % 6 + 1
+        victimValue = pieceValues[(victim - 1) % 6 + 1] if victim else 0
+        return 100000 + 10 * victimValue + 10 * pieceValues[
+          move >> 12] - attacker
+      if move == killers[0]:
+        return 50000
+      if move == killers[1]:
+        return 40000
+      return noise[move & 4095]
+
+    return sorted(moves, key=key, reverse=True)
+
+  def _negamax(self, state: BoardState, depth: int, alpha: int, beta: int,
+               ply: int) -> int:
+    """Returns the score of the position from the point of view of the
+    side to move"""
+    self._nodes += 1
+    if not self._nodes & _checkInterval:
+      self._checkBudget()
+    self._pvLength[ply] = ply
+    if ply and self._path.count(self._path[-1]) > 1:
+      return 0
+    core, turn = state.core, state.turnIndex
+    inCheck = isCheck(core, turn)
+    if inCheck:
+      depth += 1
+    if depth <= 0 or ply >= MAX_PLY - 1:
+      return self._quiescence(state, alpha, beta, ply)
+    key, hashMove = self._path[-1], 0
+    entry = self._table.probe(key)
+    if entry is not None:
+      hashMove, score, entryDepth, bound = entry
+      if ply and entryDepth >= depth:
+        score = _scoreFromTable(score, ply)
+        if bound == EXACT or (
+            bound == LOWER_BOUND and score >= beta) or (
+            bound == UPPER_BOUND and score <= alpha):
+          return score
+    moves = state.getLegalMoves()
+    if not moves:
+      return -MATE + ply if inCheck else 0
+    best, bestMove, alphaOriginal = -INFINITE, 0, alpha
+    for move in self._orderMoves(state, moves, ply, hashMove):
+      quiet = not (core.getCode(move >> 6 & 63) or move >> 12)
+      state.makeMove(move)
+      self._path.append(state.zobristKey)
+      score = -self._negamax(state, depth - 1, -beta, -alpha, ply + 1)
+      self._path.pop()
+      state.unmakeMove()
+      if score > best:
+        best, bestMove = score, move
+      if score > alpha:
+        alpha = score
+        self._updatePV(ply, move)
+        if alpha >= beta:
+          killers = self._killers[ply]
+          if quiet and move != killers[0]:
+            killers[1], killers[0] = killers[0], move
+          break
+    if best >= beta:
+      bound = LOWER_BOUND
+    elif best > alphaOriginal:
+      bound = EXACT
+    else:
+      bound = UPPER_BOUND
+    self._table.store(key, bestMove, _scoreToTable(best, ply), depth, bound)
+    return best
+
+  def _quiescence(self, state: BoardState, alpha: int, beta: int,
+                  ply: int) -> int:
+    """Searches captures and promotions only until the position is quiet
+    and returns the score from the point of view of the side to move"""
+    self._nodes += 1
+    if not self._nodes & _checkInterval:
+      self._checkBudget()
+    self._pvLength[ply] = ply
+    core = state.core
+    best = evaluate(core, state.turnIndex)
+    if best >= beta or ply >= MAX_PLY - 1:
+      return best
+    alpha = max(alpha, best)
+    mailbox = core.mailbox
+    captures = [move for move in state.getLegalMoves()
+                if mailbox[move >> 6 & 63] or move >> 12]
+    for move in self._orderMoves(state, captures, ply):
+      state.makeMove(move)
+      score = -self._quiescence(state, -beta, -alpha, ply + 1)
+      state.unmakeMove()
+      if score > best:
+        best = score
+      if score > alpha:
+        alpha = score
+        self._updatePV(ply, move)
+        if alpha >= beta:
+          break
+    return best
+
+  def _updatePV(self, ply: int, move: int) -> None:
+    """Sets the principal variation at ply to the move followed by the
+    principal variation found at the next ply"""
+    row, child = self._pvTable[ply], self._pvTable[ply + 1]
+    row[ply] = move
+    length = self._pvLength[ply + 1]
+    row[ply + 1:length] = child[ply + 1:length]
+    self._pvLength[ply] = max(length, ply + 1)
+
+  def _getNodes(self) -> int:
+    """Getter-function for the number of nodes searched so far"""
+    return self._nodes
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  def _getTable(self) -> TranspositionTable:
+    """Getter-function for the transposition table"""
+    return self._table
+
+  nodes = property(_getNodes, _noAcc, _noAcc)
+  table = property(_getTable, _noAcc, _noAcc)
+
+
+def searchPosition(position: BoardState | str, maxDepth: int = None,
+                   maxNodes: int = None, maxTime: float = None,
+                   report: bool = False,
+                   hashMegabytes: float = 16) -> SearchResult:
+  """Searches the position given as a board state or FEN with the given
+  budget and returns the result"""
+  return Search(maxDepth, maxNodes, maxTime, report,
+                hashMegabytes=hashMegabytes).run(position)
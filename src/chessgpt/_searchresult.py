@@ -0,0 +1,94 @@
+"""SearchResult holds the outcome of a search: the best move, its score,
+the principal variation and the effort spent finding it."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from typing import Never
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import moveToUci
+
+ic.configureOutput(includeContext=True)
+
+
+class SearchResult:
+  """SearchResult holds the outcome of a search. The move and the moves
+  of the principal variation are encoded as integers as produced by the
+  move generator in visualchess. The score is in centipawns from the
+  point of view of the side to move.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, move: int, score: int, depth: int, pv: list[int],
+               nodes: int, seconds: float) -> None:
+    self._move = move
+    self._score = score
+    self._depth = depth
+    self._pv = pv
+    self._nodes = nodes
+    self._seconds = seconds
+
+  def _getMove(self) -> int:
+    """Getter-function for the best move or 0 if there are no legal
+    moves"""
+    return self._move
+
+  def _getUci(self) -> str:
+    """Getter-function for the best move in UCI notation"""
+    return moveToUci(self._move) if self._move else '0000'
+
+  def _getScore(self) -> int:
+    """Getter-function for the score"""
+    return self._score
+
+  def _getDepth(self) -> int:
+    """Getter-function for the depth of the deepest completed iteration"""
+    return self._depth
+
+  def _getPV(self) -> list[int]:
+    """Getter-function for the principal variation"""
+    return self._pv
+
+  def _getPVUci(self) -> list[str]:
+    """Getter-function for the principal variation in UCI notation"""
+    return [moveToUci(move) for move in self._pv]
+
+  def _getNodes(self) -> int:
+    """Getter-function for the number of nodes searched"""
+    return self._nodes
+
+  def _getSeconds(self) -> float:
+    """Getter-function for the time spent in seconds"""
+    return self._seconds
+
+  def _getNPS(self) -> float:
+    """Getter-function for the nodes searched per second"""
+    return self._nodes / max(self._seconds, 1e-9)
+
+  def __str__(self) -> str:
+    """String representation"""
+    return 'depth %d score %d nodes %d nps %.0f time %.3f pv %s' % (
+      self._depth, self._score, self._nodes, self.nps, self._seconds,
+      ' '.join(self.pvUci))
+
+  def __repr__(self) -> str:
+    """Code representation"""
+    return 'SearchResult(%s, %d, depth=%d)' % (
+      self.uci, self._score, self._depth)
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  move = property(_getMove, _noAcc, _noAcc)
+  uci = property(_getUci, _noAcc, _noAcc)
+  score = property(_getScore, _noAcc, _noAcc)
+  depth = property(_getDepth, _noAcc, _noAcc)
+  pv = property(_getPV, _noAcc, _noAcc)
+  pvUci = property(_getPVUci, _noAcc, _noAcc)
+  nodes = property(_getNodes, _noAcc, _noAcc)
+  seconds = property(_getSeconds, _noAcc, _noAcc)
+  nps = property(_getNPS, _noAcc, _noAcc)
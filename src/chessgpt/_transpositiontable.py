@@ -0,0 +1,211 @@
+"""TranspositionTable stores search results by Zobrist key in a fixed
+amount of memory. The table is a preallocated array of 64-bit words,
+with two entries to a bucket: the first is depth-preferred and the
+second is always replaced. Each entry occupies two words: the key
+exclusive or'ed with the data, and the data packing move, score, depth,
+bound and generation."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from array import array
+from typing import Never
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+ic.configureOutput(includeContext=True)
+
+#  Bound types. An empty entry has the data word 0 and therefore no bound.
+EXACT, LOWER_BOUND, UPPER_BOUND = 1, 2, 3
+#  Bytes used by a bucket of two entries of two words each
+BUCKET_BYTES = 32
+#  Layout of the data word
+_scoreOffset = 1 << 20
+_scoreShift, _depthShift, _boundShift, _ageShift = 16, 37, 45, 47
+
+
+def tableBytes(megabytes: float) -> int:
+  """Returns the number of bytes used by a table of the given size. The
+  number of buckets is the largest power of two fitting the budget."""
+  buckets = max(int(megabytes * (1 << 20)) // BUCKET_BYTES, 1)
+  return (1 << (buckets.bit_length() - 1)) * BUCKET_BYTES
+
+
+def _packData(move: int, score: int, depth: int, bound: int,
+              age: int) -> int:
+  """Packs the entry into a single 64-bit data word"""
+  return (move | (score + _scoreOffset) << _scoreShift
+          | depth << _depthShift | bound << _boundShift | age << _ageShift)
+
+
+def _unpackData(data: int) -> tuple[int, int, int, int]:
+  """Unpacks move, score, depth and bound from the data word"""
+  return (data & 0xFFFF,
+          (data >> _scoreShift & 0x1FFFFF) - _scoreOffset,
+          data >> _depthShift & 0xFF,
+          data >> _boundShift & 3)
+
+
+class TranspositionTable:
+  """TranspositionTable stores search results by Zobrist key in a fixed
+  amount of memory given in megabytes. The number of buckets is the
+  largest power of two fitting the budget. Entries from previous
+  searches are replaced first once newSearch starts a new generation.
+  The table counts probes, hits, collisions, stores and overwrites.
+  If a writable buffer is given, such as the buffer of a shared memory
+  block, the entries are kept in the buffer instead and the size follows
+  from the buffer. Since the key is stored exclusive or'ed with the
+  data, an entry torn by concurrent writers fails to match its key.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, megabytes: float = 16, buffer: memoryview = None,
+               generation: int = 0) -> None:
+    if buffer is None:
+      self._words = array('Q', bytes(tableBytes(megabytes)))
+    else:
+      size = tableBytes(len(buffer) / (1 << 20))
+      self._words = memoryview(buffer).cast('B')[:size].cast('Q')
+    self._buckets = len(self._words) * 8 // BUCKET_BYTES
+    self._mask = self._buckets - 1
+    self._generation = generation & 0xFF
+    self.resetCounters()
+
+  def resetCounters(self) -> None:
+    """Sets all counters to zero"""
+    self._probes = 0
+    self._hits = 0
+    self._collisions = 0
+    self._stores = 0
+    self._overwrites = 0
+
+  def clear(self) -> None:
+    """Removes all entries and resets the generation and the counters"""
+    memoryview(self._words).cast('B')[:] = bytes(len(self._words) * 8)
+    self._generation = 0
+    self.resetCounters()
+
+  def newSearch(self) -> None:
+    """Starts a new generation. Entries from older generations are
+    replaced before entries from the current generation."""
+    self._generation = (self._generation + 1) & 0xFF
+
+  def probe(self, key: int) -> tuple[int, int, int, int] | None:
+    """Returns the move, score, depth and bound stored for the key or
+    None if the key is not in the table"""
+    self._probes += 1
+    words = self._words
+    index = (key & self._mask) << 2
+    occupied = False
+    for slot in [index, index + 2]:
+      data = words[slot + 1]
+      if data:
+        if words[slot] ^ data == key:
+          self._hits += 1
+          return _unpackData(data)
+        occupied = True
+    if occupied:
+      self._collisions += 1
+    return None
+
+  def store(self, key: int, move: int, score: int, depth: int,
+            bound: int) -> None:
+    """Stores the entry in the bucket of the key. The depth-preferred
+    slot is used if it is empty, holds the same key, holds an entry from
+    an older generation or one searched less deeply. Otherwise, the
+    always-replace slot is used."""
+    self._stores += 1
+    words = self._words
+    slot = (key & self._mask) << 2
+    generation = self._generation
+    data = words[slot + 1]
+    if data and words[slot] ^ data != key:
+      if (data >> _depthShift & 0xFF) > depth and (
+          data >> _ageShift) == generation:
+        slot += 2
+        data = words[slot + 1]
+    if data and words[slot] ^ data != key:
+      self._overwrites += 1
+    data = _packData(move, score, min(max(depth, 0), 0xFF), bound,
+                     generation)
+    words[slot] = key ^ data
+    words[slot + 1] = data
+
+  def _getMegabytes(self) -> float:
+    """Getter-function for the memory used by the entries in megabytes"""
+    return self._buckets * BUCKET_BYTES / (1 << 20)
+
+  def _getSize(self) -> int:
+    """Getter-function for the number of entries"""
+    return 2 * self._buckets
+
+  def _getGeneration(self) -> int:
+    """Getter-function for the current generation"""
+    return self._generation
+
+  def _getHashFull(self) -> int:
+    """Getter-function for the permille of the first thousand entries
+    holding entries from the current generation"""
+    words, generation, count = self._words, self._generation, 0
+    entries = min(1000, 2 * self._buckets)
+    for entry in range(entries):
+      data = words[2 * entry + 1]
+      count += 1 if data and (data >> _ageShift) == generation else 0
+    return 1000 * count // entries
+
+  def _getCounters(self) -> dict[str, int]:
+    """Getter-function for the counters as a dictionary"""
+    return dict(probes=self._probes, hits=self._hits,
+                collisions=self._collisions, stores=self._stores,
+                overwrites=self._overwrites)
+
+  def _getProbes(self) -> int:
+    """Getter-function for the number of probes"""
+    return self._probes
+
+  def _getHits(self) -> int:
+    """Getter-function for the number of probes finding their key"""
+    return self._hits
+
+  def _getCollisions(self) -> int:
+    """Getter-function for the number of probes missing their key in a
+    bucket occupied by other positions"""
+    return self._collisions
+
+  def _getStores(self) -> int:
+    """Getter-function for the number of stores"""
+    return self._stores
+
+  def _getOverwrites(self) -> int:
+    """Getter-function for the number of stores replacing an entry of
+    another position"""
+    return self._overwrites
+
+  def _getHitRate(self) -> float:
+    """Getter-function for the fraction of probes that hit"""
+    return self._hits / self._probes if self._probes else 0.
+
+  def __str__(self) -> str:
+    """String representation"""
+    return ('TranspositionTable(%.1f MB, probes %d, hits %d (%.1f%%), '
+            'collisions %d, stores %d, overwrites %d, hashfull %d)' % (
+              self.megabytes, self._probes, self._hits, 100 * self.hitRate,
+              self._collisions, self._stores, self._overwrites,
+              self.hashFull))
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  megabytes = property(_getMegabytes, _noAcc, _noAcc)
+  size = property(_getSize, _noAcc, _noAcc)
+  generation = property(_getGeneration, _noAcc, _noAcc)
+  hashFull = property(_getHashFull, _noAcc, _noAcc)
+  counters = property(_getCounters, _noAcc, _noAcc)
+  probes = property(_getProbes, _noAcc, _noAcc)
+  hits = property(_getHits, _noAcc, _noAcc)
+  collisions = property(_getCollisions, _noAcc, _noAcc)
+  stores = property(_getStores, _noAcc, _noAcc)
+  overwrites = property(_getOverwrites, _noAcc, _noAcc)
+  hitRate = property(_getHitRate, _noAcc, _noAcc)
@@ -11,5 +11,5 @@ from ._floatfield import FloatField
 from ._index import Index
 from ._typekey import TypeKey
 from ._parentparser import parentParser
-from ._itermeta import Iterify
+from ._itermeta import Iterify, classSetupTimings
 # from ._overloader import OverLoadify, overload
@@ -4,6 +4,7 @@ instances."""
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
+import time
 from typing import NoReturn
 
 from worktoy.core import maybe
@@ -14,6 +15,10 @@ from worktoy.waitaminute import ProceduralError
 Bases = tuple[type, ...]
 ic.configureOutput(includeContext=True)
 
+#  Milliseconds spent setting up each class and running its createAll,
+#  keyed by the qualified name of the class
+classSetupTimings = {}
+
 
 class IterMeta(type):
   """Implementation of instance awareness enabling classes using this
@@ -119,7 +124,8 @@ class IterMeta(type):
                       __old__=False,
                       __root__=False,
                       __ready__=False,
-                      _recursionFlag=False)
+                      _recursionFlag=False,
+                      __setupStart__=time.perf_counter())
     return nameSpace
 
   def __new__(mcls, name: str, bases: Bases, attrs: dict, **kwargs) -> type:
@@ -141,12 +147,19 @@ class IterMeta(type):
     return newClass
 
   def __init__(cls, *args, **kwargs) -> None:
-    """Initialisation of class"""
+    """Initialisation of class. The time from the preparation of the
+    namespace to the class being ready is recorded in classSetupTimings
+    together with the time spent in createAll."""
     super().__init__(*args, **kwargs)
     createAll = getattr(cls, '__createAll__', None)
+    tic = time.perf_counter()
     if createAll:
       createAll(cls)
+    toc = time.perf_counter()
     cls.__ready__ = True
+    classSetupTimings[cls.__qualname__] = dict(
+      setup=1000 * (toc - cls.__setupStart__),
+      createAll=1000 * (toc - tic))
     print('%s reporting ready' % cls)
 
   def __call__(cls, *args, **kwargs) -> object:
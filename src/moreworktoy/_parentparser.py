@@ -4,10 +4,14 @@ find an instance of QWidget"""
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
-from PySide6.QtWidgets import QWidget
+from typing import TYPE_CHECKING
+
 from worktoy.parsing import extractArg
 from worktoy.stringtools import stringList
 
+if TYPE_CHECKING:
+  from PySide6.QtWidgets import QWidget
+
 
 def parentParser(*args, **kwargs) -> QWidget:
   """The parentParser function parses positional and keyword arguments to
@@ -15,6 +19,7 @@ def parentParser(*args, **kwargs) -> QWidget:
   #  MIT Licence
   #  Copyright (c) 2023 Asger Jon Vistisen"""
 
+  from PySide6.QtWidgets import QWidget
   parentKeys = stringList('parent, main, mainWindow, window')
   parent, args, kwargs = extractArg(QWidget, parentKeys, *args, **kwargs)
   if isinstance(parent, QWidget):
@@ -0,0 +1,13 @@
+"""Configures the environment of the tests, such that the packages import
+without an audio device."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import sys
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(here))
+os.environ.setdefault('CHESSGPT', os.path.dirname(os.path.dirname(here)))
+os.environ.setdefault('WORKSIDE_AUDIO_BACKEND', 'null')
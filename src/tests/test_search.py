@@ -0,0 +1,33 @@
+"""Tests of the single and parallel searches on roots without legal
+moves."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from chessgpt import Search, ParallelSearch
+from chessgpt._search import MATE
+
+#  White is checkmated by the fool's mate
+matedFen = 'rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3'
+#  Black to move is stalemated
+stalemateFen = '7k/5Q2/6K1/8/8/8/8/8 b - - 0 1'
+
+
+def test_matedRoot() -> None:
+  """Both searches score a checkmated root as lost"""
+  single = Search(maxDepth=3).run(matedFen)
+  with ParallelSearch(workers=2, maxDepth=3) as search:
+    parallel = search.run(matedFen)
+  assert single.score == -MATE
+  assert parallel.score == -MATE
+  assert parallel.pv == single.pv == []
+
+
+def test_stalematedRoot() -> None:
+  """Both searches score a stalemated root as a draw"""
+  single = Search(maxDepth=3).run(stalemateFen)
+  with ParallelSearch(workers=2, maxDepth=3) as search:
+    parallel = search.run(stalemateFen)
+  assert single.score == 0
+  assert parallel.score == 0
+  assert parallel.pv == single.pv == []
@@ -1,10 +1,12 @@
 """The visualchess package shows us the chess board, the chess pieces and
-allows us to input chess moves visually."""
+allows us to input chess moves visually. The board model imports without
+Qt, while the rendering layer and the widgets depending on Qt are
+imported when first accessed."""
 #  MIT Licence
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
-from worktoy.typetools import TypeBag
+import importlib
 
 from ._chessaudio import ChessAudio
 from ._file import File
@@ -13,18 +15,41 @@ from ._chesscolor import ChessColor
 from ._piecetype import PieceType
 from ._square import Square
 from ._chesspiece import ChessPiece
+from ._boardcore import BoardCore
+from ._movegen import generateLegalMoves, encodeMove
+from ._movegen import moveToUci, moveFromUci
 # from ._chessmove import ChessMove
-from ._settings import Settings
 from ._chessboard import ChessBoard
 from ._boardstate import BoardState
+from ._perft import perft, perftDivide
 # from ._debugstate import DebugState
 # from ._regularmove import RegularMove
-from ._boardlayout import BoardLayout
-from ._piecegrabbingproperties import _PieceGrabbingProperties
-from ._piecegrabbingoperations import _PieceGrabbingOperations
-from ._piecegrabbing import PieceGrabbing
 # from ._checkbutton import CheckButton
 
-from workside.widgets import CoreWidget
+#  The names depending on Qt and the modules defining them
+_renderingNames = {
+  'Settings': '._settings',
+  'BoardGeometry': '._boardgeometry',
+  'PieceAtlas': '._pieceatlas',
+  'pieceAtlas': '._pieceatlas',
+  'PieceCursors': '._piececursors',
+  'pieceCursors': '._piececursors',
+  'PaintProfiler': '._paintprofiler',
+  'BoardLayout': '._boardlayout',
+  'BoardRenderer': '._boardrenderer',
+  'renderPositions': '._boardrenderer',
+  '_PieceGrabbingProperties': '._piecegrabbingproperties',
+  '_PieceGrabbingOperations': '._piecegrabbingoperations',
+  'PieceGrabbing': '._piecegrabbing',
+  'Widget': '._piecegrabbing',
+}
 
-Widget = TypeBag(CoreWidget, BoardLayout, PieceGrabbing)
+
+def __getattr__(name: str) -> object:
+  """Imports the names depending on Qt when first accessed"""
+  if name in _renderingNames:
+    module = importlib.import_module(_renderingNames[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+  raise AttributeError('module %s has no attribute %s' % (__name__, name))
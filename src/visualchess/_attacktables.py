@@ -0,0 +1,138 @@
+"""The attack tables are computed once at import and provide the attacked
+squares for each piece as bitboards indexed by square index. Sliding
+pieces use hyperbola quintessence on files and diagonals and a lookup
+table on ranks."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from icecream import ic
+
+ic.configureOutput(includeContext=True)
+
+fullBoard = 0xFFFFFFFFFFFFFFFF
+
+
+def _onBoard(x: int, y: int) -> bool:
+  """Checks if the file index x and rank index y are on the board"""
+  return True if -1 < x < 8 and -1 < y < 8 else False
+
+
+def _stepTable(steps: list[tuple[int, int]]) -> tuple[int, ...]:
+  """Creates a table of the squares reached by a single step in each of
+  the given directions"""
+  out = []
+  for index in range(64):
+    x, y, bitboard = index & 7, index >> 3, 0
+    for (dx, dy) in steps:
+      if _onBoard(x + dx, y + dy):
+        bitboard |= 1 << (x + dx + 8 * (y + dy))
+    out.append(bitboard)
+  return tuple(out)
+
+
+def _rayMask(index: int, steps: list[tuple[int, int]]) -> int:
+  """Creates the mask of all squares reached by sliding from index in the
+  given directions. The square itself is not included."""
+  x0, y0, bitboard = index & 7, index >> 3, 0
+  for (dx, dy) in steps:
+    x, y = x0 + dx, y0 + dy
+    while _onBoard(x, y):
+      bitboard |= 1 << (x + 8 * y)
+      x, y = x + dx, y + dy
+  return bitboard
+
+
+def _rankTable() -> tuple[tuple[int, ...], ...]:
+  """Creates the table of attacks along a single rank indexed by the file
+  of the slider and the occupancy of the rank as a byte"""
+  out = []
+  for file in range(8):
+    row = []
+    for occupancy in range(256):
+      attacks = 0
+      for step in [-1, 1]:
+        x = file + step
+        while -1 < x < 8:
+          attacks |= 1 << x
+          if occupancy & (1 << x):
+            break
+          x += step
+      row.append(attacks)
+    out.append(tuple(row))
+  return tuple(out)
+
+
+def _lineTables() -> tuple[tuple[int, ...], tuple[int, ...]]:
+  """Creates the tables of squares between two squares and of the full
+  line through two squares. Both are indexed by 64 * a + b and are empty
+  when the squares are not on a common rank, file or diagonal."""
+  directions = [(1, 0), (-1, 0), (0, 1), (0, -1),
+                (1, 1), (-1, -1), (1, -1), (-1, 1)]
+  between, line = [0] * 4096, [0] * 4096
+  for a in range(64):
+    for (dx, dy) in directions:
+      full = _rayMask(a, [(dx, dy), (-dx, -dy)]) | (1 << a)
+      x, y, passed = (a & 7) + dx, (a >> 3) + dy, 0
+      while _onBoard(x, y):
+        b = x + 8 * y
+        between[64 * a + b] = passed
+        line[64 * a + b] = full
+        passed |= 1 << b
+        x, y = x + dx, y + dy
+  return tuple(between), tuple(line)
+
+
+knightAttacks = _stepTable([(1, 2), (2, 1), (2, -1), (1, -2),
+                            (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+kingAttacks = _stepTable([(1, 0), (1, 1), (0, 1), (-1, 1),
+                          (-1, 0), (-1, -1), (0, -1), (1, -1)])
+#  Squares attacked by a pawn of the color given by the first index
+pawnAttacks = (_stepTable([(-1, 1), (1, 1)]),
+               _stepTable([(-1, -1), (1, -1)]))
+_fileMasks = tuple(_rayMask(i, [(0, 1), (0, -1)]) for i in range(64))
+_diagonalMasks = tuple(_rayMask(i, [(1, 1), (-1, -1)]) for i in range(64))
+_antiMasks = tuple(_rayMask(i, [(1, -1), (-1, 1)]) for i in range(64))
+_flippedBits = tuple(1 << (i ^ 56) for i in range(64))
+_rankAttacks = _rankTable()
+betweenSquares, lineSquares = _lineTables()
+
+
+def _lineAttacks(occupancy: int, index: int, mask: int) -> int:
+  """Hyperbola quintessence along the line given by mask. Reversing the
+  bits is done by swapping the bytes, which is valid for files and
+  diagonals, but not for ranks."""
+  forward = occupancy & mask
+  reverse = int.from_bytes(forward.to_bytes(8, 'little'), 'big')
+  forward = (forward - (1 << index)) & fullBoard
+  reverse = (reverse - _flippedBits[index]) & fullBoard
+  forward ^= int.from_bytes(reverse.to_bytes(8, 'little'), 'big')
+  return forward & mask
+
+
+def rankAttacks(index: int, occupancy: int) -> int:
+  """Returns the attacks along the rank of the square at index"""
+  shift = index & 56
+  return _rankAttacks[index & 7][(occupancy >> shift) & 255] << shift
+
+
+def fileAttacks(index: int, occupancy: int) -> int:
+  """Returns the attacks along the file of the square at index"""
+  return _lineAttacks(occupancy, index, _fileMasks[index])
+
+
+def bishopAttacks(index: int, occupancy: int) -> int:
+  """Returns the squares attacked by a bishop on the square at index"""
+  return (_lineAttacks(occupancy, index, _diagonalMasks[index])
+          | _lineAttacks(occupancy, index, _antiMasks[index]))
+
+
+def rookAttacks(index: int, occupancy: int) -> int:
+  """Returns the squares attacked by a rook on the square at index"""
+  return (_lineAttacks(occupancy, index, _fileMasks[index])
+          | rankAttacks(index, occupancy))
+
+
+def queenAttacks(index: int, occupancy: int) -> int:
+  """Returns the squares attacked by a queen on the square at index"""
+  return bishopAttacks(index, occupancy) | rookAttacks(index, occupancy)
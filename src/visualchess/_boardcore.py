@@ -0,0 +1,239 @@
+"""BoardCore stores the pieces on the board as twelve 64-bit bitboards
+together with a 64-byte mailbox."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from typing import Never, NoReturn, Iterator
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import ChessPiece, ChessColor, PieceType, Square
+from visualchess._zobrist import zobristPieces
+
+ic.configureOutput(includeContext=True)
+
+#  Piece codes are used in the mailbox and as bitboard indices. The code
+#  is the piece type value plus 6 for black, such that white pieces have
+#  codes 1 to 6 and black pieces have codes 7 to 12. Empty squares have 0.
+#  Colors are indexed with white at 0 and black at 1.
+WHITE, BLACK = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = 1, 2, 3, 4, 5, 6
+_codeFromValue = (6, 5, 4, 3, 2, 1, 0, 7, 8, 9, 10, 11, 12)
+#  The letter used in Forsyth-Edwards Notation for each piece code
+fenPieces = ' PNBRQKpnbrqk'
+codePieces = tuple(
+  ChessPiece.fromInt(-code if code < 7 else code - 6) if code else
+  ChessPiece.EMPTY for code in range(13))
+
+
+def pieceCode(piece: ChessPiece) -> int:
+  """Returns the code of the given chess piece"""
+  return _codeFromValue[piece.value + 6]
+
+
+def colorIndex(color: ChessColor) -> int:
+  """Returns the index of the given color"""
+  if color is ChessColor.WHITE:
+    return WHITE
+  if color is ChessColor.BLACK:
+    return BLACK
+  msg = """The empty color has no index!"""
+  raise ValueError(msg)
+
+
+def iterBits(bitboard: int) -> Iterator[int]:
+  """Iterates over the indices of the set bits in the bitboard from the
+  least significant bit up."""
+  while bitboard:
+    lsb = bitboard & -bitboard
+    yield lsb.bit_length() - 1
+    bitboard ^= lsb
+
+
+class BoardCore:
+  """BoardCore stores the pieces on the board as twelve 64-bit bitboards,
+  one for each piece code, together with a 64-byte mailbox holding the
+  piece code on each square. The Zobrist key of the pieces is updated
+  with every change of a square. The integer based methods operate on
+  bitboard indices and piece codes directly and are intended for move
+  generation and evaluation. The remaining methods accept instances of
+  Square and ChessPiece.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, *args, **kwargs) -> None:
+    self._bitboards = [0] * 13
+    self._colors = [0, 0]
+    self._mailbox = bytearray(64)
+    self._key = 0
+
+  def copy(self) -> BoardCore:
+    """Returns an independent copy of this instance"""
+    out = BoardCore()
+    out._bitboards = [*self._bitboards]
+    out._colors = [*self._colors]
+    out._mailbox = bytearray(self._mailbox)
+    out._key = self._key
+    return out
+
+  ########################## Integer Based Access #########################
+
+  def getCode(self, index: int) -> int:
+    """Getter-function for the piece code on the square at given index"""
+    return self._mailbox[index]
+
+  def setCode(self, index: int, code: int) -> int:
+    """Places the piece code on the square at given index. Returns the
+    piece code previously on the square."""
+    old = self._mailbox[index]
+    if old == code:
+      return old
+    bit = 1 << index
+    if old:
+      self._bitboards[old] ^= bit
+      self._colors[old > 6] ^= bit
+    if code:
+      self._bitboards[code] |= bit
+      self._colors[code > 6] |= bit
+    self._mailbox[index] = code
+    self._key ^= zobristPieces[old][index] ^ zobristPieces[code][index]
+    return old
+
+  def getBitboard(self, code: int) -> int:
+    """Getter-function for the bitboard of the given piece code"""
+    return self._bitboards[code]
+
+  def getColorBitboard(self, color: int) -> int:
+    """Getter-function for the bitboard of all pieces of given color
+    index"""
+    return self._colors[color]
+
+  def _getOccupancy(self) -> int:
+    """Getter-function for the bitboard of all occupied squares"""
+    return self._colors[0] | self._colors[1]
+
+  def _getKey(self) -> int:
+    """Getter-function for the Zobrist key of the pieces. Turn, castling
+    rights and en passant square are not included."""
+    return self._key
+
+  def _getMailbox(self) -> bytearray:
+    """Getter-function for the mailbox"""
+    return self._mailbox
+
+  def _getBitboards(self) -> list[int]:
+    """Getter-function for the list of bitboards indexed by piece code.
+    Index 0 is unused and kept empty."""
+    return self._bitboards
+
+  def _getColors(self) -> list[int]:
+    """Getter-function for the pair of color bitboards"""
+    return self._colors
+
+  ######################### Enum Based Access #############################
+
+  def getPiece(self, square: Square) -> ChessPiece:
+    """Getter-function for the piece on the given square"""
+    if not square:
+      return ChessPiece.EMPTY
+    return codePieces[self._mailbox[square.index]]
+
+  def setPiece(self, square: Square, piece: ChessPiece) -> ChessPiece:
+    """Setter-function for the piece on the given square. Returns the
+    piece previously on the square. Setting a piece on the NULL square
+    has no effect."""
+    if not square:
+      return ChessPiece.EMPTY
+    return codePieces[self.setCode(square.index, pieceCode(piece))]
+
+  def delPiece(self, square: Square) -> ChessPiece:
+    """Deleter-function for the given square. Returns the piece removed"""
+    if not square:
+      return ChessPiece.EMPTY
+    return codePieces[self.setCode(square.index, 0)]
+
+  def clear(self) -> NoReturn:
+    """Removes all pieces"""
+    self._bitboards = [0] * 13
+    self._colors = [0, 0]
+    self._mailbox = bytearray(64)
+    self._key = 0
+
+  def setPlacement(self, placement: str) -> NoReturn:
+    """Replaces the pieces with those given by the piece placement field
+    of Forsyth-Edwards Notation. Raises ValueError on invalid input, in
+    which case the contents are undefined."""
+    rows = placement.split('/')
+    if len(rows) != 8:
+      raise ValueError('Expected 8 ranks in FEN, but received: %s' % (
+        placement))
+    self.clear()
+    for (rank, row) in enumerate(reversed(rows)):
+      file = 0
+      for char in row:
+        if char.isdigit():
+          file += int(char)
+        elif char in fenPieces and char != ' ' and file < 8:
+          self.setCode(8 * rank + file, fenPieces.index(char))
+          file += 1
+        else:
+          raise ValueError('Invalid FEN placement: %s' % placement)
+      if file != 8:
+        raise ValueError('Invalid FEN placement: %s' % placement)
+
+  def colorOccupancy(self, color: ChessColor) -> int:
+    """Returns the bitboard of squares occupied by the given color"""
+    return self._colors[colorIndex(color)]
+
+  def pieceOccupancy(self, piece: ChessPiece) -> int:
+    """Returns the bitboard of squares occupied by the given piece"""
+    return self._bitboards[pieceCode(piece)]
+
+  def typeOccupancy(self, pieceType: PieceType) -> int:
+    """Returns the bitboard of squares occupied by the given piece type
+    of either color"""
+    value = pieceType.value
+    if not value:
+      return ~self._getOccupancy() & 0xFFFFFFFFFFFFFFFF
+    return self._bitboards[value] | self._bitboards[value + 6]
+
+  def getSquares(self, bitboard: int) -> list[Square]:
+    """Returns the squares set in the given bitboard"""
+    return [Square.fromIndex(index) for index in iterBits(bitboard)]
+
+  def __getitem__(self, square: Square) -> ChessPiece:
+    """Returns the piece at given square"""
+    return self.getPiece(square)
+
+  def __setitem__(self, square: Square, piece: ChessPiece) -> NoReturn:
+    """Places given piece and given square"""
+    self.setPiece(square, piece)
+
+  def __delitem__(self, square: Square) -> NoReturn:
+    """Places the EMPTY piece on the given square"""
+    self.delPiece(square)
+
+  def keys(self) -> list[Square]:
+    """Implementation of keys method"""
+    return [Square.fromIndex(index) for index in range(64)]
+
+  def values(self) -> list[ChessPiece]:
+    """Implementation of values method"""
+    return [codePieces[code] for code in self._mailbox]
+
+  def items(self) -> list[tuple[Square, ChessPiece]]:
+    """Implementation of items method"""
+    return [(Square.fromIndex(index), codePieces[code])
+            for (index, code) in enumerate(self._mailbox)]
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  occupancy = property(_getOccupancy, _noAcc, _noAcc)
+  key = property(_getKey, _noAcc, _noAcc)
+  mailbox = property(_getMailbox, _noAcc, _noAcc)
+  bitboards = property(_getBitboards, _noAcc, _noAcc)
+  colors = property(_getColors, _noAcc, _noAcc)
@@ -0,0 +1,173 @@
+"""BoardGeometry holds the rectangles making up the chessboard for a given
+viewport. It is computed once when the widget is resized and is shared by
+painting and by hit testing."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from typing import Never
+
+from PySide6.QtCore import QPointF, QRectF, QSizeF
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import Square, Settings
+
+ic.configureOutput(includeContext=True)
+
+
+class BoardGeometry:
+  """BoardGeometry holds the rectangles making up the chessboard for a
+  given viewport: the outer and inner squares, the board rectangle, the
+  full rectangle of each of the 64 squares indexed by bitboard index, the
+  label rectangles and the gap adjusted rectangles of the light and dark
+  squares. Instances should be treated as immutable and replaced when
+  the viewport changes.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, viewPort: QRectF, devicePixelRatio: float = None,
+               *args, **kwargs) -> None:
+    self._viewPort = QRectF(viewPort)
+    self._devicePixelRatio = 1. if devicePixelRatio is None else float(
+      devicePixelRatio)
+    self._center = self._viewPort.center()
+    self._sideLength = min(self._viewPort.width(), self._viewPort.height())
+    self._outerSquare = self._createSquare(self._sideLength)
+    innerSide = self._sideLength * float((1 - 2 * Settings.bezelRatio))
+    self._innerSquare = self._createSquare(innerSide)
+    boardSide = innerSide - 2 * Settings.boardOutline
+    self._boardRect = self._createSquare(boardSide)
+    self._squareStep = boardSide / 8
+    self._squareRects = [square @ self._boardRect
+                         for square in map(Square.fromIndex, range(64))]
+    self._labelRects = self._createLabelRects()
+    self._lightSquares, self._darkSquares = self._createColorSquares()
+
+  def _createSquare(self, side: float) -> QRectF:
+    """Creates the square of given side length centered on the viewport"""
+    rect = QRectF(Settings.origin, QSizeF(side, side))
+    rect.moveCenter(self._center)
+    return rect
+
+  def _createLabelRects(self) -> dict[str, list[QRectF]]:
+    """Creates the bounding rectangles of the labels"""
+    border = Settings.bezelRatio * self._sideLength
+    boardRect, step = self._boardRect, self._squareStep
+    fileSize, rankSize = QSizeF(step, border), QSizeF(border, step)
+    upperTop = boardRect.top() - border
+    lowerTop = boardRect.bottom()
+    left0, top0 = boardRect.left(), boardRect.top()
+    topRects = [QRectF(QPointF(
+      left0 + step * i, upperTop), fileSize) for i in range(8)]
+    bottomRects = [QRectF(QPointF(
+      left0 + step * i, lowerTop), fileSize) for i in range(8)]
+    leftLeft = boardRect.left() - border
+    rightLeft = boardRect.right()
+    leftRects = [QRectF(QPointF(
+      leftLeft, top0 + step * i), rankSize) for i in range(8)]
+    rightRects = [QRectF(QPointF(
+      rightLeft, top0 + step * i), rankSize) for i in range(8)]
+    return dict(left=leftRects,
+                top=topRects,
+                right=rightRects,
+                bottom=bottomRects)
+
+  def _createColorSquares(self) -> tuple[list[QRectF], list[QRectF]]:
+    """Creates the square rectangles shrunk by the gap between squares
+    split according to square color"""
+    light, dark, gap = [], [], Settings.squareGap
+    for i in range(8):
+      for j in range(8):
+        base = self._squareRects[Square.fromInts(i, j).index]
+        center, size = base.center(), base.size()
+        newSize = QSizeF(size.width() - gap / 2, size.height() - gap / 2)
+        newRect = QRectF(Settings.origin, newSize)
+        newRect.moveCenter(center)
+        if i % 2 == j % 2:
+          light.append(newRect)
+        else:
+          dark.append(newRect)
+    return light, dark
+
+  def squareAt(self, point: QPointF) -> Square:
+    """Finds the square containing the given point. Points outside the
+    board give the NULL square."""
+    boardRect = self._boardRect
+    if not boardRect.contains(point):
+      return Square.NULL
+    col = int((point.x() - boardRect.left()) / boardRect.width() * 8)
+    row = int((point.y() - boardRect.top()) / boardRect.height() * 8)
+    if col > 7 or row > 7:
+      return Square.NULL
+    return Square.fromIndex((7 - row) * 8 + col)
+
+  def getSquareRect(self, square: Square) -> QRectF:
+    """Getter-function for the full rectangle of the given square"""
+    return self._squareRects[square.index]
+
+  def _getViewPort(self) -> QRectF:
+    """Getter-function for the viewport"""
+    return self._viewPort
+
+  def _getDevicePixelRatio(self) -> float:
+    """Getter-function for the device pixel ratio"""
+    return self._devicePixelRatio
+
+  def _getCenter(self) -> QPointF:
+    """Getter-function for the center of the viewport"""
+    return self._center
+
+  def _getSideLength(self) -> float:
+    """Getter-function for the shortest dimension of the viewport"""
+    return self._sideLength
+
+  def _getOuterSquare(self) -> QRectF:
+    """Getter-function for the largest square fitting in the viewport"""
+    return self._outerSquare
+
+  def _getInnerSquare(self) -> QRectF:
+    """Getter-function for the chessboard including the outline"""
+    return self._innerSquare
+
+  def _getBoardRect(self) -> QRectF:
+    """Getter-function for the square exactly containing the board"""
+    return self._boardRect
+
+  def _getSquareStep(self) -> float:
+    """Getter-function for the distance between squares"""
+    return self._squareStep
+
+  def _getSquareRects(self) -> list[QRectF]:
+    """Getter-function for the rectangles of the squares indexed by
+    bitboard index"""
+    return self._squareRects
+
+  def _getLabelRects(self) -> dict[str, list[QRectF]]:
+    """Getter-function for the label rectangles"""
+    return self._labelRects
+
+  def _getLightSquares(self) -> list[QRectF]:
+    """Getter-function for the gap adjusted light squares"""
+    return self._lightSquares
+
+  def _getDarkSquares(self) -> list[QRectF]:
+    """Getter-function for the gap adjusted dark squares"""
+    return self._darkSquares
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  viewPort = property(_getViewPort, _noAcc, _noAcc)
+  devicePixelRatio = property(_getDevicePixelRatio, _noAcc, _noAcc)
+  center = property(_getCenter, _noAcc, _noAcc)
+  sideLength = property(_getSideLength, _noAcc, _noAcc)
+  outerSquare = property(_getOuterSquare, _noAcc, _noAcc)
+  innerSquare = property(_getInnerSquare, _noAcc, _noAcc)
+  boardRect = property(_getBoardRect, _noAcc, _noAcc)
+  squareStep = property(_getSquareStep, _noAcc, _noAcc)
+  squareRects = property(_getSquareRects, _noAcc, _noAcc)
+  labelRects = property(_getLabelRects, _noAcc, _noAcc)
+  lightSquares = property(_getLightSquares, _noAcc, _noAcc)
+  darkSquares = property(_getDarkSquares, _noAcc, _noAcc)
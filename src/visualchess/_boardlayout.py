@@ -4,18 +4,18 @@ logic."""
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
-import string
 from typing import NoReturn
 
-from PySide6.QtCore import Qt, QPointF, QRectF, QSizeF
-from PySide6.QtGui import QPaintEvent, QPainter
+from PySide6.QtCore import QPointF, QRectF, QTimer
+from PySide6.QtGui import QPaintEvent, QPainter, QPixmap, QColor
+from PySide6.QtGui import QResizeEvent, QRegion, QShowEvent
 from icecream import ic
 
-from visualchess import Square, ChessPiece, Settings
-from workside.styles import darkSquareStyle, lightSquareStyle, gridStyle
-from workside.styles import outlineStyle, labelStyle, backgroundStyle
-from workside.styles import bezelStyle
-
+from visualchess import Square, ChessPiece, Settings, BoardGeometry
+from visualchess import PaintProfiler
+from visualchess._boardpainting import paintStaticBoard
+from visualchess._piececursors import pieceCursors
+from workside.styles import styleRegistry
 from workside.widgets import CoreWidget
 
 ic.configureOutput(includeContext=True)
@@ -24,31 +24,52 @@ ic.configureOutput(includeContext=True)
 class BoardLayout(CoreWidget):
   """This class provides the size relating functions and settings."""
 
+  def __init__(self, *args, **kwargs) -> None:
+    CoreWidget.__init__(self, *args, **kwargs)
+    self._geometry = None
+    self._cursorKey = None
+    self._staticLayer = None
+    self._staticLayerKey = None
+    self._profiler = None
+    self._overlayTimer = None
+    self._overlayPending = False
+
   ###################### Instance Setters for Cursor ######################
 
+  def applyCursor(self, key: object, cursor: object) -> NoReturn:
+    """Sets the cursor on the widget unless the cursor identified by the
+    key is already set"""
+    if key != self._cursorKey:
+      self._cursorKey = key
+      self.setCursor(cursor)
+
   def setNormalCursor(self) -> NoReturn:
     """Sets the cursor on the widget to normal shape"""
-    self.setCursor(Settings.normalCursor)
+    self.applyCursor(Settings.normalCursor, Settings.normalCursor)
 
   def setHoverCursor(self, ) -> NoReturn:
     """Sets the cursor on the widget to hover shape. This should be an
     open hand to indicate the availability to grab the item being hovered."""
-    self.setCursor(Settings.hoverCursor)
+    self.applyCursor(Settings.hoverCursor, Settings.hoverCursor)
 
   def setGrabCursor(self, ) -> NoReturn:
     """Sets the cursor on the widget to grabbing shape. This should be
     indicated on top of the chess piece being grabbed if possible rather
     than invoking this function."""
-    self.setCursor(Settings.grabCursor)
+    self.applyCursor(Settings.grabCursor, Settings.grabCursor)
 
   def setForbiddenCursor(self, ) -> NoReturn:
     """Sets the cursor on the widget to indicate that an action is
     forbidden."""
-    self.setCursor(Settings.forbiddenCursor)
+    self.applyCursor(Settings.forbiddenCursor, Settings.forbiddenCursor)
 
   def setPieceCursor(self, piece: ChessPiece) -> NoReturn:
-    """Sets the cursor on the widget to grab the given piece."""
-    self.setCursor(piece.getCursor())
+    """Sets the cursor on the widget to grab the given piece. The cursor
+    is scaled to the current square size."""
+    geometry = self.getGeometry()
+    pieceCursors.prepare(geometry.squareStep, geometry.devicePixelRatio)
+    key = (piece.value, pieceCursors.cellSize)
+    self.applyCursor(key, pieceCursors.getCursor(piece))
 
   ################### END OF Instance Setters for Cursor ##################
   #########################################################################
@@ -57,118 +78,235 @@ class BoardLayout(CoreWidget):
     out = self.visibleRegion().boundingRect().toRectF()
     return out
 
+  ############################ Board Geometry #############################
+
+  def invalidateGeometry(self) -> NoReturn:
+    """Discards the board geometry such that it is computed again when
+    next needed. This happens on resize and show and must be called if
+    the layout settings change."""
+    self._geometry = None
+    self.invalidateStaticLayer()
+
+  def getGeometry(self) -> BoardGeometry:
+    """Getter-function for the board geometry. The geometry is computed
+    from the viewport once and is then reused until the widget is resized
+    or the device pixel ratio changes. The piece cursors are prepared for
+    each new geometry."""
+    ratio = self.devicePixelRatioF()
+    if self._geometry is None or self._geometry.devicePixelRatio != ratio:
+      self._geometry = BoardGeometry(self.getViewPort(), ratio)
+      pieceCursors.prepare(self._geometry.squareStep, ratio)
+    return self._geometry
+
   def getCenter(self) -> QPointF:
     """Getter-function for the global center"""
-    return self.getViewPort().center()
+    return self.getGeometry().center
 
   def getSideLength(self) -> float:
     """Getter-function for the length of the shortest dimension in the
     viewport."""
-    out = min(self.getViewPort().width(), self.getViewPort().height())
-    return out
+    return self.getGeometry().sideLength
 
   def getOuterSquare(self) -> QRectF:
     """This method returns the largest square that would fit in the
     viewport having same center as the viewport"""
-    size = QSizeF(self.getSideLength(), self.getSideLength())
-    rect = QRectF(Settings.origin, size)
-    rect.moveCenter(self.getCenter())
-    return rect
+    return QRectF(self.getGeometry().outerSquare)
 
   def getInnerSquare(self) -> QRectF:
     """The chessboard including and outline. Use only for painting and not
     for logic."""
-    side = self.getSideLength() * float((1 - 2 * Settings.bezelRatio))
-    rect = QRectF(Settings.origin, QSizeF(side, side))
-    rect.moveCenter(self.getCenter())
-    return rect
+    return QRectF(self.getGeometry().innerSquare)
 
   def getBoardRect(self) -> QRectF:
     """Getter-function for the square that exactly contains the
     chessboard."""
-    inner = self.getInnerSquare()
-    side = inner.width() / 2 + inner.height() / 2 - 2 * Settings.boardOutline
-    rect = QRectF(Settings.origin, QSizeF(side, side))
-    rect.moveCenter(self.getCenter())
-    return rect
+    return QRectF(self.getGeometry().boardRect)
 
   def getSquareStep(self) -> float:
     """Getter-function for the distance between squares. This is not the
     full size of the squares as gridlines must be provided for"""
-    boardRect = self.getBoardRect()
-    return boardRect.height() / 16 + boardRect.width() / 16
+    return self.getGeometry().squareStep
+
+  def getSquareRect(self, square: Square) -> QRectF:
+    """Getter-function for the full rectangle of the given square"""
+    return self.getGeometry().getSquareRect(square)
+
+  def getSquareAt(self, point: QPointF) -> Square:
+    """Getter-function for the square at the given point or NULL if the
+    point is outside the board"""
+    return self.getGeometry().squareAt(point)
 
   def getLabelRects(self) -> dict[str, list[QRectF]]:
     """Getter-function for the bounding rectangles on the labels"""
-    border = Settings.bezelRatio * self.getSideLength()
-    boardRect, step = self.getBoardRect(), self.getSquareStep()
-    fileSize, rankSize = QSizeF(step, border), QSizeF(border, step)
-    upperTop = boardRect.top() - border
-    lowerTop = boardRect.bottom()
-    left0, top0 = boardRect.left(), boardRect.top()
-    topRects = [QRectF(QPointF(
-      left0 + step * i, upperTop), fileSize) for i in range(8)]
-    bottomRects = [QRectF(QPointF(
-      left0 + step * i, lowerTop), fileSize) for i in range(8)]
-    leftLeft = boardRect.left() - border
-    rightLeft = boardRect.right()
-    leftRects = [QRectF(QPointF(
-      leftLeft, top0 + step * i), rankSize) for i in range(8)]
-    rightRects = [QRectF(QPointF(
-      rightLeft, top0 + step * i), rankSize) for i in range(8)]
-    return dict(left=leftRects,
-                top=topRects,
-                right=rightRects,
-                bottom=bottomRects)
+    return self.getGeometry().labelRects
 
   def getSquares(self) -> dict[str, list[QRectF]]:
     """Getter-function for all squares split according to square color"""
-    light, dark, gap = [], [], Settings.squareGap
-    for i in range(8):
-      for j in range(8):
-        square = Square.fromInts(i, j)
-        base = square @ self.getBoardRect()
-        if isinstance(base, QRectF):
-          center, size = base.center(), base.size()
-          newSize = QSizeF(size.width() - gap / 2, size.height() - gap / 2)
-          newRect = QRectF(Settings.origin, newSize)
-          newRect.moveCenter(center)
-          if i % 2 == j % 2:
-            light.append(newRect)
-          else:
-            dark.append(newRect)
-    return dict(light=light, dark=dark)
+    geometry = self.getGeometry()
+    return dict(light=geometry.lightSquares, dark=geometry.darkSquares)
+
+  ########################### Dirty Rectangles ############################
+
+  def getSquareRegion(self, *squares: Square) -> QRegion:
+    """Getter-function for the region covered by the given squares. Each
+    rectangle is widened by a margin covering the pen of the hover
+    highlight. The NULL square is ignored."""
+    geometry, margin = self.getGeometry(), Settings.squareMargin
+    region = QRegion()
+    for square in squares:
+      if isinstance(square, Square) and square:
+        rect = geometry.getSquareRect(square)
+        rect = rect.adjusted(-margin, -margin, margin, margin)
+        region = region.united(rect.toAlignedRect())
+    return region
+
+  def updateSquares(self, *squares: Square) -> NoReturn:
+    """Schedules a repaint of the given squares only"""
+    region = self.getSquareRegion(*squares)
+    if not region.isEmpty():
+      self.update(region)
+
+  ############################ Paint Profiling ############################
+
+  def getProfiler(self) -> PaintProfiler:
+    """Getter-function for the paint profiler. This is None unless
+    profiling has been enabled."""
+    return self._profiler
+
+  def enableProfiling(self, overlay: bool = False) -> PaintProfiler:
+    """Starts recording paints in a new profiler which is returned. The
+    static layer is rendered again such that it is included."""
+    self._profiler = PaintProfiler()
+    self.invalidateStaticLayer()
+    if overlay:
+      self.toggleProfilingOverlay()
+    self.update()
+    return self._profiler
+
+  def disableProfiling(self) -> NoReturn:
+    """Stops recording paints and hides the overlay"""
+    if self._overlayTimer is not None:
+      self._overlayTimer.stop()
+    self._profiler = None
+    self.update()
+
+  def toggleProfilingOverlay(self) -> NoReturn:
+    """Shows or hides the profiling overlay, enabling profiling first if
+    necessary. While shown, the overlay is refreshed twice per second."""
+    if self._profiler is None:
+      self.enableProfiling()
+    if self._overlayTimer is None:
+      self._overlayTimer = QTimer(self)
+      self._overlayTimer.timeout.connect(self.updateProfilingOverlay)
+    if self._profiler.toggleOverlay():
+      self._overlayTimer.start(Settings.overlayInterval)
+    else:
+      self._overlayTimer.stop()
+    self.update()
+
+  def updateProfilingOverlay(self) -> NoReturn:
+    """Schedules a repaint of the profiling overlay. The paint is marked
+    as refreshing only the overlay, unless other updates are merged into
+    it."""
+    if self._profiler is not None:
+      viewPort = self.getGeometry().viewPort
+      self._overlayPending = True
+      self.update(self._profiler.getOverlayRect(viewPort).toAlignedRect())
+
+  def markInput(self) -> NoReturn:
+    """Records an input event with the profiler, if enabled, such that
+    the latency until the next paint is measured"""
+    if self._profiler is not None:
+      self._profiler.markInput()
+
+  def clearInput(self) -> NoReturn:
+    """Forgets the input event recorded with the profiler, if enabled, for
+    input events that schedule no paint"""
+    if self._profiler is not None:
+      self._profiler.clearInput()
+
+  ########################## Static Board Layer ###########################
+
+  def invalidateStaticLayer(self) -> NoReturn:
+    """Discards the static layer such that it is rendered again on the
+    next paint. Changes made through BaseStyle.setValue are detected
+    without it."""
+    self._staticLayer = None
+    self._staticLayerKey = None
+
+  def _getStaticLayerKey(self) -> tuple:
+    """Getter-function for the key identifying the static layer. It
+    changes with the size of the widget, with the board geometry and
+    whenever the data of a style changes."""
+    return (self.width(), self.height(), self.getGeometry(),
+            styleRegistry.generation)
+
+  def _createStaticLayer(self) -> NoReturn:
+    """Renders the static elements of the chessboard into an offscreen
+    pixmap at the device pixel ratio of the widget"""
+    ratio = self.devicePixelRatioF()
+    layer = QPixmap(max(int(self.width() * ratio), 1),
+                    max(int(self.height() * ratio), 1))
+    layer.setDevicePixelRatio(ratio)
+    layer.fill(QColor(0, 0, 0, 0))
+    painter = QPainter()
+    painter.begin(layer)
+    self.paintStaticLayer(painter)
+    painter.end()
+    self._staticLayer = layer
+
+  def getStaticLayer(self) -> QPixmap:
+    """Getter-function for the static layer. The layer is rendered again
+    only when its key has changed or after invalidateStaticLayer."""
+    key = self._getStaticLayerKey()
+    if self._staticLayer is None or key != self._staticLayerKey:
+      self._createStaticLayer()
+      self._staticLayerKey = key
+    return self._staticLayer
+
+  def resizeEvent(self, event: QResizeEvent) -> NoReturn:
+    """Implementation of resize event discarding the board geometry and
+    the static layer"""
+    self.invalidateGeometry()
+    CoreWidget.resizeEvent(self, event)
+
+  def showEvent(self, event: QShowEvent) -> NoReturn:
+    """Implementation of show event discarding the board geometry, as the
+    visible region is empty until the widget is shown"""
+    self.invalidateGeometry()
+    CoreWidget.showEvent(self, event)
 
   def paintEvent(self, event: QPaintEvent) -> NoReturn:
     """The BoardLayout subclass draws the static elements of the
-    chessboard"""
+    chessboard by copying the static layer. Subclasses paint on top of it
+    in paintForeground. If profiling is enabled, the paint is recorded
+    and the overlay painted last. Paints requested by the overlay timer
+    covering nothing but the overlay are not recorded."""
+    profiler = self._profiler
+    overlayOnly, self._overlayPending = self._overlayPending, False
+    if profiler is not None:
+      profiler.beginPaint()
     painter = QPainter()
     painter.begin(self)
-    guessViewPort = self.getViewPort()
-    backgroundStyle @ painter
-    r = Settings.cornerRadius
-    painter.drawRoundedRect(guessViewPort, r, r)
-    bezelStyle @ painter
-    painter.drawRoundedRect(self.getOuterSquare(), r, r)
-    labelStyle @ painter
-    textFlag = Qt.AlignmentFlag.AlignCenter
-    files = [char for char in string.ascii_uppercase[:8]]
-    ranks = reversed(['%d' % i for i in range(1, 9)])
-    labels = self.getLabelRects()
-    for (file, top, bottom) in zip(files, labels['top'], labels['bottom']):
-      painter.drawText(top, textFlag, file)
-      painter.drawText(bottom, textFlag, file)
-    for (rank, left, right) in zip(ranks, labels['left'], labels['right']):
-      painter.drawText(left, textFlag, rank)
-      painter.drawText(right, textFlag, rank)
-    gridStyle @ painter
-    painter.drawRect(self.getBoardRect())
-    darkSquareStyle @ painter
-    lightDark = self.getSquares()
-    painter.drawRects(lightDark['dark'])
-    lightSquareStyle @ painter
-    painter.drawRects(lightDark['light'])
-    outlineStyle @ painter
-    painter.drawRect(self.getInnerSquare())
-
+    painter.drawPixmap(0, 0, self.getStaticLayer())
+    if profiler is not None:
+      profiler.lap('board')
+    self.paintForeground(painter, event)
+    if profiler is not None:
+      viewPort = self.getGeometry().viewPort
+      overlayRect = profiler.getOverlayRect(viewPort).toAlignedRect()
+      overlayOnly = overlayOnly and overlayRect.contains(event.rect())
+      profiler.endPaint(overlayOnly)
+      if profiler.overlayVisible:
+        profiler.paintOverlay(painter, viewPort)
     painter.end()
+
+  def paintForeground(self, painter: QPainter,
+                      event: QPaintEvent) -> NoReturn:
+    """Paints on top of the static layer. The BoardLayout class paints
+    nothing here."""
+
+  def paintStaticLayer(self, painter: QPainter) -> NoReturn:
+    """Paints the static elements of the chessboard: the background, the
+    bezel, the labels, the grid, the squares and the outline."""
+    paintStaticBoard(painter, self.getGeometry(), self._profiler)
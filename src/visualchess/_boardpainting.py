@@ -0,0 +1,103 @@
+"""The board painting functions draw the chessboard and the pieces on any
+QPainter given the board geometry. They are shared by the widgets and by
+the offscreen renderer."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import string
+from typing import NoReturn, TYPE_CHECKING
+
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QPainter, QRegion, QStaticText, QFont, QTransform
+from icecream import ic
+
+from visualchess import Settings, BoardGeometry, BoardCore, pieceAtlas
+from visualchess._boardcore import codePieces
+from workside.styles import darkSquareStyle, lightSquareStyle, gridStyle
+from workside.styles import outlineStyle, labelStyle, backgroundStyle
+from workside.styles import bezelStyle, styleRegistry
+
+if TYPE_CHECKING:
+  from visualchess import PaintProfiler
+
+ic.configureOutput(includeContext=True)
+
+#  The labels laid out in the most recently used font
+_staticLabels = {}
+_staticLabelsKey = None
+
+
+def getStaticLabels(font: QFont) -> dict[str, QStaticText]:
+  """Returns the file and rank labels laid out in the given font. The
+  layout is done again only when the font or the style data changes."""
+  global _staticLabels, _staticLabelsKey
+  key = (font.key(), styleRegistry.generation)
+  if key != _staticLabelsKey:
+    _staticLabels = {}
+    for text in '%s12345678' % string.ascii_uppercase[:8]:
+      staticText = QStaticText(text)
+      staticText.setTextFormat(Qt.TextFormat.PlainText)
+      staticText.prepare(QTransform(), font)
+      _staticLabels[text] = staticText
+    _staticLabelsKey = key
+  return _staticLabels
+
+
+def _drawCentered(painter: QPainter, rect: QRectF,
+                  staticText: QStaticText) -> NoReturn:
+  """Draws the static text centered in the rectangle"""
+  size = staticText.size()
+  point = rect.center() - QPointF(size.width() / 2, size.height() / 2)
+  painter.drawStaticText(point, staticText)
+
+
+def paintStaticBoard(painter: QPainter, geometry: BoardGeometry,
+                     profiler: PaintProfiler = None) -> NoReturn:
+  """Paints the static elements of the chessboard: the background, the
+  bezel, the labels, the grid, the squares and the outline. If a
+  profiler is given, the time spent is recorded in the background,
+  labels and squares layers."""
+  backgroundStyle @ painter
+  r = Settings.cornerRadius
+  painter.drawRoundedRect(geometry.viewPort, r, r)
+  bezelStyle @ painter
+  painter.drawRoundedRect(geometry.outerSquare, r, r)
+  if profiler is not None:
+    profiler.lap('background')
+  labelStyle @ painter
+  staticLabels = getStaticLabels(painter.font())
+  files = [char for char in string.ascii_uppercase[:8]]
+  ranks = reversed(['%d' % i for i in range(1, 9)])
+  labels = geometry.labelRects
+  for (file, top, bottom) in zip(files, labels['top'], labels['bottom']):
+    _drawCentered(painter, top, staticLabels[file])
+    _drawCentered(painter, bottom, staticLabels[file])
+  for (rank, left, right) in zip(ranks, labels['left'], labels['right']):
+    _drawCentered(painter, left, staticLabels[rank])
+    _drawCentered(painter, right, staticLabels[rank])
+  if profiler is not None:
+    profiler.lap('labels')
+  gridStyle @ painter
+  painter.drawRect(geometry.boardRect)
+  darkSquareStyle @ painter
+  painter.drawRects(geometry.darkSquares)
+  lightSquareStyle @ painter
+  painter.drawRects(geometry.lightSquares)
+  outlineStyle @ painter
+  painter.drawRect(geometry.innerSquare)
+  if profiler is not None:
+    profiler.lap('squares')
+
+
+def paintPieces(painter: QPainter, geometry: BoardGeometry, core: BoardCore,
+                region: QRegion = None) -> NoReturn:
+  """Paints the pieces in the core from the piece atlas. If a region is
+  given, pieces outside it are skipped."""
+  pieceAtlas.prepare(geometry.squareStep, geometry.devicePixelRatio)
+  squareRects = geometry.squareRects
+  for (index, code) in enumerate(core.mailbox):
+    if code:
+      target = squareRects[index]
+      if region is None or region.intersects(target.toAlignedRect()):
+        pieceAtlas.drawPiece(painter, target, codePieces[code])
@@ -0,0 +1,150 @@
+"""BoardRenderer draws positions given in Forsyth-Edwards Notation into
+images without showing a window. It uses the same painting code and
+styles as the board widgets and runs on the offscreen platform of Qt.
+The renderPositions function writes a stream of positions to PNG files
+through a pool of worker processes."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Never, Iterable
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QColor
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import BoardCore, BoardGeometry
+from visualchess._boardpainting import paintStaticBoard, paintPieces
+
+ic.configureOutput(includeContext=True)
+
+#  The renderer of each worker process
+_workerRenderer = None
+
+
+def _ensureApplication() -> QGuiApplication:
+  """Returns the running application or creates one on the offscreen
+  platform unless another platform is set in QT_QPA_PLATFORM"""
+  app = QGuiApplication.instance()
+  if app is None:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QGuiApplication([])
+  return app
+
+
+def _initRenderer(size: int, devicePixelRatio: float) -> None:
+  """Initializer creating the renderer of a worker process"""
+  global _workerRenderer
+  _workerRenderer = BoardRenderer(size, devicePixelRatio)
+
+
+def _renderFile(fen: str, filePath: str) -> bool:
+  """Renders the position to the file in a worker process"""
+  return _workerRenderer.save(fen, filePath)
+
+
+class BoardRenderer:
+  """BoardRenderer draws positions into images of the given size in
+  logical pixels at the given device pixel ratio. The static elements of
+  the board are painted once into an image which is then copied for each
+  position before the pieces are painted on top.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, size: int = 256, devicePixelRatio: float = 1.,
+               *args, **kwargs) -> None:
+    self._app = _ensureApplication()
+    self._size = size
+    self._devicePixelRatio = devicePixelRatio
+    self._geometry = BoardGeometry(QRectF(0, 0, size, size),
+                                   devicePixelRatio)
+    self._core = BoardCore()
+    self._staticImage = self._createImage()
+    painter = QPainter()
+    painter.begin(self._staticImage)
+    paintStaticBoard(painter, self._geometry)
+    painter.end()
+
+  def _createImage(self) -> QImage:
+    """Creates a transparent image at the device pixel ratio"""
+    side = max(int(self._size * self._devicePixelRatio), 1)
+    image = QImage(side, side, QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(self._devicePixelRatio)
+    image.fill(QColor(0, 0, 0, 0))
+    return image
+
+  def render(self, fen: str) -> QImage:
+    """Renders the position given in Forsyth-Edwards Notation. Only the
+    piece placement field is used."""
+    self._core.setPlacement(fen.split()[0])
+    image = self._staticImage.copy()
+    painter = QPainter()
+    painter.begin(image)
+    paintPieces(painter, self._geometry, self._core)
+    painter.end()
+    return image
+
+  def save(self, fen: str, filePath: str) -> bool:
+    """Renders the position and saves it to the file. The format follows
+    the file extension. Returns True on success."""
+    return self.render(fen).save(filePath)
+
+  def _getSize(self) -> int:
+    """Getter-function for the side length in logical pixels"""
+    return self._size
+
+  def _getDevicePixelRatio(self) -> float:
+    """Getter-function for the device pixel ratio"""
+    return self._devicePixelRatio
+
+  def _getGeometry(self) -> BoardGeometry:
+    """Getter-function for the board geometry"""
+    return self._geometry
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  size = property(_getSize, _noAcc, _noAcc)
+  devicePixelRatio = property(_getDevicePixelRatio, _noAcc, _noAcc)
+  geometry = property(_getGeometry, _noAcc, _noAcc)
+
+
+def renderPositions(fens: Iterable[str], directory: str, size: int = 256,
+                    devicePixelRatio: float = 1., workers: int = None,
+                    report: bool = True) -> list[str]:
+  """Renders each position to a PNG file in the directory, numbered in
+  the order received, and returns the file paths. The positions are
+  shared between worker processes, each with its own renderer. The
+  number of workers defaults to the number of cores, and with a single
+  worker the positions are rendered in this process. If report is True,
+  the images per second are printed."""
+  workers = workers or os.cpu_count() or 1
+  os.makedirs(directory, exist_ok=True)
+  fens = [fen.strip() for fen in fens if fen.strip()]
+  paths = [os.path.join(directory, '%06d.png' % index)
+           for index in range(len(fens))]
+  tic = time.perf_counter()
+  if workers == 1:
+    renderer = BoardRenderer(size, devicePixelRatio)
+    results = [renderer.save(fen, path) for (fen, path) in zip(fens, paths)]
+  else:
+    context = multiprocessing.get_context()
+    with ProcessPoolExecutor(workers, context, _initRenderer,
+                             (size, devicePixelRatio)) as pool:
+      chunk = max(len(fens) // (4 * workers), 1)
+      results = [*pool.map(_renderFile, fens, paths, chunksize=chunk)]
+  seconds = time.perf_counter() - tic
+  if not all(results):
+    failed = [path for (path, ok) in zip(paths, results) if not ok]
+    raise OSError('Unable to write images: %s' % ', '.join(failed))
+  if report:
+    print('%d images of %dpx with %d workers in %.3f seconds: %.1f '
+          'images per second' % (len(paths), size, workers, seconds,
+                                 len(paths) / max(seconds, 1e-9)))
+  return paths
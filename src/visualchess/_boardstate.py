@@ -3,25 +3,27 @@
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
-import os
 from typing import NoReturn
 
-from PySide6.QtCore import QRect, QRectF
-from chess import Move, parse_square
+from chess import Move, QUEEN as CHESS_QUEEN
 from icecream import ic
 from worktoy.core import maybe
 from worktoy.parsing import maybeType
 from worktoy.stringtools import stringList
-from worktoy.typetools import TypeBag
 from worktoy.waitaminute import UnexpectedStateError
 
 from visualchess import ChessPiece, Square, ChessColor, Rank, File
+from visualchess import PieceType
+from visualchess import generateLegalMoves, encodeMove
+from visualchess._boardcore import PAWN, KING, codePieces, fenPieces
 from visualchess._boardstateproperties import _BoardStateProperties
+from visualchess._movegen import ALL_CASTLING, castlingMasks
+from visualchess._movejournal import SquareChange, JournalEntry
+from visualchess._zobrist import zobristCastling, zobristEnPassant
 from visualchess.chesspieces import initialPosition
 
 ic.configureOutput(includeContext=True)
 
-Rect = TypeBag(QRectF, QRect)
 PositionList = list[list[str]]
 AllColor = list[tuple[Square, ChessPiece]]
 debugPosition = [
@@ -41,6 +43,14 @@ class BoardState(_BoardStateProperties):
     instance.updatePositionFromList(positionList)
     return instance
 
+  @classmethod
+  def fromFen(cls, fen: str) -> BoardState:
+    """Creates an instance with the position given in Forsyth-Edwards
+    Notation"""
+    instance = cls()
+    instance.updatePositionFromFen(fen)
+    return instance
+
   @classmethod
   def InitialPosition(cls) -> BoardState:
     """Creates an instance with the starting position"""
@@ -60,19 +70,13 @@ class BoardState(_BoardStateProperties):
       square = maybe(square, Square.fromFileRank(file, rank), Square.NULL)
     if not square:
       return ChessPiece.EMPTY
-    piece = self._contents.get(square, None)
-    if piece is not None:
-      if isinstance(piece, ChessPiece):
-        return piece
-      raise TypeError
-    os.abort()
-    raise UnexpectedStateError
+    return self._contents.getPiece(square)
 
   def setPiece(self, square: Square, piece: ChessPiece) -> NoReturn:
     """Setter-function for the piece on the given square"""
     if piece is not None:
       if isinstance(piece, ChessPiece):
-        self._contents[square] = piece
+        self._contents.setPiece(square, piece)
       else:
         raise TypeError
     else:
@@ -87,8 +91,7 @@ class BoardState(_BoardStateProperties):
 
   def clearPosition(self) -> NoReturn:
     """Clears the position by setting all squares to empty"""
-    for square in Square:
-      self.setPiece(square, ChessPiece.EMPTY)
+    self._contents.clear()
 
   def updatePositionFromList(self, positionList: PositionList) -> NoReturn:
     """Updates the position from the list """
@@ -98,9 +101,167 @@ class BoardState(_BoardStateProperties):
       piece = ChessPiece.fromColorPiece(line[1], line[2])
       self[square] = piece
 
+  def getLegalMoves(self) -> list[int]:
+    """Generates the legal moves in this position encoded as integers.
+    See the visualchess._movegen module for the encoding."""
+    return generateLegalMoves(self._contents, self.turnIndex,
+                              self._castlingRights, self._enPassantIndex)
+
+  def playMove(self, move: int) -> ChessPiece:
+    """Applies the encoded move to the position. This moves the rook when
+    castling, removes the pawn captured en passant, places the promoted
+    piece and updates castling rights, en passant square, turn and the
+    Zobrist key. The move is not validated, no sounds are played and the
+    widget is not updated. Returns the captured piece."""
+    core = self._contents
+    source, target, promotion = move & 63, move >> 6 & 63, move >> 12
+    code = core.setCode(source, 0)
+    pieceType = (code - 1) % 6 + 1
+    base = code - pieceType
+    captured = core.setCode(target, base + promotion if promotion else code)
+    if pieceType == KING and abs(target - source) == 2:
+      if target > source:
+        core.setCode(source + 1, core.setCode(source + 3, 0))
+      else:
+        core.setCode(source - 1, core.setCode(source - 4, 0))
+    if pieceType == PAWN and target == self._enPassantIndex:
+      captured = core.setCode(target - 8 if base == 0 else target + 8, 0)
+    key = self._stateKey ^ zobristEnPassant[self._enPassantIndex]
+    key ^= zobristCastling[self._castlingRights]
+    if pieceType == PAWN and abs(target - source) == 16:
+      self._enPassantIndex = (source + target) // 2
+    else:
+      self._enPassantIndex = -1
+    self._castlingRights &= castlingMasks[source] & castlingMasks[target]
+    key ^= zobristEnPassant[self._enPassantIndex]
+    self._stateKey = key ^ zobristCastling[self._castlingRights]
+    if pieceType == PAWN or captured:
+      self._halfmoveClock = 0
+    else:
+      self._halfmoveClock += 1
+    self._fullmoveNumber += 1 if base else 0
+    self.toggleTurn()
+    return codePieces[captured]
+
+  def _touchedSquares(self, move: int) -> tuple[int, ...]:
+    """Returns the indices of the squares changed by the encoded move"""
+    source, target = move & 63, move >> 6 & 63
+    pieceType = (self._contents.getCode(source) - 1) % 6 + 1
+    if pieceType == KING and abs(target - source) == 2:
+      if target > source:
+        return source, target, source + 3, source + 1
+      return source, target, source - 4, source - 1
+    if pieceType == PAWN and target == self._enPassantIndex:
+      return source, target, target - 8 if target > source else target + 8
+    return source, target
+
+  def makeMove(self, move: int) -> ChessPiece:
+    """Plays the encoded move like playMove and records it in the
+    journal, such that unmakeMove can take it back. Returns the captured
+    piece."""
+    mailbox = self._contents.mailbox
+    touched = self._touchedSquares(move)
+    pre = [mailbox[index] for index in touched]
+    entry = JournalEntry(move, (), self._colorTurn, self._castlingRights,
+                         self._enPassantIndex, self._stateKey,
+                         self._halfmoveClock, self._fullmoveNumber)
+    captured = self.playMove(move)
+    entry.changes = tuple(
+      SquareChange(index, code, mailbox[index])
+      for (index, code) in zip(touched, pre))
+    self._journal.append(entry)
+    return captured
+
+  def unmakeMove(self) -> int:
+    """Takes back the most recent move made by makeMove. Returns the
+    encoded move taken back."""
+    if not self._journal:
+      raise IndexError('No moves to take back!')
+    entry = self._journal.pop()
+    core = self._contents
+    for change in reversed(entry.changes):
+      change._reverse(core)
+    self._colorTurn = entry.turn
+    self._castlingRights = entry.castlingRights
+    self._enPassantIndex = entry.enPassantIndex
+    self._stateKey = entry.stateKey
+    self._halfmoveClock = entry.halfmoveClock
+    self._fullmoveNumber = entry.fullmoveNumber
+    return entry.move
+
+  def takeBack(self) -> NoReturn:
+    """Takes back the most recent move made on the board"""
+    if not self._journal:
+      return self.soundForbidden.play()
+    move = self.unmakeMove()
+    if self.board.move_stack:
+      self.board.pop()
+    if self.widget is not None:
+      squares = [Square.fromIndex(i) for i in self._touchedSquares(move)]
+      self.widget.updateSquares(*squares)
+
+  def updatePositionFromFen(self, fen: str) -> NoReturn:
+    """Updates the position, turn, castling rights, en passant square and
+    move counters from Forsyth-Edwards Notation. Missing fields after the
+    piece placement take their default values."""
+    fields = [*fen.split(), *['w', '-', '-', '0', '1'][len(fen.split()) - 1:]]
+    self._contents.setPlacement(fields[0])
+    self._journal = []
+    if fields[1] not in ['w', 'b']:
+      raise ValueError('Invalid FEN side to move: %s' % fields[1])
+    self.colorTurn = ChessColor.WHITE if fields[1] == 'w' else ChessColor.BLACK
+    rights = 0
+    for (bit, char) in enumerate('KQkq'):
+      rights |= (1 << bit) if char in fields[2] else 0
+    self.castlingRights = rights
+    self.enPassantSquare = Square.NULL
+    if fields[3] != '-':
+      self.enPassantSquare = Square.fromStr(fields[3])
+    self._halfmoveClock = int(fields[4])
+    self._fullmoveNumber = int(fields[5])
+
+  def toFen(self) -> str:
+    """Returns the position in Forsyth-Edwards Notation"""
+    mailbox, rows = self._contents.mailbox, []
+    for rank in reversed(range(8)):
+      row, empty = '', 0
+      for code in mailbox[8 * rank: 8 * rank + 8]:
+        if code:
+          row += ('%d' % empty if empty else '') + fenPieces[code]
+          empty = 0
+        else:
+          empty += 1
+      rows.append(row + ('%d' % empty if empty else ''))
+    castling = ''.join([char for (bit, char) in enumerate('KQkq')
+                        if self._castlingRights & (1 << bit)])
+    enPassant = self.enPassantSquare.name.lower() if (
+      self._enPassantIndex >= 0) else '-'
+    return '%s %s %s %s %d %d' % ('/'.join(rows), 'bw'[self.turnIndex ^ 1],
+                                  castling or '-', enPassant,
+                                  self._halfmoveClock, self._fullmoveNumber)
+
+  def copy(self) -> BoardState:
+    """Returns a new instance with the same position, turn, castling
+    rights, en passant square and move counters. The widget, the chess
+    board and any grabbing or hovering are not copied."""
+    out = self.__class__()
+    out._contents = self._contents.copy()
+    out._colorTurn = self._colorTurn
+    out._castlingRights = self._castlingRights
+    out._enPassantIndex = self._enPassantIndex
+    out._stateKey = self._stateKey
+    out._halfmoveClock = self._halfmoveClock
+    out._fullmoveNumber = self._fullmoveNumber
+    return out
+
   def resetInitialPosition(self) -> NoReturn:
     """Resets the board to initial position"""
     self.colorTurn = ChessColor.WHITE
+    self.castlingRights = ALL_CASTLING
+    self.enPassantSquare = Square.NULL
+    self._halfmoveClock = 0
+    self._fullmoveNumber = 1
+    self._journal = []
     self.updatePositionFromList(initialPosition)
     print('reset!')
     self.board.reset()
@@ -113,11 +274,8 @@ class BoardState(_BoardStateProperties):
 
   def hover(self, square: Square) -> NoReturn:
     """Sets hoverSquare to square"""
-    piece = self.getPiece(square)
-    if self.hoverSquare != square:
-      self.hoverSquare = square
-    if self.hoverPiece != self.getPiece(square):
-      self.hoverPiece = piece
+    self.hoverSquare = square
+    self.hoverPiece = self.getPiece(square)
 
   def grabPiece(self, ) -> NoReturn:
     """Grabs the hovered piece"""
@@ -133,6 +291,7 @@ class BoardState(_BoardStateProperties):
 
   def cancelMove(self, **kwargs) -> NoReturn:
     """This method instead moves the grabbed piece back to grabbed square"""
+    dirtySquares = [self.grabbedSquare, self.hoverSquare]
     if self.grabbedPiece and self.grabbedSquare:
       self.setPiece(self.grabbedSquare, self.grabbedPiece)
       self.soundCancelMove.play()
@@ -141,7 +300,7 @@ class BoardState(_BoardStateProperties):
       self.widget.setHoverCursor()
     else:
       self.widget.setNormalCursor()
-    self.widget.update()
+    self.widget.updateSquares(*dirtySquares)
 
   def completeMove(self, *args, **kwargs) -> NoReturn:
     """This method completes the move once it has been validated."""
@@ -151,44 +310,29 @@ class BoardState(_BoardStateProperties):
       raise TypeError
     if not isinstance(move, Move):
       raise TypeError
-    kingCastle = False if res % 2 else True
-    queenCastle = False if res % 3 else True
-    enPassant = False if res % 5 else True
-    capturedPiece = self.getPiece(self.hoverSquare)
-    self.setPiece(self.hoverSquare, self.grabbedPiece)
-    self.setPiece(self.grabbedSquare, ChessPiece.EMPTY)
-    rookOriginSquare, rookTargetSquare = None, None
-    if kingCastle:
-      rookOriginSquare = Square.fromFileRank(File.H, self.hoverSquare.rank)
-      rookTargetSquare = Square.fromFileRank(File.F, self.hoverSquare.rank)
-    if queenCastle:
-      rookOriginSquare = Square.fromFileRank(File.A, self.hoverSquare.rank)
-      rookTargetSquare = Square.fromFileRank(File.D, self.hoverSquare.rank)
-    if kingCastle or queenCastle:
-      rookPiece = self.getPiece(rookOriginSquare)
-      self.setPiece(rookTargetSquare, rookPiece)
-      self.setPiece(rookOriginSquare, ChessPiece.EMPTY)
-    if enPassant:
-      captureSquare = Square.fromFileRank(
-        self.hoverSquare.file, self.grabbedSquare.rank, )
-      self.setPiece(captureSquare, ChessPiece.EMPTY)
+    encoded = encodeMove(move.from_square, move.to_square, move.promotion)
+    dirtySquares = [Square.fromIndex(index)
+                    for index in self._touchedSquares(encoded)]
+    capturedPiece = self.makeMove(encoded)
     self.hoverSquare = self.grabbedSquare
     self.hoverPiece = self.grabbedPiece
     self.grabbedPiece = ChessPiece.EMPTY
     self.grabbedSquare = Square.NULL
-    self.toggleTurn()
     self.board.push(move)
     if capturedPiece:
       self.soundAllowedCapture.play()
     else:
       self.soundAllowedMove.play()
-    self.widget.update()
+    self.widget.updateSquares(*dirtySquares)
 
   def applyMove(self, ) -> NoReturn:
     """Interfaces with chess package"""
     if self.grabbedSquare == self.hoverSquare:
       ic(self.grabbedSquare, self.hoverSquare)
       return self.cancelMove(sameSquare=True)
+    if not self.hoverSquare:
+      return self.cancelMove()
+    self.setPiece(self.grabbedSquare, self.grabbedPiece)
     move = self.exportMove()
     res = self.board.validateMove(move)
     if not res % 7:
@@ -196,13 +340,10 @@ class BoardState(_BoardStateProperties):
     return self.cancelMove()
 
   def exportMove(self) -> Move:
-    """Creates a move instance from this state. """
-    sourceFile = self.grabbedSquare.file.name
-    sourceRank = self.grabbedSquare.rank.name
-    targetFile = self.hoverSquare.file.name
-    targetRank = self.hoverSquare.rank.name
-    sourceName = '%s%s' % (sourceFile[0], sourceRank[-1])
-    targetName = '%s%s' % (targetFile[0], targetRank[-1])
-    sourceSquare = parse_square(sourceName.lower())
-    targetSquare = parse_square(targetName.lower())
-    return Move(sourceSquare, targetSquare)
+    """Creates a move instance from this state. Pawns reaching the last
+    rank are promoted to queens."""
+    source, target = self.grabbedSquare.index, self.hoverSquare.index
+    promotion = None
+    if self.grabbedPiece.piece is PieceType.PAWN and target >> 3 in [0, 7]:
+      promotion = CHESS_QUEEN
+    return Move(source, target, promotion)
@@ -11,7 +11,10 @@ from worktoy.core import maybe
 from worktoy.waitaminute import ReadOnlyError
 
 from visualchess import ChessAudio, Square, ChessPiece, ChessColor
-from visualchess import File, ChessBoard
+from visualchess import File, ChessBoard, BoardCore
+from visualchess._movegen import ALL_CASTLING
+from visualchess._zobrist import zobristTurn, zobristCastling
+from visualchess._zobrist import zobristEnPassant
 
 if TYPE_CHECKING:
   from visualchess import PieceGrabbing
@@ -26,9 +29,15 @@ class _BoardStateProperties(ChessAudio):
 
   def __init__(self, *args, **kwargs) -> None:
     ChessAudio.__init__(self)
-    self._contents = {s: ChessPiece.EMPTY for s in Square}
+    self._contents = BoardCore()
     self._colorTurn = ChessColor.WHITE
     self._enPassant = Square.NULL
+    self._castlingRights = ALL_CASTLING
+    self._enPassantIndex = -1
+    self._stateKey = zobristCastling[ALL_CASTLING]
+    self._halfmoveClock = 0
+    self._fullmoveNumber = 1
+    self._journal = []
     self._grabbedPiece = ChessPiece.EMPTY
     self._grabbedSquare = Square.NULL
     self._hoverSquare = Square.NULL
@@ -44,28 +53,36 @@ class _BoardStateProperties(ChessAudio):
 
   def __getitem__(self, square: Square) -> ChessPiece:
     """Returns the piece at given square"""
-    return self._contents.get(square)
+    return self._contents.getPiece(square)
 
   def __setitem__(self, square: Square, piece: ChessPiece) -> NoReturn:
     """Places given piece and given square"""
-    self._contents |= {square: piece}
+    self._contents.setPiece(square, piece)
 
   def __delitem__(self, square: Square) -> NoReturn:
     """Deletes the item at given square. Deleting means placing the EMPTY
     piece."""
-    self._contents |= {square: ChessPiece.EMPTY}
+    self._contents.delPiece(square)
 
   def keys(self) -> list[Square]:
     """Implementation of keys method"""
-    return [key for key in self._contents.keys()]
+    return self._contents.keys()
 
   def values(self) -> list[ChessPiece]:
     """Implementation of values"""
-    return [piece for piece in self._contents.values()]
+    return self._contents.values()
 
   def items(self) -> list[tuple[Square, ChessPiece]]:
     """Implementation of items method"""
-    return [(k, v) for (k, v) in self._contents.items()]
+    return self._contents.items()
+
+  def _getCore(self) -> BoardCore:
+    """Getter-function for the bitboard core holding the pieces"""
+    return self._contents
+
+  def _getOccupancy(self) -> int:
+    """Getter-function for the bitboard of occupied squares"""
+    return self._contents.occupancy
 
   def _getGrabbedPiece(self) -> ChessPiece:
     """Getter-function for the grabbed piece"""
@@ -113,6 +130,8 @@ class _BoardStateProperties(ChessAudio):
 
   def _setTurn(self, chessColor: ChessColor) -> NoReturn:
     """Setter-function for the color whose turn it is."""
+    if chessColor is not self._colorTurn:
+      self._stateKey ^= zobristTurn
     self._colorTurn = chessColor
 
   def _getEnPassantFile(self, ) -> File:
@@ -132,8 +151,45 @@ class _BoardStateProperties(ChessAudio):
     else:
       raise TypeError
 
+  def _getTurnIndex(self) -> int:
+    """Getter-function for the side to move as used by the move
+    generator. White is 0 and black is 1."""
+    return 0 if self._colorTurn is ChessColor.WHITE else 1
+
+  def _getCastlingRights(self) -> int:
+    """Getter-function for the castling rights as bits"""
+    return self._castlingRights
+
+  def _setCastlingRights(self, rights: int) -> NoReturn:
+    """Setter-function for the castling rights as bits"""
+    self._stateKey ^= zobristCastling[self._castlingRights]
+    self._stateKey ^= zobristCastling[rights]
+    self._castlingRights = rights
+
+  def _getEnPassantSquare(self) -> Square:
+    """Getter-function for the square to which a pawn may capture en
+    passant. Please note the use of 'Square.NULL' indicating that no en
+    passant capture is possible."""
+    return Square.fromIndex(self._enPassantIndex)
+
+  def _setEnPassantSquare(self, square: Square) -> NoReturn:
+    """Setter-function for the en passant square"""
+    index = square.index if square else -1
+    self._stateKey ^= zobristEnPassant[self._enPassantIndex]
+    self._stateKey ^= zobristEnPassant[index]
+    self._enPassantIndex = index
+
+  def _getZobristKey(self) -> int:
+    """Getter-function for the 64-bit Zobrist key of the position. The
+    key covers the pieces, the side to move, the castling rights and the
+    en passant file. It is maintained incrementally, as the pieces are
+    updated by the core and the remaining state by the setters, by
+    toggleTurn and by playMove."""
+    return self._contents.key ^ self._stateKey
+
   def toggleTurn(self) -> NoReturn:
     """Toggle-function switching the turn"""
+    self._stateKey ^= zobristTurn
     if self._colorTurn is ChessColor.BLACK:
       self._colorTurn = ChessColor.WHITE
     else:
@@ -210,7 +266,7 @@ class _BoardStateProperties(ChessAudio):
 
   def _createChessBoard(self) -> NoReturn:
     """Creates the board instance from the chess package"""
-    self._board = ChessBoard(self)
+    self._board = ChessBoard(self, self.toFen())
 
   def _getBoard(self) -> ChessBoard:
     """Getter-function for chess board"""
@@ -225,6 +281,8 @@ class _BoardStateProperties(ChessAudio):
     """Illegal Accessor Function"""
     raise ReadOnlyError('General illegal accessor')
 
+  core = property(_getCore, _noAcc, _noAcc)
+  occupancy = property(_getOccupancy, _noAcc, _noAcc)
   grabbedPiece = property(_getGrabbedPiece, _setGrabbedPiece, _noAcc)
   grabbedSquare = property(_getGrabbedSquare, _setGrabbedSquare, _noAcc)
   grabbedColor = property(_getGrabbedColor, _noAcc, _noAcc)
@@ -240,6 +298,11 @@ class _BoardStateProperties(ChessAudio):
   whiteRookHMoved = property(_getWhiteRookHMovedFlag, _noAcc, _noAcc)
   blackRookAMoved = property(_getBlackRookAMovedFlag, _noAcc, _noAcc)
   blackRookHMoved = property(_getBlackRookHMovedFlag, _noAcc, _noAcc)
+  turnIndex = property(_getTurnIndex, _noAcc, _noAcc)
+  castlingRights = property(_getCastlingRights, _setCastlingRights, _noAcc)
+  enPassantSquare = property(
+    _getEnPassantSquare, _setEnPassantSquare, _noAcc)
   enPassantFile = property(_getEnPassantFile, _setEnPassantFile, _noAcc)
+  zobristKey = property(_getZobristKey, _noAcc, _noAcc)
   widget = property(_getWidget, _setWidget, _noAcc)
   board = property(_getBoard, _noAcc, _noAcc)
@@ -9,6 +9,9 @@ from chess import Board, Move
 from icecream import ic
 from worktoy.waitaminute import ReadOnlyError
 
+from visualchess import encodeMove
+from visualchess._boardcore import PAWN, KING
+
 if TYPE_CHECKING:
   from visualchess import BoardState
 
@@ -21,27 +24,67 @@ class ChessBoard(Board):
   #  Copyright (c) 2023 Asger Jon Vistisen"""
 
   def __init__(self, state: BoardState, *args, **kwargs) -> None:
-    Board.__init__(self, *args, **kwargs)
     self._state = state
     self._legalMoves = None
+    self._legalMovesKey = None
+    Board.__init__(self, *args, **kwargs)
+
+  def _getLegalMoves(self) -> frozenset[int]:
+    """Getter-function for the set of legal moves in the current position
+    of the board state encoded as integers. The set is generated once per
+    position and kept until the Zobrist key of the state changes or the
+    board is pushed, popped or reset."""
+    key = self.state.zobristKey
+    if self._legalMoves is None or key != self._legalMovesKey:
+      self._legalMoves = frozenset(self.state.getLegalMoves())
+      self._legalMovesKey = key
+    return self._legalMoves
+
+  def clearLegalMoves(self) -> None:
+    """Invalidates the cached set of legal moves"""
+    self._legalMoves = None
+    self._legalMovesKey = None
+
+  def isLegal(self, source: int, target: int, promotion: int = None) -> bool:
+    """Checks if the move from source to target is legal in the current
+    position of the board state"""
+    return encodeMove(source, target, promotion) in self.legalMoves
+
+  def push(self, move: Move) -> None:
+    """Reimplementation invalidating the legal moves"""
+    self.clearLegalMoves()
+    Board.push(self, move)
+
+  def pop(self) -> Move:
+    """Reimplementation invalidating the legal moves"""
+    self.clearLegalMoves()
+    return Board.pop(self)
 
-  def _getLegalMoves(self) -> list[Move]:
-    """Getter-function for list of legal moves"""
-    for m in self.generate_legal_moves():
-      print(m)
-    return [m for m in self.generate_legal_moves()]
+  def reset(self) -> None:
+    """Reimplementation invalidating the legal moves"""
+    self.clearLegalMoves()
+    Board.reset(self)
 
   def _getState(self) -> BoardState:
     """Getter-function for board state"""
     return self._state
 
   def validateMove(self, move: Move) -> int:
-    """Validates the potential move from grabbed square to hovered square."""
-    out = 1
-    out *= (2 if self.is_kingside_castling(move) else 1)
-    out *= (3 if self.is_queenside_castling(move) else 1)
-    out *= (5 if self.is_en_passant(move) else 1)
-    out *= (7 if move in self.legal_moves else 1)
+    """Validates the potential move from grabbed square to hovered square.
+    The move is looked up in the cached set of legal moves. The returned
+    integer is divisible by 7 if the move is legal, by 2 for kingside
+    castling, by 3 for queenside castling and by 5 for en passant."""
+    source, target = move.from_square, move.to_square
+    if not self.isLegal(source, target, move.promotion):
+      return 1
+    out = 7
+    code = self.state.core.getCode(source)
+    pieceType = (code - 1) % 6 + 1
+    if pieceType == KING:
+      out *= (2 if target - source == 2 else 1)
+      out *= (3 if source - target == 2 else 1)
+    if pieceType == PAWN:
+      out *= (5 if target == self.state.enPassantSquare.index else 1)
     return out
 
   def _noAcc(self, *_) -> Never:
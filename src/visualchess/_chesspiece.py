@@ -4,11 +4,8 @@
 from __future__ import annotations
 
 from enum import IntEnum
-import os
 from typing import Never, TYPE_CHECKING
 
-from PySide6.QtCore import QPointF
-from PySide6.QtGui import QPixmap, QColor, QCursor
 from icecream import ic
 from worktoy.core import maybe
 from worktoy.parsing import maybeType, searchKeys
@@ -18,7 +15,8 @@ from worktoy.waitaminute import ReadOnlyError
 from visualchess import PieceType, ChessColor
 
 if TYPE_CHECKING:
-  pass
+  from PySide6.QtCore import QPointF
+  from PySide6.QtGui import QPixmap, QCursor
 
 ic.configureOutput(includeContext=True)
 
@@ -49,29 +47,26 @@ class ChessPiece(IntEnum):
     but received: %d"""
     raise IndexError(msg % index)
 
+  def _loadPixmap(self) -> QPixmap:
+    """Loads the QPixmap representation of the piece from disk"""
+    from visualchess._piecepixmaps import loadPiecePixmap
+    return loadPiecePixmap(self)
+
   def getPixmap(self) -> QPixmap:
-    """Generates QPixmap representation of the piece"""
-    if not self.value:
-      pix = QPixmap(64, 64)
-      pix.fill(QColor(0, 0, 0, 0, ))
-      return pix
-    root = os.getenv('CHESSGPT')
-    there = stringList('src, visualchess, chesspieces, images')
-    os.path.join(root, *there)
-    fileName = '%s.png' % self.name.lower()
-    filePath = os.path.join(root, *there, fileName)
-    return QPixmap(filePath)
+    """Getter-function for the QPixmap representation of the piece. Each
+    image is loaded from disk only once per process. Please note that the
+    returned pixmap is shared and should not be painted on. This is
+    implemented by the piece pixmaps of the rendering layer."""
+    from visualchess._piecepixmaps import getPiecePixmap
+    return getPiecePixmap(self)
 
   def getCursor(self, point: QPointF = None) -> QCursor:
     """Generates a QCursor instance at the given point as hot. Please
     note, that passing a point to this function will create a QCursor
     whose hot point is that point. The point defaults to origin which is
     likely safe for most situations."""
-    pix = self.getPixmap()
-    x, y = -1, -1
-    if isinstance(point, QPointF):
-      x, y = point.x(), point.y()
-    return QCursor(pix, hotX=x, hotY=y)
+    from visualchess._piecepixmaps import getPieceCursor
+    return getPieceCursor(self, point)
 
   def getColor(self) -> ChessColor:
     """Getter-function for color"""
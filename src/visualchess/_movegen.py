@@ -0,0 +1,249 @@
+"""The move generator produces the legal moves in a position given as a
+BoardCore together with the side to move, the castling rights and the en
+passant square. Moves are encoded as integers holding the source index,
+the target index and the promotion piece type."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from icecream import ic
+
+from visualchess import BoardCore
+from visualchess._attacktables import knightAttacks, kingAttacks
+from visualchess._attacktables import pawnAttacks, bishopAttacks
+from visualchess._attacktables import rookAttacks, betweenSquares
+from visualchess._attacktables import lineSquares, fullBoard
+from visualchess._attacktables import queenAttacks
+from visualchess._boardcore import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+
+ic.configureOutput(includeContext=True)
+
+#  Castling rights are kept as four bits
+WHITE_KINGSIDE, WHITE_QUEENSIDE = 1, 2
+BLACK_KINGSIDE, BLACK_QUEENSIDE = 4, 8
+ALL_CASTLING = 15
+#  The castling rights remaining after a move from or to each square
+castlingMasks = tuple(
+  {0: 13, 4: 12, 7: 14, 56: 7, 60: 3, 63: 11}.get(index, 15)
+  for index in range(64))
+_promotionTypes = (QUEEN, ROOK, BISHOP, KNIGHT)
+_lastRanks = (0xFF00000000000000, 0x00000000000000FF)
+_doublePushRanks = (0x00000000FF000000, 0x000000FF00000000)
+_fileNames = 'abcdefgh'
+_promotionNames = {KNIGHT: 'n', BISHOP: 'b', ROOK: 'r', QUEEN: 'q'}
+
+
+def encodeMove(source: int, target: int, promotion: int = None) -> int:
+  """Encodes the move from source to target. The promotion is the value
+  of the piece type promoted to and defaults to 0 for no promotion."""
+  return source | target << 6 | (promotion or 0) << 12
+
+
+def moveSource(move: int) -> int:
+  """Returns the source index of the move"""
+  return move & 63
+
+
+def moveTarget(move: int) -> int:
+  """Returns the target index of the move"""
+  return move >> 6 & 63
+
+
+def movePromotion(move: int) -> int:
+  """Returns the piece type promoted to or 0"""
+  return move >> 12
+
+
+def moveToUci(move: int) -> str:
+  """Returns the move in UCI notation such as 'e2e4' or 'e7e8q'"""
+  source, target, promotion = move & 63, move >> 6 & 63, move >> 12
+  out = '%s%d%s%d' % (_fileNames[source & 7], (source >> 3) + 1,
+                      _fileNames[target & 7], (target >> 3) + 1)
+  return out + _promotionNames.get(promotion, '')
+
+
+def moveFromUci(uci: str) -> int:
+  """Parses a move in UCI notation"""
+  source = _fileNames.index(uci[0]) + 8 * (int(uci[1]) - 1)
+  target = _fileNames.index(uci[2]) + 8 * (int(uci[3]) - 1)
+  promotion = 0
+  for (key, val) in _promotionNames.items():
+    if uci[4:] == val:
+      promotion = key
+  return encodeMove(source, target, promotion)
+
+
+def _knightAttacks(index: int, *_) -> int:
+  """Returns the squares attacked by a knight on the square at index. The
+  occupancy is accepted for symmetry with the sliding pieces."""
+  return knightAttacks[index]
+
+
+def attackersTo(core: BoardCore, index: int, color: int,
+                occupancy: int) -> int:
+  """Returns the bitboard of pieces of the given color attacking the
+  square at index given the occupancy"""
+  bitboards, base = core.bitboards, 6 * color
+  queens = bitboards[QUEEN + base]
+  return ((knightAttacks[index] & bitboards[KNIGHT + base])
+          | (kingAttacks[index] & bitboards[KING + base])
+          | (pawnAttacks[color ^ 1][index] & bitboards[PAWN + base])
+          | (bishopAttacks(index, occupancy)
+             & (bitboards[BISHOP + base] | queens))
+          | (rookAttacks(index, occupancy)
+             & (bitboards[ROOK + base] | queens)))
+
+
+def isAttacked(core: BoardCore, index: int, color: int) -> bool:
+  """Checks if the square at index is attacked by the given color"""
+  return True if attackersTo(core, index, color, core.occupancy) else False
+
+
+def isCheck(core: BoardCore, turn: int) -> bool:
+  """Checks if the side to move is in check"""
+  king = core.bitboards[KING + 6 * turn]
+  if not king:
+    return False
+  return isAttacked(core, king.bit_length() - 1, turn ^ 1)
+
+
+def _pinnedPieces(core: BoardCore, king: int, turn: int) -> int:
+  """Returns the bitboard of pieces of the side to move that are pinned
+  to their king"""
+  bitboards, base = core.bitboards, 6 * (turn ^ 1)
+  colors = core.colors
+  us, them = colors[turn], colors[turn ^ 1]
+  queens = bitboards[QUEEN + base]
+  snipers = ((rookAttacks(king, them) & (bitboards[ROOK + base] | queens))
+             | (bishopAttacks(king, them)
+                & (bitboards[BISHOP + base] | queens)))
+  pinned, occupancy = 0, us | them
+  while snipers:
+    sniper = snipers & -snipers
+    snipers ^= sniper
+    blockers = betweenSquares[64 * king + sniper.bit_length() - 1]
+    blockers &= occupancy
+    if blockers and not blockers & (blockers - 1):
+      pinned |= blockers & us
+  return pinned
+
+
+def _enPassantIsLegal(core: BoardCore, turn: int, source: int,
+                      target: int, king: int) -> bool:
+  """Checks that the en passant capture from source to target does not
+  leave the king in check. This is tested directly on the occupancy after
+  the capture, since both pawns leave the rank at the same time."""
+  if king < 0:
+    return True
+  captured = target - 8 if turn == 0 else target + 8
+  bitboards, base = core.bitboards, 6 * (turn ^ 1)
+  occupancy = core.occupancy ^ (1 << source) ^ (1 << captured)
+  occupancy |= 1 << target
+  queens = bitboards[QUEEN + base]
+  if rookAttacks(king, occupancy) & (bitboards[ROOK + base] | queens):
+    return False
+  if bishopAttacks(king, occupancy) & (bitboards[BISHOP + base] | queens):
+    return False
+  pawns = bitboards[PAWN + base] ^ (1 << captured)
+  if pawnAttacks[turn][king] & pawns:
+    return False
+  if knightAttacks[king] & bitboards[KNIGHT + base]:
+    return False
+  return True
+
+
+def generateLegalMoves(core: BoardCore, turn: int, castling: int = None,
+                       enPassant: int = None) -> list[int]:
+  """Generates the legal moves for the side to move. The turn is 0 for
+  white and 1 for black. The castling rights are given as bits and the
+  en passant square as the index of the square a capturing pawn would
+  move to, or -1 if unavailable."""
+  castling = ALL_CASTLING if castling is None else castling
+  enPassant = -1 if enPassant is None else enPassant
+  bitboards, colors = core.bitboards, core.colors
+  us, them = colors[turn], colors[turn ^ 1]
+  occupancy, base, other = us | them, 6 * turn, turn ^ 1
+  notUs = ~us & fullBoard
+  moves = []
+  append = moves.append
+  kingBoard = bitboards[KING + base]
+  king = kingBoard.bit_length() - 1
+  checkers, pinned, evasions = 0, 0, fullBoard
+  if king >= 0:
+    checkers = attackersTo(core, king, other, occupancy)
+    withoutKing = occupancy ^ kingBoard
+    targets = kingAttacks[king] & notUs
+    while targets:
+      bit = targets & -targets
+      targets ^= bit
+      target = bit.bit_length() - 1
+      if not attackersTo(core, target, other, withoutKing):
+        append(king | target << 6)
+    if checkers & (checkers - 1):
+      return moves
+    if checkers:
+      checker = checkers.bit_length() - 1
+      evasions = checkers | betweenSquares[64 * king + checker]
+    pinned = _pinnedPieces(core, king, turn)
+  # <***************************** Pieces ******************************> #
+  for (pieceType, attacks) in ((KNIGHT, _knightAttacks),
+                               (BISHOP, bishopAttacks),
+                               (ROOK, rookAttacks),
+                               (QUEEN, queenAttacks)):
+    pieces = bitboards[pieceType + base]
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      source = bit.bit_length() - 1
+      targets = attacks(source, occupancy)
+      targets &= notUs & evasions
+      if bit & pinned:
+        targets &= lineSquares[64 * king + source]
+      while targets:
+        tBit = targets & -targets
+        targets ^= tBit
+        append(source | (tBit.bit_length() - 1) << 6)
+  # <****************************** Pawns ******************************> #
+  pawns = bitboards[PAWN + base]
+  empty = ~occupancy & fullBoard
+  lastRank = _lastRanks[turn]
+  while pawns:
+    bit = pawns & -pawns
+    pawns ^= bit
+    source = bit.bit_length() - 1
+    single = (bit << 8 if turn == 0 else bit >> 8) & empty
+    double = (single << 8 if turn == 0 else single >> 8) & empty
+    targets = single | double & _doublePushRanks[turn]
+    targets |= pawnAttacks[turn][source] & them
+    targets &= evasions
+    if bit & pinned:
+      targets &= lineSquares[64 * king + source]
+    while targets:
+      tBit = targets & -targets
+      targets ^= tBit
+      move = source | (tBit.bit_length() - 1) << 6
+      if tBit & lastRank:
+        for promotion in _promotionTypes:
+          append(move | promotion << 12)
+      else:
+        append(move)
+    if enPassant >= 0 and pawnAttacks[turn][source] & (1 << enPassant):
+      if _enPassantIsLegal(core, turn, source, enPassant, king):
+        append(source | enPassant << 6)
+  # <**************************** Castling *****************************> #
+  if checkers or king < 0:
+    return moves
+  rights = castling >> (2 * turn) & 3
+  rank = 56 * turn
+  rook = ROOK + base
+  if rights & 1 and king == rank + 4 and bitboards[rook] & 1 << (rank + 7):
+    if not occupancy & (0x60 << rank):
+      if not (attackersTo(core, rank + 5, other, occupancy)
+              or attackersTo(core, rank + 6, other, occupancy)):
+        append(king | (rank + 6) << 6)
+  if rights & 2 and king == rank + 4 and bitboards[rook] & 1 << rank:
+    if not occupancy & (0x0E << rank):
+      if not (attackersTo(core, rank + 3, other, occupancy)
+              or attackersTo(core, rank + 2, other, occupancy)):
+        append(king | (rank + 2) << 6)
+  return moves
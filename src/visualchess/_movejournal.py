@@ -0,0 +1,71 @@
+"""The move journal records the moves made on a board state, such that
+they can be taken back without copying the state. Each entry holds the
+square changes made by the move together with the castling rights, en
+passant square, move counters and keys from before the move. The records
+use __slots__ and hold piece codes, since an entry is created for every
+move made during search."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from icecream import ic
+
+if TYPE_CHECKING:
+  from visualchess import BoardCore, ChessColor
+
+ic.configureOutput(includeContext=True)
+
+
+class SquareChange:
+  """SquareChange is the compact counterpart of StateChange. It records
+  the piece code on a single square before and after a change and is
+  reversible in the same way.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  __slots__ = ('index', 'pre', 'post')
+
+  def __init__(self, index: int, pre: int, post: int) -> None:
+    self.index = index
+    self.pre = pre
+    self.post = post
+
+  def _apply(self, core: BoardCore) -> BoardCore:
+    """Applies this change"""
+    core.setCode(self.index, self.post)
+    return core
+
+  def _reverse(self, core: BoardCore) -> BoardCore:
+    """Reverses this change"""
+    core.setCode(self.index, self.pre)
+    return core
+
+  def __repr__(self) -> str:
+    """Code representation"""
+    return 'SquareChange(%d, %d, %d)' % (self.index, self.pre, self.post)
+
+
+class JournalEntry:
+  """JournalEntry holds what is needed to take back a single move: the
+  square changes and the state preceding the move.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  __slots__ = ('move', 'changes', 'turn', 'castlingRights',
+               'enPassantIndex', 'stateKey', 'halfmoveClock',
+               'fullmoveNumber')
+
+  def __init__(self, move: int, changes: tuple[SquareChange, ...],
+               turn: ChessColor, castlingRights: int, enPassantIndex: int,
+               stateKey: int, halfmoveClock: int,
+               fullmoveNumber: int) -> None:
+    self.move = move
+    self.changes = changes
+    self.turn = turn
+    self.castlingRights = castlingRights
+    self.enPassantIndex = enPassantIndex
+    self.stateKey = stateKey
+    self.halfmoveClock = halfmoveClock
+    self.fullmoveNumber = fullmoveNumber
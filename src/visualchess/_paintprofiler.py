@@ -0,0 +1,184 @@
+"""PaintProfiler records the time spent painting each layer of the board,
+the number of paints per second and the latency from input events to the
+completion of the paint showing them. It is opt-in, such that widgets
+without a profiler pay nothing, and its summary can be shown in an
+overlay or exported as JSON."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from typing import Never, NoReturn
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QPainter
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import pieceAtlas
+from visualchess._piecepixmaps import pixmapCounters
+from workside.styles import overlayStyle
+
+ic.configureOutput(includeContext=True)
+
+#  The layers in the order they are painted
+paintLayers = ('background', 'labels', 'squares', 'board', 'hover',
+               'pieces')
+
+
+class PaintProfiler:
+  """PaintProfiler records the most recent frames painted. For each
+  frame, the time spent on each layer is recorded in milliseconds
+  together with the total, the latency from the first input event since
+  the previous paint, the number of images loaded from disk and the
+  number of rebuilds of the piece atlas. Paints refreshing only the
+  overlay are not recorded. The background, labels and squares are
+  painted only when the static layer is rendered again, while the board
+  layer is the copy of the static layer made by every paint.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, frames: int = 240, *args, **kwargs) -> None:
+    self._frames = deque(maxlen=frames)
+    self._paintTimes = deque()
+    self._current = None
+    self._frameStart = None
+    self._lapStart = None
+    self._inputTime = None
+    self._pixmapLoads = 0
+    self._atlasRebuilds = 0
+    self._overlayVisible = False
+
+  def markInput(self) -> NoReturn:
+    """Records the time of an input event. Only the first input event
+    since the previous paint is kept."""
+    if self._inputTime is None:
+      self._inputTime = time.perf_counter()
+
+  def clearInput(self) -> NoReturn:
+    """Forgets the input event recorded, as when the input caused no
+    paint"""
+    self._inputTime = None
+
+  def beginPaint(self) -> NoReturn:
+    """Starts recording a frame"""
+    self._frameStart = self._lapStart = time.perf_counter()
+    self._current = dict.fromkeys(paintLayers, 0.)
+    self._pixmapLoads = pixmapCounters['misses']
+    self._atlasRebuilds = pieceAtlas.rebuilds
+
+  def lap(self, layer: str) -> NoReturn:
+    """Adds the time since the previous lap to the given layer. Laps
+    outside of a frame are ignored."""
+    if self._current is None:
+      return
+    now = time.perf_counter()
+    self._current[layer] += 1000 * (now - self._lapStart)
+    self._lapStart = now
+
+  def endPaint(self, overlayOnly: bool = False) -> NoReturn:
+    """Completes the frame. If overlayOnly is True, the paint only
+    refreshed the overlay and is discarded, such that the overlay does
+    not count its own paints."""
+    if self._current is None:
+      return
+    if overlayOnly:
+      self._current = None
+      return
+    now = time.perf_counter()
+    frame = self._current
+    frame['total'] = 1000 * (now - self._frameStart)
+    frame['latency'] = None
+    if self._inputTime is not None:
+      frame['latency'] = 1000 * (now - self._inputTime)
+    frame['pixmapLoads'] = pixmapCounters['misses'] - self._pixmapLoads
+    frame['atlasRebuilds'] = pieceAtlas.rebuilds - self._atlasRebuilds
+    self._frames.append(frame)
+    self._paintTimes.append(now)
+    while self._paintTimes and now - self._paintTimes[0] > 1:
+      self._paintTimes.popleft()
+    self._current, self._inputTime = None, None
+
+  def clear(self) -> NoReturn:
+    """Discards the recorded frames"""
+    self._frames.clear()
+    self._paintTimes.clear()
+    self._current, self._inputTime = None, None
+
+  def summary(self) -> dict:
+    """Returns the mean and maximum time of each layer, of the total and
+    of the input latency in milliseconds, along with the number of
+    frames, the paints in the most recent second and the total number of
+    images loaded from disk and of atlas rebuilds during the frames."""
+    frames = [*self._frames]
+    out = dict(frames=len(frames), paintsPerSecond=len(self._paintTimes))
+    for key in [*paintLayers, 'total', 'latency']:
+      values = [frame[key] for frame in frames if frame[key] is not None]
+      out[key] = dict(
+        mean=sum(values) / len(values) if values else 0.,
+        max=max(values) if values else 0.)
+    for key in ['pixmapLoads', 'atlasRebuilds']:
+      out[key] = sum(frame[key] for frame in frames)
+    return out
+
+  def toJson(self, frames: bool = True) -> str:
+    """Returns the summary as JSON. If frames is True, the recorded
+    frames are included."""
+    data = dict(summary=self.summary())
+    if frames:
+      data['frames'] = [*self._frames]
+    return json.dumps(data, indent=2)
+
+  def exportJson(self, filePath: str, frames: bool = True) -> NoReturn:
+    """Writes the JSON to the file"""
+    with open(filePath, 'w', encoding='utf-8') as file:
+      file.write(self.toJson(frames))
+
+  def toggleOverlay(self) -> bool:
+    """Toggles the visibility of the overlay and returns the new state"""
+    self._overlayVisible = not self._overlayVisible
+    return self._overlayVisible
+
+  def getOverlayRect(self, viewPort: QRectF) -> QRectF:
+    """Getter-function for the rectangle of the overlay in the top left
+    corner of the viewport"""
+    metrics = overlayStyle.getFontMetrics()
+    width = metrics.horizontalAdvance('M') * 36
+    height = metrics.lineSpacing() * (len(paintLayers) + 5)
+    return QRectF(viewPort.left() + 4, viewPort.top() + 4, width, height)
+
+  def paintOverlay(self, painter: QPainter, viewPort: QRectF) -> NoReturn:
+    """Paints the summary in the top left corner of the viewport"""
+    data = self.summary()
+    lines = ['%-9s %7s %7s' % ('layer', 'mean', 'max')]
+    for key in [*paintLayers, 'total', 'latency']:
+      lines.append('%-9s %7.2f %7.2f' % (key, data[key]['mean'],
+                                         data[key]['max']))
+    lines.append('%d paints/s %d loads %d rebuilds' % (
+      data['paintsPerSecond'], data['pixmapLoads'], data['atlasRebuilds']))
+    rect = self.getOverlayRect(viewPort)
+    overlayStyle @ painter
+    painter.drawRect(rect)
+    flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+    painter.drawText(rect.adjusted(4, 2, -4, -2), flags, '\n'.join(lines))
+
+  def _getFrames(self) -> list[dict]:
+    """Getter-function for the recorded frames"""
+    return [*self._frames]
+
+  def _getOverlayVisible(self) -> bool:
+    """Getter-function for the visibility of the overlay"""
+    return self._overlayVisible
+
+  def _setOverlayVisible(self, visible: bool) -> NoReturn:
+    """Setter-function for the visibility of the overlay"""
+    self._overlayVisible = True if visible else False
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  frames = property(_getFrames, _noAcc, _noAcc)
+  overlayVisible = property(_getOverlayVisible, _setOverlayVisible, _noAcc)
@@ -0,0 +1,37 @@
+"""Perft counts the leaf nodes of the move tree to a given depth. Since
+the counts for the standard test positions are known, perft verifies the
+move generator and measures its speed."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from icecream import ic
+
+from visualchess import BoardState, moveToUci
+
+ic.configureOutput(includeContext=True)
+
+
+def perft(state: BoardState, depth: int) -> int:
+  """Counts the leaf nodes reached from the state in exactly depth plies.
+  Each move is made and then taken back on the state itself."""
+  moves = state.getLegalMoves()
+  if depth < 2:
+    return len(moves) if depth == 1 else 1
+  out = 0
+  for move in moves:
+    state.makeMove(move)
+    out += perft(state, depth - 1)
+    state.unmakeMove()
+  return out
+
+
+def perftDivide(state: BoardState, depth: int) -> dict[str, int]:
+  """Returns the perft count below each legal move keyed by the move in
+  UCI notation"""
+  out = {}
+  for move in state.getLegalMoves():
+    state.makeMove(move)
+    out[moveToUci(move)] = perft(state, depth - 1)
+    state.unmakeMove()
+  return out
@@ -0,0 +1,120 @@
+"""PieceAtlas keeps the chess piece images pre-scaled to the current
+square size in a single pixmap. Painting a piece then copies a cell of
+the atlas instead of decoding and scaling an image file."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import math
+from typing import Never, NoReturn
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QPixmap, QPainter, QColor
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import ChessPiece
+
+ic.configureOutput(includeContext=True)
+
+
+class PieceAtlas:
+  """PieceAtlas keeps the chess piece images pre-scaled to the current
+  square size and device pixel ratio in a single pixmap with a cell for
+  each piece. The atlas is rebuilt only when the size or the device
+  pixel ratio changes. Each piece drawn from a valid atlas counts as a
+  hit, while each rebuild counts a miss for each piece placed in it.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, *args, **kwargs) -> None:
+    self._atlas = None
+    self._cellSize = 0
+    self._devicePixelRatio = 0.
+    self._sourceRects = [QRectF()] * 13
+    self._hits = 0
+    self._misses = 0
+    self._rebuilds = 0
+
+  def _rebuild(self, cellSize: int, devicePixelRatio: float) -> NoReturn:
+    """Renders each piece smoothly scaled into its cell of the atlas"""
+    atlas = QPixmap(13 * cellSize, cellSize)
+    atlas.fill(QColor(0, 0, 0, 0))
+    painter = QPainter()
+    painter.begin(atlas)
+    for piece in ChessPiece:
+      if piece:
+        pix = piece.getPixmap().scaled(
+          cellSize, cellSize, Qt.AspectRatioMode.KeepAspectRatio,
+          Qt.TransformationMode.SmoothTransformation)
+        painter.drawPixmap((piece.value + 6) * cellSize, 0, pix)
+        self._misses += 1
+    painter.end()
+    self._atlas = atlas
+    self._sourceRects = [
+      QRectF(index * cellSize, 0, cellSize, cellSize) for index in range(13)]
+    self._cellSize = cellSize
+    self._devicePixelRatio = devicePixelRatio
+    self._rebuilds += 1
+
+  def prepare(self, squareSize: float, devicePixelRatio: float) -> NoReturn:
+    """Ensures that the atlas matches the square size in logical pixels
+    and the device pixel ratio"""
+    cellSize = max(int(math.ceil(squareSize * devicePixelRatio)), 1)
+    if cellSize != self._cellSize or (
+        devicePixelRatio != self._devicePixelRatio):
+      self._rebuild(cellSize, devicePixelRatio)
+
+  def drawPiece(self, painter: QPainter, target: QRectF,
+                piece: ChessPiece) -> NoReturn:
+    """Draws the piece in the target rectangle. The atlas must have been
+    prepared."""
+    if self._atlas is None:
+      raise ReadOnlyError('atlas')
+    self._hits += 1
+    painter.drawPixmap(target, self._atlas,
+                       self._sourceRects[piece.value + 6])
+
+  def invalidate(self) -> NoReturn:
+    """Forces a rebuild of the atlas on the next prepare"""
+    self._atlas = None
+    self._cellSize = 0
+
+  def resetCounters(self) -> NoReturn:
+    """Sets the hit, miss and rebuild counters to zero"""
+    self._hits, self._misses, self._rebuilds = 0, 0, 0
+
+  def _getAtlas(self) -> QPixmap:
+    """Getter-function for the atlas pixmap"""
+    return self._atlas
+
+  def _getCellSize(self) -> int:
+    """Getter-function for the side length of the cells in device
+    pixels"""
+    return self._cellSize
+
+  def _getHits(self) -> int:
+    """Getter-function for the number of pieces drawn from the atlas"""
+    return self._hits
+
+  def _getMisses(self) -> int:
+    """Getter-function for the number of pieces scaled into the atlas"""
+    return self._misses
+
+  def _getRebuilds(self) -> int:
+    """Getter-function for the number of times the atlas was built"""
+    return self._rebuilds
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  atlas = property(_getAtlas, _noAcc, _noAcc)
+  cellSize = property(_getCellSize, _noAcc, _noAcc)
+  hits = property(_getHits, _noAcc, _noAcc)
+  misses = property(_getMisses, _noAcc, _noAcc)
+  rebuilds = property(_getRebuilds, _noAcc, _noAcc)
+
+
+#  The atlas shared by all boards in the process
+pieceAtlas = PieceAtlas()
@@ -0,0 +1,105 @@
+"""PieceCursors keeps a cursor for each chess piece scaled to the current
+square size. Grabbing a piece then reuses the cursor instead of loading
+and scaling an image file."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import math
+from typing import Never, NoReturn
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCursor
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from visualchess import ChessPiece
+
+ic.configureOutput(includeContext=True)
+
+
+class PieceCursors:
+  """PieceCursors keeps a cursor for each chess piece scaled to the
+  current square size and device pixel ratio. The cursors of all twelve
+  pieces are created again whenever the size or the device pixel ratio
+  changes, such that grabbing a piece never waits for one. The hot spot
+  is at the center of the piece.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, *args, **kwargs) -> None:
+    self._cursors = {}
+    self._cellSize = 0
+    self._devicePixelRatio = 0.
+    self._hits = 0
+    self._misses = 0
+
+  def prepare(self, squareSize: float, devicePixelRatio: float) -> NoReturn:
+    """Ensures that the cursors match the square size in logical pixels
+    and the device pixel ratio. On a change, the cursor of every piece is
+    created at the new size."""
+    cellSize = max(int(math.ceil(squareSize * devicePixelRatio)), 1)
+    if cellSize != self._cellSize or (
+        devicePixelRatio != self._devicePixelRatio):
+      self._cellSize = cellSize
+      self._devicePixelRatio = devicePixelRatio
+      self._cursors = {}
+      for piece in ChessPiece:
+        if piece:
+          self._cursors[piece.value] = self._createCursor(piece)
+          self._misses += 1
+
+  def _createCursor(self, piece: ChessPiece) -> QCursor:
+    """Creates the cursor of the piece at the prepared size"""
+    cellSize = max(self._cellSize, 1)
+    pix = piece.getPixmap().scaled(
+      cellSize, cellSize, Qt.AspectRatioMode.KeepAspectRatio,
+      Qt.TransformationMode.SmoothTransformation)
+    pix.setDevicePixelRatio(self._devicePixelRatio or 1.)
+    return QCursor(pix, -1, -1)
+
+  def getCursor(self, piece: ChessPiece) -> QCursor:
+    """Getter-function for the cursor of the given piece"""
+    cursor = self._cursors.get(piece.value)
+    if cursor is None:
+      self._misses += 1
+      cursor = self._cursors.setdefault(
+        piece.value, self._createCursor(piece))
+    else:
+      self._hits += 1
+    return cursor
+
+  def invalidate(self) -> NoReturn:
+    """Discards the cursors such that they are created again on the next
+    prepare"""
+    self._cursors = {}
+    self._cellSize = 0
+
+  def resetCounters(self) -> NoReturn:
+    """Sets the hit and miss counters to zero"""
+    self._hits, self._misses = 0, 0
+
+  def _getCellSize(self) -> int:
+    """Getter-function for the side length of the cursors in device
+    pixels"""
+    return self._cellSize
+
+  def _getHits(self) -> int:
+    """Getter-function for the number of cursors reused"""
+    return self._hits
+
+  def _getMisses(self) -> int:
+    """Getter-function for the number of cursors created"""
+    return self._misses
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  cellSize = property(_getCellSize, _noAcc, _noAcc)
+  hits = property(_getHits, _noAcc, _noAcc)
+  misses = property(_getMisses, _noAcc, _noAcc)
+
+
+#  The cursors shared by all boards in the process
+pieceCursors = PieceCursors()
@@ -11,10 +11,14 @@ from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QMouseEvent, QPaintEvent, QPainter, QEnterEvent
 from PySide6.QtGui import QKeyEvent
 from icecream import ic
+from worktoy.typetools import TypeBag
 
-from visualchess import ChessPiece, Square, BoardLayout
+from visualchess import ChessPiece, Square
 from visualchess import _PieceGrabbingOperations
+from visualchess import BoardLayout
+from visualchess._boardpainting import paintPieces
 from workside.styles import hoveredSquareStyle
+from workside.widgets import CoreWidget
 
 ic.configureOutput(includeContext=True)
 
@@ -51,6 +55,7 @@ class PieceGrabbing(_PieceGrabbingOperations):
     # |  When leaving the board rectangle, no square or piece should
     # |  remain hovered. This is handled by the leave method.
     # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    self._pendingPoint = None
     self.delHoverSquare() or self.delHoverPiece()
     if event.type() == QEvent.Type.Leave:
       return super().leaveEvent(event)
@@ -67,49 +72,21 @@ class PieceGrabbing(_PieceGrabbingOperations):
 
   def mouseMoveEvent(self, event: QMouseEvent) -> NoReturn:
     """The mouse layout subclass brings the hover functionality."""
-    # <*********************** Setting Hover False ***********************> #
+    # <************************ Same Square Moves ************************> #
     # ____________________________________________________________________
-    # |  This is the case where the mouse has left the board rectangle. It
-    # |  is triggered, the first time a move event cannot register the
-    # |  event position in the board rectangle, but where the board hover
-    # |  flag is still True.
-    # |  In this case, the following happens:
-    # |   - The board hover flag is set to False
-    # |   - The mouse event received is passed on to the leave event
-    # |  method
-    # |   - The function returns None
+    # |  Moves staying on the hovered square change nothing and return
+    # |  at once. Remaining moves are coalesced such that only the most
+    # |  recent is processed at each refresh of the display. Any pending
+    # |  move made redundant by returning to the hovered square is
+    # |  dropped.
     # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
-    boardRect = self.getBoardRect()
     point = event.position()
-    if not boardRect.contains(point):
-      self.getBoardState().leaveBoard()
-      self.getBoardState().soundGainFocus.play()
-      return self.update()
-    # <************************ Setting Hover True ***********************> #
-    # ____________________________________________________________________
-    # |  This is the case where the mouse enters the board. It is
-    # |  triggered whenever the move event registers the event position in
-    # |  the board rectangle, but where the board hover flag is still
-    # |  False.
-    # |  The following happens:
-    # |   - The board hover flag is set to True  - The event is
-    # |  converted to an enter event
-    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
-
-    # <*************************** Hover Square **************************> #
-    # ____________________________________________________________________
-    # |  Ensures that the hovered square on the board rect matches the
-    # |  square in the property. If a grabbing operation is ongoing, the
-    # |  method returns. If the enter event was set earlier, the event is
-    # |  passed to other enter event method instead.
-    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
-    self.activateHoverSquare(event)
-    # <*************************** Hover Piece ***************************> #
-    # ____________________________________________________________________
-    # |  Matches the hovered piece to the piece currently marked on the
-    # |  property causing an update if necessary. Please note that this
-    # |  step is not reached during grabbing operations.
-    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    square = self.getSquareAt(point)
+    if square and square is self.getBoardState().hoverSquare:
+      self._pendingPoint = None
+      return
+    self.markInput()
+    self.scheduleMove(point)
 
   def mousePressEvent(self, event: QMouseEvent) -> NoReturn:
     """Implementation of mouse press event grabs the piece on the hovered
@@ -123,6 +100,8 @@ class PieceGrabbing(_PieceGrabbingOperations):
     # |  Please note that the grabbing operation completes on the next
     # |  release event, or in case a cancelling right click is received.
     # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    self.markInput()
+    self.flushPendingMove()
     if event.button() == Qt.MouseButton.LeftButton:
       hoverPiece = self.getBoardState().hoverPiece
       if not self.getBoardState().hoverTurn:
@@ -151,9 +130,10 @@ class PieceGrabbing(_PieceGrabbingOperations):
     # |  grabbed piece now appears on the hovered square. If the release
     # |  occurs where no square hovered, the piece returns to its origin.
     # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    self.markInput()
+    self.flushPendingMove()
     if event.button() == Qt.MouseButton.LeftButton:
-      self.completeGrabbing()
-      return self.update()
+      return self.completeGrabbing()
 
     # <***************** Opens Context Menu (Right-Click) ****************> #
     # ____________________________________________________________________
@@ -161,27 +141,32 @@ class PieceGrabbing(_PieceGrabbingOperations):
     # |  instead open a menu.
     # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
 
-  def paintEvent(self, event: QPaintEvent) -> NoReturn:
+  def paintForeground(self, painter: QPainter,
+                      event: QPaintEvent) -> NoReturn:
     """The MouseLayout subclass provides the painting of chess pieces and
     the hovering functionality."""
-    BoardLayout.paintEvent(self, event)
-    painter = QPainter()
-    painter.begin(self)
+    profiler = self.getProfiler()
     hoverSquare = self.getBoardState().hoverSquare
-
+    geometry = self.getGeometry()
     if isinstance(hoverSquare, Square):
       if hoverSquare:
         hoveredSquareStyle @ painter
-        painter.drawRect(hoverSquare @ self.getBoardRect())
-    for (square, piece) in self.getBoardState().items():
-      if isinstance(square, Square):
-        target = square @ self.getBoardRect()
-        if isinstance(piece, ChessPiece):
-          if piece:
-            pix = piece.getPixmap()
-            source = pix.rect().toRectF()
-            painter.drawPixmap(target, pix, source)
-    painter.end()
+        painter.drawRect(geometry.getSquareRect(hoverSquare))
+    if profiler is not None:
+      profiler.lap('hover')
+    paintPieces(painter, geometry, self.getBoardState().core, event.region())
+    if profiler is not None:
+      profiler.lap('pieces')
 
   def keyPressEvent(self, event: QKeyEvent) -> NoReturn:
-    """Key press event implementation"""
+    """Key press event implementation. F12 toggles the profiling
+    overlay. Other keys schedule no paint, so their input is not kept for
+    the latency of the next paint."""
+    self.markInput()
+    if event.key() == Qt.Key.Key_F12:
+      self.toggleProfilingOverlay()
+    else:
+      self.clearInput()
+
+
+Widget = TypeBag(CoreWidget, BoardLayout, PieceGrabbing)
@@ -6,12 +6,11 @@ from __future__ import annotations
 
 from typing import NoReturn
 
-from PySide6.QtCore import QEvent
-from PySide6.QtGui import QMouseEvent
+from PySide6.QtCore import QPointF, QTimer
 from icecream import ic
 
 from visualchess import _PieceGrabbingProperties, ChessPiece
-from visualchess import Square
+from visualchess import Square, Settings
 
 ic.configureOutput(includeContext=True)
 
@@ -25,16 +24,71 @@ class _PieceGrabbingOperations(_PieceGrabbingProperties):
   def __init__(self, *args, **kwargs) -> None:
     _PieceGrabbingProperties.__init__(self, *args, **kwargs)
     self._cancelGrabbingOperation = None
+    self._pendingPoint = None
+    self._moveTimer = QTimer(self)
+    self._moveTimer.setSingleShot(True)
+    self._moveTimer.timeout.connect(self.flushPendingMove)
 
-  def activateHoverSquare(self, event: QMouseEvent) -> NoReturn:
-    """Applies hover to square given by the event if necessary."""
-    point = event.position()
-    boardRect = self.getBoardRect()
-    square = Square.fromPointRect(point, boardRect)
+  def getMoveInterval(self) -> int:
+    """Getter-function for the interval in milliseconds at which mouse
+    moves are processed. This matches the refresh rate of the screen."""
+    screen = self.screen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return max(int(1000 / (rate or Settings.refreshRate)), 1)
+
+  def scheduleMove(self, point: QPointF) -> NoReturn:
+    """Stores the point and processes it on the next refresh of the
+    display. Points arriving before then replace the stored point."""
+    self._pendingPoint = QPointF(point)
+    if not self._moveTimer.isActive():
+      self._moveTimer.start(self.getMoveInterval())
+
+  def flushPendingMove(self) -> NoReturn:
+    """Processes the most recent pending point if any. Mouse button
+    events call this first such that they act on the latest hover."""
+    self._moveTimer.stop()
+    point, self._pendingPoint = self._pendingPoint, None
+    if point is not None:
+      self.applyMovePoint(point)
+
+  def applyMovePoint(self, point: QPointF) -> NoReturn:
+    """Applies a mouse move to the given point. Leaving the board removes
+    the hover, while points on the board hover the square below them."""
+    square = self.getSquareAt(point)
+    # <************************ Setting Hover False **********************> #
+    # ____________________________________________________________________
+    # |  The mouse has left the board rectangle. The hover is removed from
+    # |  the board state and the previously hovered square is repainted.
+    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    if not square:
+      hoverSquare = self.getBoardState().hoverSquare
+      self.getBoardState().leaveBoard()
+      self.getBoardState().soundGainFocus.play()
+      return self.updateSquares(hoverSquare)
+    self.activateHoverSquare(square)
+
+  def activateHoverSquare(self, square: Square) -> NoReturn:
+    """Applies hover to the given square if necessary. Only the
+    previously and the newly hovered squares are repainted and nothing
+    happens while the cursor stays on the same square."""
+    # <*************************** Hover Square **************************> #
+    # ____________________________________________________________________
+    # |  Ensures that the hovered square in the board state matches the
+    # |  square below the cursor. If a grabbing operation is ongoing, only
+    # |  the two squares are repainted.
+    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    oldSquare = self.getBoardState().hoverSquare
+    if square is oldSquare:
+      return
     self.getBoardState().hover(square)
     if self.getBoardState().grabbedPiece:
-      return self.update()
-    piece = self.getBoardState().getPiece(square)
+      return self.updateSquares(oldSquare, square)
+    # <*************************** Hover Piece ***************************> #
+    # ____________________________________________________________________
+    # |  Matches the cursor to the hovered piece. Please note that this
+    # |  step is not reached during grabbing operations.
+    # ¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨¨
+    piece = self.getBoardState().hoverPiece
     if piece:
       if piece.color == self.getBoardState().colorTurn:
         self.setHoverCursor()
@@ -42,17 +96,17 @@ class _PieceGrabbingOperations(_PieceGrabbingProperties):
         self.setForbiddenCursor()
     else:
       self.setNormalCursor()
-    self.update()
+    self.updateSquares(oldSquare, square)
 
   def beginGrabbing(self, piece: ChessPiece, ) -> NoReturn:
     """Operation responsible for starting a grabbing operation."""
     if self.getBoardState().grabPiece():
       self.setPieceCursor(piece)
-    self.update()
+      self.updateSquares(self.getBoardState().grabbedSquare)
 
   def completeGrabbing(self) -> NoReturn:
-    """Completes the grabbing operation"""
+    """Completes the grabbing operation. The board state repaints the
+    squares changed by the move or by cancelling it."""
     if self.getBoardState().grabbedPiece:
       self.getBoardState().applyMove()
       self.setHoverCursor()
-    self.update()
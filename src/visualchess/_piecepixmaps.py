@@ -0,0 +1,59 @@
+"""The piece pixmaps load the images of the chess pieces from disk and
+make cursors from them. They are the Qt side of ChessPiece, kept apart
+such that the board model imports without Qt."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPixmap, QColor, QCursor
+from icecream import ic
+from worktoy.stringtools import stringList
+
+from visualchess import ChessPiece
+
+ic.configureOutput(includeContext=True)
+
+#  Pixmaps loaded from disk keyed by the value of the piece
+_pixmapCache = {}
+#  Counters for the pixmap cache
+pixmapCounters = dict(hits=0, misses=0)
+
+
+def loadPiecePixmap(piece: ChessPiece) -> QPixmap:
+  """Loads the QPixmap representation of the piece from disk"""
+  if not piece.value:
+    pix = QPixmap(64, 64)
+    pix.fill(QColor(0, 0, 0, 0, ))
+    return pix
+  root = os.getenv('CHESSGPT')
+  there = stringList('src, visualchess, chesspieces, images')
+  fileName = '%s.png' % piece.name.lower()
+  filePath = os.path.join(root, *there, fileName)
+  return QPixmap(filePath)
+
+
+def getPiecePixmap(piece: ChessPiece) -> QPixmap:
+  """Getter-function for the QPixmap representation of the piece. Each
+  image is loaded from disk only once per process. Please note that the
+  returned pixmap is shared and should not be painted on."""
+  pix = _pixmapCache.get(piece.value)
+  if pix is None:
+    pixmapCounters['misses'] += 1
+    pix = _pixmapCache.setdefault(piece.value, loadPiecePixmap(piece))
+  else:
+    pixmapCounters['hits'] += 1
+  return pix
+
+
+def getPieceCursor(piece: ChessPiece, point: QPointF = None) -> QCursor:
+  """Generates a QCursor instance of the piece at the given point as hot.
+  The point defaults to origin which is likely safe for most
+  situations."""
+  pix = getPiecePixmap(piece)
+  x, y = -1, -1
+  if isinstance(point, QPointF):
+    x, y = point.x(), point.y()
+  return QCursor(pix, hotX=x, hotY=y)
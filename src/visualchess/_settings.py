@@ -14,6 +14,7 @@ class Settings:
   bezelRatio = 0.08
   squareGap = 2
   boardOutline = 2
+  squareMargin = 2
   cornerRadius = 8
   adjustFontSize = 1 / 600
   origin = QPointF(0, 0)
@@ -23,3 +24,5 @@ class Settings:
   forbiddenCursor = Qt.CursorShape.ForbiddenCursor
   deviceName = 'Razer'
   movingTimeLimit = 200
+  refreshRate = 60
+  overlayInterval = 500
@@ -4,33 +4,19 @@
 from __future__ import annotations
 
 from enum import Enum
-import os
 from typing import TYPE_CHECKING, Never
 
-from PySide6.QtCore import QRect, QRectF, QPointF
 from icecream import ic
-from worktoy.parsing import maybeType
-from worktoy.typetools import TypeBag
 from worktoy.waitaminute import ReadOnlyError, UnexpectedStateError
 
 from visualchess import File, Rank
 
 if TYPE_CHECKING:
-  from visualchess import Widget
+  from PySide6.QtCore import QRectF
+  from visualchess._squarerects import Rect
 
 ic.configureOutput(includeContext=True)
 
-Rect = TypeBag(QRectF, QRect)
-
-
-def guardRect(boardRect: Rect) -> QRectF:
-  """Applies type guarding"""
-  if isinstance(boardRect, QRect):
-    boardRect = boardRect.toRectF()
-  if not isinstance(boardRect, QRectF):
-    raise TypeError
-  return boardRect
-
 
 class Square(Enum):
   """Enum for the chess board squares"""
@@ -108,6 +94,11 @@ class Square(Enum):
     """Getter-function for the rank number"""
     return self.value[1].value
 
+  def getIndex(self, ) -> int:
+    """Getter-function for the bitboard index. A1 is 0, B1 is 1 and so on
+    to H8 at 63. The NULL square has index -1."""
+    return self._index
+
   def _noAcc(self, *_) -> Never:
     """Illegal accessor function"""
     raise ReadOnlyError()
@@ -136,13 +127,10 @@ class Square(Enum):
   def __matmul__(self, other: Rect) -> QRectF:
     """Given a board rectangle, this function returns a QRectF indicating
     the space this square should take up. Please note that this is the
-    full rectangle, not including any gridlines or margins."""
-    if isinstance(other, QRect):
-      return self @ (other.toRectF())
-    if isinstance(other, QRectF):
-      return self._fitInRect(other)
-    if isinstance(other, Widget):
-      return self @ other.getBoardRect()
+    full rectangle, not including any gridlines or margins. This is
+    implemented by the square rectangles of the rendering layer."""
+    from visualchess._squarerects import squareRect
+    return squareRect(self, other)
 
   def __rmatmul__(self, other: Rect) -> QRectF:
     """Support for right matmul"""
@@ -150,63 +138,50 @@ class Square(Enum):
 
   def _fitInRect(self, boardRect: Rect) -> QRectF:
     """Fits in rectangle"""
-    boardRect = guardRect(boardRect)
-    b = boardRect
-    left0, top0, right0, bottom0 = b.left(), b.top(), b.right(), b.bottom()
-    width, height = boardRect.width(), boardRect.height()
-    left = left0 + self.x * width / 8
-    right = right0 - (7 - self.x) * width / 8
-    top = top0 + self.y * height / 8
-    bottom = bottom0 - (7 - self.y) * height / 8
-    leftTop = QPointF(left, top)
-    rightBottom = QPointF(right, bottom)
-    return QRectF(leftTop, rightBottom)
+    from visualchess._squarerects import fitSquareInRect
+    return fitSquareInRect(self, boardRect)
 
   @classmethod
   def fromFileRank(cls, file: File, rank: Rank) -> Square:
     """Returns the instance of matching file and rank"""
+    if not (file and rank):
+      return Square.NULL
     try:
-      if not (file and rank):
-        return Square.NULL
-      for square in Square:
-        if square.value[0] == file and square.value[1] == rank:
-          return square
-    except RecursionError as e:
-      print(e)
-      os.abort()
-    raise TypeError
+      return _squareTable[8 * file.value + rank.value]
+    except (AttributeError, IndexError):
+      raise TypeError
 
   @classmethod
   def fromInts(cls, x: int, y: int) -> Square:
     """Returns the instance of matching ints"""
-    file = File.fromValue(x)
-    rank = Rank.fromValue(y)
-    return cls.fromFileRank(file, rank)
+    if -1 < x < 8 and -1 < y < 8:
+      return _squareTable[8 * x + y]
+    return Square.NULL
 
   @classmethod
   def fromStr(cls, code: str) -> Square:
     """Returns a square from short Name such as E4"""
     if len(code) != 2:
       raise ValueError()
-    fileStr, rankStr = code[0], code[1]
-    file = File.fromStr(fileStr)
-    rank = Rank.fromStr(rankStr)
-    return cls.fromFileRank(file, rank)
+    square = _squareNames.get(code.upper(), None)
+    if square is None:
+      raise TypeError
+    return square
+
+  @classmethod
+  def fromIndex(cls, index: int) -> Square:
+    """Returns the instance at the given bitboard index"""
+    if -1 < index < 64:
+      return _indexTable[index]
+    return Square.NULL
 
   @classmethod
   def fromPointRect(cls, *args) -> Square:
     """Finds the square that would contain given point if squares were
-    distributed on given rect"""
-    rect = maybeType(QRectF, *args)
-    point = maybeType(QPointF, *args)
-    if isinstance(rect, QRectF) and isinstance(point, QPointF):
-      left0, top0 = rect.left(), rect.top()
-      width, height = rect.width(), rect.height()
-      x, y = point.x() - left0, point.y() - top0
-      fileVal, rankVal = int(x / width * 8), int(y / height * 8)
-      return cls.fromInts(fileVal, rankVal)
-    else:
-      raise TypeError
+    distributed on given rect. This is implemented by the square
+    rectangles of the rendering layer."""
+    from visualchess._squarerects import squareAtPoint
+    return squareAtPoint(*args)
 
   @classmethod
   def getCorners(cls) -> list[Square]:
@@ -324,6 +299,7 @@ class Square(Enum):
     return self + 1j
 
   x = property(getX, _noAcc, _noAcc)
+  index = property(getIndex, _noAcc, _noAcc)
   y = property(getY, _noAcc, _noAcc)
   file = property(_getFile, _noAcc, _noAcc)
   rank = property(_getRank, _noAcc, _noAcc)
@@ -331,3 +307,14 @@ class Square(Enum):
   front = property(_getInFront, _noAcc, _noAcc)
   left = property(_getLeft, _noAcc, _noAcc)
   behind = property(_getBehind, _noAcc, _noAcc)
+
+
+#  Lookup tables built once at import. The square table is indexed by
+#  8 * x + y which is the same value returned by Square.__hash__. The index
+#  table is indexed by the bitboard index running from A1 to H8 rank by rank.
+_squareTable = tuple(sorted([s for s in Square if s], key=hash))
+_squareNames = {square.name: square for square in _squareTable}
+_indexTable = tuple(sorted(_squareTable, key=lambda s: (7 - s.y) * 8 + s.x))
+for (_index, _square) in enumerate(_indexTable):
+  _square._index = _index
+Square.NULL._index = -1
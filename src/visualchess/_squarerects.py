@@ -0,0 +1,69 @@
+"""The square rectangles place the squares of the board in Qt rectangles
+and find the square under a point. They are the Qt side of Square, kept
+apart such that the board model imports without Qt."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from PySide6.QtCore import QRect, QRectF, QPointF
+from icecream import ic
+from worktoy.parsing import maybeType
+from worktoy.typetools import TypeBag
+
+from visualchess import Square
+
+ic.configureOutput(includeContext=True)
+
+Rect = TypeBag(QRectF, QRect)
+
+
+def guardRect(boardRect: Rect) -> QRectF:
+  """Applies type guarding"""
+  if isinstance(boardRect, QRect):
+    boardRect = boardRect.toRectF()
+  if not isinstance(boardRect, QRectF):
+    raise TypeError
+  return boardRect
+
+
+def fitSquareInRect(square: Square, boardRect: Rect) -> QRectF:
+  """Returns the rectangle the square takes up when the squares are
+  distributed on the board rectangle. Please note that this is the full
+  rectangle, not including any gridlines or margins."""
+  b = guardRect(boardRect)
+  left0, top0, right0, bottom0 = b.left(), b.top(), b.right(), b.bottom()
+  width, height = b.width(), b.height()
+  left = left0 + square.x * width / 8
+  right = right0 - (7 - square.x) * width / 8
+  top = top0 + square.y * height / 8
+  bottom = bottom0 - (7 - square.y) * height / 8
+  leftTop = QPointF(left, top)
+  rightBottom = QPointF(right, bottom)
+  return QRectF(leftTop, rightBottom)
+
+
+def squareRect(square: Square, other: Rect) -> QRectF:
+  """Returns the rectangle of the square on the given board rectangle or
+  on the board rectangle of the given widget"""
+  if isinstance(other, QRect):
+    return fitSquareInRect(square, other.toRectF())
+  if isinstance(other, QRectF):
+    return fitSquareInRect(square, other)
+  from visualchess import Widget
+  if isinstance(other, Widget):
+    return fitSquareInRect(square, other.getBoardRect())
+
+
+def squareAtPoint(*args) -> Square:
+  """Finds the square that would contain given point if squares were
+  distributed on given rect"""
+  rect = maybeType(QRectF, *args)
+  point = maybeType(QPointF, *args)
+  if isinstance(rect, QRectF) and isinstance(point, QPointF):
+    left0, top0 = rect.left(), rect.top()
+    width, height = rect.width(), rect.height()
+    x, y = point.x() - left0, point.y() - top0
+    fileVal, rankVal = int(x / width * 8), int(y / height * 8)
+    return Square.fromInts(fileVal, rankVal)
+  else:
+    raise TypeError
@@ -0,0 +1,66 @@
+"""The Zobrist keys assign a random 64-bit number to each piece code on
+each square, to the side to move, to each set of castling rights and to
+each en passant file. The key of a position is the exclusive or of the
+numbers present, which allows it to be updated incrementally when a
+single square, the turn or the rights change."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from random import Random
+from typing import TYPE_CHECKING
+
+from icecream import ic
+
+if TYPE_CHECKING:
+  from visualchess import BoardCore
+
+ic.configureOutput(includeContext=True)
+
+#  A fixed seed keeps the keys identical between sessions such that keys
+#  may be stored in position databases.
+_random = Random(0x2023C0DE)
+
+
+def _randomKeys(n: int) -> tuple[int, ...]:
+  """Returns n random 64-bit numbers"""
+  return tuple(_random.getrandbits(64) for _ in range(n))
+
+
+#  Indexed by piece code and then square index. Code 0 is the empty
+#  square and has only zeros.
+zobristPieces = ((0,) * 64, *(_randomKeys(64) for _ in range(12)))
+#  Included when black is to move
+zobristTurn = _randomKeys(1)[0]
+_castlingBits = _randomKeys(4)
+_fileKeys = _randomKeys(8)
+
+
+def _castlingKey(rights: int) -> int:
+  """Returns the key of the given castling rights as the exclusive or of
+  the key of each right present"""
+  out = 0
+  for (bit, key) in enumerate(_castlingBits):
+    out ^= key if rights & (1 << bit) else 0
+  return out
+
+
+#  Indexed by the castling rights as bits
+zobristCastling = tuple(_castlingKey(rights) for rights in range(16))
+#  Indexed by the index of the en passant square. Only the file enters
+#  the key. The last entry is 0, such that the index -1 indicating no en
+#  passant square may be used directly.
+zobristEnPassant = (*(_fileKeys[index & 7] for index in range(64)), 0)
+
+
+def zobristHash(core: BoardCore, turn: int, castling: int,
+                enPassant: int) -> int:
+  """Computes the key of the position from scratch. The turn is 0 for
+  white and 1 for black and the en passant square is given by index or
+  -1. This is intended for verification, as the board state maintains
+  its key incrementally."""
+  out = zobristCastling[castling] ^ zobristEnPassant[enPassant]
+  out ^= zobristTurn if turn else 0
+  for (index, code) in enumerate(core.mailbox):
+    out ^= zobristPieces[code][index]
+  return out
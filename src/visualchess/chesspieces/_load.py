@@ -5,11 +5,11 @@ from __future__ import annotations
 
 import os
 from typing import TYPE_CHECKING
-from PIL import Image, ImageQt
-from PySide6.QtGui import QPixmap
 from icecream import ic
 
 if TYPE_CHECKING:
+  from PIL import Image, ImageQt
+  from PySide6.QtGui import QPixmap
   from visualchess import Piece, ChessColor
 
 ic.configureOutput(includeContext=True)
@@ -47,13 +47,16 @@ class Load:
     inserted by the rest of the PySide6 widget framework"""
     #  MIT Licence
     #  Copyright (c) 2023 Asger Jon Vistisen
+    from PIL import Image
     with Image.open(self.getImageFilePath()) as image:
       return image
 
   def loadPieceImageQt(self, ) -> ImageQt:
     """As ImageQt"""
+    from PIL import ImageQt
     return ImageQt.ImageQt(self.loadPiecePIL())
 
   def loadPieceQPixmap(self) -> QPixmap:
     """As QPixmap"""
+    from PySide6.QtGui import QPixmap
     return QPixmap(self.loadPieceImageQt())
@@ -1,9 +1,32 @@
 """The audio package contains functionality for inclusion of audio
-effects."""
+effects. The classes depending on QtMultimedia are imported when first
+accessed, such that the package can be used without an audio device."""
 #  MIT Licence
 #  Copyright (c) 2023 Asger Jon Vistisen
 from __future__ import annotations
 
+import importlib
+
 from ._settings import Settings
-from ._soundeffect import SoundEffect
+from ._audiobackend import AudioBackend, NullAudioBackend
+from ._audiobackend import RecordingAudioBackend, QtAudioBackend
+from ._audiobackend import getAudioBackend, setAudioBackend
 from ._soundenum import Sound
+
+#  The names depending on QtMultimedia and the modules defining them
+_multimediaNames = {
+  'SoundEffect': '._soundeffect',
+  'VoicePool': '._voicepool',
+  'SoundBank': '._soundbank',
+  'soundBank': '._soundbank',
+}
+
+
+def __getattr__(name: str) -> object:
+  """Imports the names depending on QtMultimedia when first accessed"""
+  if name in _multimediaNames:
+    module = importlib.import_module(_multimediaNames[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+  raise AttributeError('module %s has no attribute %s' % (__name__, name))
@@ -0,0 +1,175 @@
+"""The audio backend decides what happens when a sound is played. The Qt
+backend plays the sound on the output device through the sound bank. The
+null backend does nothing and the recording backend logs each event with
+its timestamp, such that processes without an audio device never import
+QtMultimedia."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import time
+from typing import Never, NoReturn, TYPE_CHECKING
+
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from workside.audio import Settings
+
+if TYPE_CHECKING:
+  from workside.audio import Sound
+
+ic.configureOutput(includeContext=True)
+
+
+class AudioBackend:
+  """AudioBackend is the base class of the audio backends. Subclasses
+  reimplement preload and play.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  name = 'base'
+
+  def __init__(self, *args, **kwargs) -> None:
+    pass
+
+  def preload(self, folder: str) -> NoReturn:
+    """Prepares the sounds in the folder for playing"""
+
+  def play(self, sound: Sound) -> NoReturn:
+    """Plays the sound"""
+
+  def __str__(self) -> str:
+    """String representation"""
+    return '%s audio backend' % self.name
+
+  def __repr__(self) -> str:
+    """Code Representation"""
+    return '%s()' % self.__class__.__name__
+
+
+class NullAudioBackend(AudioBackend):
+  """NullAudioBackend ignores every sound.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  name = 'null'
+
+
+class RecordingAudioBackend(AudioBackend):
+  """RecordingAudioBackend plays nothing, but records every event as a
+  dictionary with the name of the event, the name of the sound and the
+  seconds since the recording began.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  name = 'recording'
+
+  def __init__(self, *args, **kwargs) -> None:
+    AudioBackend.__init__(self, *args, **kwargs)
+    self._events = []
+    self._start = time.perf_counter()
+
+  def _record(self, event: str, sound: str) -> NoReturn:
+    """Appends the event to the recording"""
+    self._events.append(dict(
+      event=event, sound=sound, time=time.perf_counter() - self._start))
+
+  def preload(self, folder: str) -> NoReturn:
+    """Records the preload"""
+    self._record('preload', folder)
+
+  def play(self, sound: Sound) -> NoReturn:
+    """Records the sound played"""
+    self._record('play', sound.name)
+
+  def clear(self) -> NoReturn:
+    """Discards the recorded events and begins the recording again"""
+    self._events = []
+    self._start = time.perf_counter()
+
+  def _getEvents(self) -> list[dict]:
+    """Getter-function for the recorded events"""
+    return [*self._events]
+
+  def _getPlayed(self) -> list[str]:
+    """Getter-function for the names of the sounds played in order"""
+    return [event['sound'] for event in self._events
+            if event['event'] == 'play']
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  events = property(_getEvents, _noAcc, _noAcc)
+  played = property(_getPlayed, _noAcc, _noAcc)
+
+
+class QtAudioBackend(AudioBackend):
+  """QtAudioBackend plays the sounds through the voice pools of the sound
+  bank. QtMultimedia is imported when the backend is created.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  name = 'qt'
+
+  def __init__(self, *args, **kwargs) -> None:
+    AudioBackend.__init__(self, *args, **kwargs)
+    from workside.audio._soundbank import soundBank
+    self._soundBank = soundBank
+
+  def preload(self, folder: str) -> NoReturn:
+    """Starts preloading the sounds in the sound bank"""
+    self._soundBank.preload(folder)
+
+  def play(self, sound: Sound) -> NoReturn:
+    """Plays the sound on the next free voice"""
+    self._soundBank.getPool(sound.name, sound.filePath).play()
+
+  def _getSoundBank(self) -> object:
+    """Getter-function for the sound bank"""
+    return self._soundBank
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  soundBank = property(_getSoundBank, _noAcc, _noAcc)
+
+
+audioBackends = {backend.name: backend for backend in
+                 [NullAudioBackend, RecordingAudioBackend, QtAudioBackend]}
+
+#  The backend playing every sound in the process
+_audioBackend = None
+
+
+def _createBackend(name: str) -> AudioBackend:
+  """Creates the backend of the given name"""
+  if name not in audioBackends:
+    msg = """Unknown audio backend: %s! Expected one of: %s"""
+    raise NameError(msg % (name, ', '.join(audioBackends)))
+  return audioBackends[name]()
+
+
+def getAudioBackend() -> AudioBackend:
+  """Returns the audio backend. If none is set, it is created from the
+  name in the WORKSIDE_AUDIO_BACKEND environment variable, defaulting to
+  the name in the settings."""
+  global _audioBackend
+  if _audioBackend is None:
+    name = os.getenv('WORKSIDE_AUDIO_BACKEND') or Settings.backend
+    _audioBackend = _createBackend(name)
+  return _audioBackend
+
+
+def setAudioBackend(backend: AudioBackend | str) -> AudioBackend:
+  """Sets the audio backend given as an instance or by name and returns
+  it"""
+  global _audioBackend
+  if isinstance(backend, str):
+    backend = _createBackend(backend)
+  if not isinstance(backend, AudioBackend):
+    raise TypeError
+  _audioBackend = backend
+  return backend
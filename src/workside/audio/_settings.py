@@ -18,3 +18,5 @@ class Settings:
   #  Copyright (c) 2023 Asger Jon Vistisen"""
 
   deviceName = 'razer'
+  polyphony = 4
+  backend = 'qt'
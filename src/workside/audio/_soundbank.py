@@ -0,0 +1,184 @@
+"""SoundBank holds a pool of voices for every wave file in a folder. The
+output device is resolved once, the files are decoded on a background
+thread at startup and the voice pools are created on the thread of the
+application as each file is decoded, such that playing a sound never
+waits for either."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import os
+import threading
+import time
+import wave
+from typing import Never, NoReturn
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtMultimedia import QAudioDevice, QMediaDevices, QSoundEffect
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from workside.audio import SoundEffect, VoicePool
+
+ic.configureOutput(includeContext=True)
+
+
+class SoundBank(QObject):
+  """SoundBank maps the names of sounds to pools of preloaded voices.
+  The name of a sound is the name of its file without the extension. For
+  each sound the bank records the milliseconds spent decoding the file,
+  the milliseconds spent creating the voices and the milliseconds from
+  the creation until the first voice is ready to play.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  decoded = Signal(str, str)
+  loaded = Signal()
+
+  def __init__(self, *args, **kwargs) -> None:
+    QObject.__init__(self)
+    self._device = None
+    self._pools = {}
+    self._metrics = {}
+    self._lock = threading.Lock()
+    self._thread = None
+    self._pending = 0
+    self._preloadStart = None
+    self._loadTime = None
+    self.decoded.connect(self._handleDecoded)
+
+  def resolveDevice(self) -> QAudioDevice:
+    """Returns the output device named in the settings, or the default
+    output device if none matches. The devices are enumerated only the
+    first time."""
+    if self._device is None:
+      try:
+        self._device = SoundEffect.getOutputDeviceByName()
+      except NameError:
+        self._device = QMediaDevices.defaultAudioOutput()
+    return self._device
+
+  def preload(self, folder: str) -> NoReturn:
+    """Starts decoding every wave file in the folder on a background
+    thread. The voices of each sound are created when its file has been
+    decoded. Calling this again while the files are decoded does
+    nothing."""
+    if self._thread is not None and self._thread.is_alive():
+      return
+    self.resolveDevice()
+    filePaths = [os.path.join(folder, file) for file in os.listdir(folder)
+                 if os.path.splitext(file)[1] == '.wav']
+    self._pending = len(filePaths)
+    self._preloadStart = time.perf_counter()
+    self._loadTime = None
+    self._thread = threading.Thread(
+      target=self._decodeAll, args=(sorted(filePaths),), daemon=True)
+    self._thread.start()
+
+  def _decodeAll(self, filePaths: list[str]) -> NoReturn:
+    """Decodes the files and emits the decoded signal for each. This runs
+    on the background thread."""
+    for filePath in filePaths:
+      name = os.path.splitext(os.path.basename(filePath))[0]
+      tic = time.perf_counter()
+      entry = dict(decode=None, create=None, ready=None, frames=0,
+                   seconds=0., error=None)
+      try:
+        with wave.open(filePath, 'rb') as file:
+          frames = file.readframes(file.getnframes())
+          entry['frames'] = file.getnframes()
+          entry['seconds'] = file.getnframes() / file.getframerate()
+        entry['bytes'] = len(frames)
+      except (OSError, EOFError, wave.Error) as e:
+        entry['error'] = str(e)
+      entry['decode'] = 1000 * (time.perf_counter() - tic)
+      with self._lock:
+        self._metrics[name] = {**self._metrics.get(name, {}), **entry}
+      self.decoded.emit(name, filePath)
+
+  def _handleDecoded(self, name: str, filePath: str) -> NoReturn:
+    """Creates the voices of the decoded file unless they were created
+    already. Emits the loaded signal after the last file."""
+    if name not in self._pools and self._metrics[name]['error'] is None:
+      self._createPool(name, filePath)
+    self._pending -= 1
+    if not self._pending:
+      self._loadTime = 1000 * (time.perf_counter() - self._preloadStart)
+      self.loaded.emit()
+
+  def _createPool(self, name: str, filePath: str) -> VoicePool:
+    """Creates the voice pool and records the time taken"""
+    tic = time.perf_counter()
+    pool = VoicePool(self.resolveDevice(), filePath, self)
+    pool.voices[0].statusChanged.connect(lambda: self._handleStatus(name))
+    self._pools[name] = pool
+    with self._lock:
+      entry = self._metrics.setdefault(name, dict(decode=None, error=None))
+      entry['create'] = 1000 * (time.perf_counter() - tic)
+      entry['ready'] = None
+      entry['created'] = time.perf_counter()
+    self._handleStatus(name)
+    return pool
+
+  def _handleStatus(self, name: str) -> NoReturn:
+    """Records the time until the first voice of the name is ready"""
+    pool = self._pools.get(name)
+    if pool is None or pool.voices[0].status() != QSoundEffect.Status.Ready:
+      return
+    with self._lock:
+      entry = self._metrics[name]
+      if entry.get('ready') is None:
+        entry['ready'] = 1000 * (time.perf_counter() - entry['created'])
+
+  def getPool(self, name: str, filePath: str) -> VoicePool:
+    """Returns the voice pool of the name. If it has not been preloaded
+    yet, it is created from the file now."""
+    pool = self._pools.get(name)
+    if pool is None:
+      pool = self._createPool(name, filePath)
+    return pool
+
+  def getEffect(self, name: str, filePath: str) -> SoundEffect:
+    """Returns the first voice of the name"""
+    return self.getPool(name, filePath).voices[0]
+
+  def setPolyphony(self, polyphony: int) -> NoReturn:
+    """Sets the maximum polyphony of every voice pool created"""
+    for pool in self._pools.values():
+      pool.setPolyphony(polyphony)
+
+  def wait(self, timeout: float = None) -> bool:
+    """Blocks until the files are decoded and returns True if they are.
+    The voices are created once the events are processed."""
+    if self._thread is not None:
+      self._thread.join(timeout)
+      return not self._thread.is_alive()
+    return True
+
+  def _getMetrics(self) -> dict[str, dict]:
+    """Getter-function for the load-time metrics of each sound"""
+    with self._lock:
+      return {name: {key: val for (key, val) in entry.items()
+                     if key != 'created'}
+              for (name, entry) in self._metrics.items()}
+
+  def _getLoadTime(self) -> float:
+    """Getter-function for the milliseconds from the start of the preload
+    until every voice pool was created. This is None until then."""
+    return self._loadTime
+
+  def _getNames(self) -> list[str]:
+    """Getter-function for the names of the created voice pools"""
+    return [*self._pools.keys()]
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  metrics = property(_getMetrics, _noAcc, _noAcc)
+  loadTime = property(_getLoadTime, _noAcc, _noAcc)
+  names = property(_getNames, _noAcc, _noAcc)
+
+
+#  The sound bank shared by all sounds in the process
+soundBank = SoundBank()
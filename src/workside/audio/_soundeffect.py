@@ -47,8 +47,9 @@ class _SoundEffectProperties(QSoundEffect):
     if isinstance(deviceKwarg, str):
       deviceKwarg = cls.getOutputDeviceByName(deviceKwarg)
     deviceArg = maybeType(QAudioDevice, *args)
-    deviceDefault = cls.getOutputDeviceByName()
-    device = maybe(deviceKwarg, deviceArg, deviceDefault)
+    device = maybe(deviceKwarg, deviceArg)
+    if device is None:
+      device = cls.getOutputDeviceByName()
     if isinstance(device, QAudioDevice):
       return device
     raise TypeError
@@ -4,19 +4,19 @@
 from __future__ import annotations
 
 import os
-from typing import Never, NoReturn
+from typing import Never, NoReturn, TYPE_CHECKING
 
-from PySide6.QtCore import QUrl, QObject
-from PySide6.QtWidgets import QApplication
 from icecream import ic
-from worktoy.core import maybe
 from worktoy.parsing import extractArg
 from worktoy.stringtools import stringList
 from worktoy.waitaminute import ReadOnlyError
 
 from moreworktoy import Iterify
-from workside.audio import SoundEffect, Settings
-from workside.widgets import CoreWidget
+from workside.audio import getAudioBackend
+
+if TYPE_CHECKING:
+  from PySide6.QtCore import QUrl
+  from workside.audio import SoundEffect, VoicePool
 
 ic.configureOutput(includeContext=True)
 
@@ -36,28 +36,26 @@ class _SoundProperties(Iterify):
     return os.path.join(root, there)
 
   def __init__(self, *args, **kwargs) -> None:
-    parent = CoreWidget.parseParent(*args, **kwargs)
-    self._parent = maybe(parent, QApplication.instance())
     self._name = None
     self._soundEffect = None
     self._fileName = None
     self._url = None
 
-  def _getParent(self) -> CoreWidget:
-    """Getter-function for the parent widget"""
-    if isinstance(self._parent, QObject):
-      return self._parent
-    return QApplication.instance()
-
   def _createSoundEffect(self) -> NoReturn:
-    """Creator-function for the sound effect"""
-    self._soundEffect = SoundEffect(
-      self._getParent(), Settings.deviceName)
-    self._soundEffect.setLoopCount(1)
-    self._soundEffect.setSource(self.url)
+    """Creator-function for the sound effect. The sound effect is taken
+    from the sound bank, which creates it now if it was not preloaded."""
+    from workside.audio import soundBank
+    self._soundEffect = soundBank.getEffect(self.name, self.filePath)
+
+  def _getVoicePool(self) -> VoicePool:
+    """Getter-function for the pool of voices playing the sound"""
+    from workside.audio import soundBank
+    return soundBank.getPool(self.name, self.filePath)
 
   def _getSoundEffect(self) -> SoundEffect:
-    """Getter-function for the sound effect"""
+    """Getter-function for the sound effect. This is the first voice of
+    the pool."""
+    from workside.audio import SoundEffect
     if self._soundEffect is None:
       self._createSoundEffect()
       return self._getSoundEffect()
@@ -96,6 +94,7 @@ class _SoundProperties(Iterify):
 
   def _createUrl(self) -> NoReturn:
     """Creator function for the url"""
+    from PySide6.QtCore import QUrl
     self._url = QUrl.fromLocalFile(self._getFilePath())
 
   def _getUrl(self) -> QUrl:
@@ -111,11 +110,16 @@ class _SoundProperties(Iterify):
     """Illegal setter-function"""
     raise ReadOnlyError('url')
 
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
   name = property(_getName, _setName, _setName)
   fileName = property(_getFileName, _setFileName, _setFileName)
   url = property(_getUrl, _setUrl, _setUrl)
   filePath = property(_getFilePath, _setFilePath, _setFilePath)
   effect = property(_getSoundEffect, _setSoundEffect, _setSoundEffect, )
+  voicePool = property(_getVoicePool, _noAcc, _noAcc)
 
 
 class Sound(_SoundProperties):
@@ -134,6 +138,12 @@ class Sound(_SoundProperties):
         instance = cls(name_)
         setattr(cls, name_, instance)
 
+  @classmethod
+  def preloadAll(cls) -> NoReturn:
+    """Has the audio backend preload every wave file in the folder given
+    by soundPath"""
+    getAudioBackend().preload(cls._getSoundPath())
+
   @staticmethod
   def _parseArguments(*args, **kwargs) -> str:
     """Parses the arguments to name"""
@@ -167,8 +177,8 @@ class Sound(_SoundProperties):
     """Handler function for the play signal emitted by the sound board."""
 
   def play(self) -> NoReturn:
-    """Triggers the sound effect"""
-    self.effect.play()
+    """Plays the sound through the audio backend"""
+    getAudioBackend().play(self)
 
   def __str__(self, ) -> str:
     """String representation"""
@@ -180,5 +190,5 @@ class Sound(_SoundProperties):
     return """SoundEffect.%s""" % self.name
 
   def __call__(self) -> NoReturn:
-    """Triggers the sound effect"""
-    self.effect.play()
+    """Plays the sound through the audio backend"""
+    getAudioBackend().play(self)
@@ -0,0 +1,116 @@
+"""VoicePool plays one sound through several sound effects, such that
+playing the sound again before it has finished starts another voice
+instead of cutting off or waiting for the one already playing."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+import time
+from typing import Never, NoReturn
+
+from PySide6.QtCore import QObject, QUrl
+from PySide6.QtMultimedia import QAudioDevice
+from icecream import ic
+from worktoy.core import maybe
+from worktoy.waitaminute import ReadOnlyError
+
+from workside.audio import SoundEffect, Settings
+
+ic.configureOutput(includeContext=True)
+
+
+class VoicePool:
+  """VoicePool holds up to the given polyphony of sound effects loaded
+  from the same file. Voices are allocated round-robin among those not
+  playing. When every voice is playing, the voice started the longest
+  time ago is stopped and started again.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, device: QAudioDevice, filePath: str,
+               parent: QObject, polyphony: int = None) -> None:
+    self._device = device
+    self._url = QUrl.fromLocalFile(filePath)
+    self._parent = parent
+    self._voices = []
+    self._started = []
+    self._next = 0
+    self._plays = 0
+    self._steals = 0
+    self.setPolyphony(maybe(polyphony, Settings.polyphony))
+
+  def _createVoice(self) -> SoundEffect:
+    """Creates a voice loaded from the file"""
+    voice = SoundEffect(self._device, self._parent)
+    voice.setLoopCount(1)
+    voice.setSource(self._url)
+    return voice
+
+  def setPolyphony(self, polyphony: int) -> NoReturn:
+    """Sets the maximum number of voices playing at the same time. Voices
+    are created or removed to match."""
+    polyphony = max(int(polyphony), 1)
+    while len(self._voices) < polyphony:
+      self._voices.append(self._createVoice())
+      self._started.append(0.)
+    while len(self._voices) > polyphony:
+      voice = self._voices.pop()
+      self._started.pop()
+      voice.stop()
+      voice.deleteLater()
+    self._next %= polyphony
+
+  def allocate(self) -> int:
+    """Returns the index of the voice to play next. This is the first
+    voice not playing from the round-robin position, or the oldest voice
+    if every voice is playing."""
+    count = len(self._voices)
+    for offset in range(count):
+      index = (self._next + offset) % count
+      if not self._voices[index].isPlaying():
+        return index
+    self._steals += 1
+    return min(range(count), key=lambda i: self._started[i])
+
+  def play(self) -> SoundEffect:
+    """Plays the sound on the allocated voice and returns the voice"""
+    index = self.allocate()
+    voice = self._voices[index]
+    if voice.isPlaying():
+      voice.stop()
+    voice.play()
+    self._started[index] = time.perf_counter()
+    self._next = (index + 1) % len(self._voices)
+    self._plays += 1
+    return voice
+
+  def stop(self) -> NoReturn:
+    """Stops every voice"""
+    for voice in self._voices:
+      voice.stop()
+
+  def _getVoices(self) -> list[SoundEffect]:
+    """Getter-function for the voices"""
+    return [*self._voices]
+
+  def _getPolyphony(self) -> int:
+    """Getter-function for the number of voices"""
+    return len(self._voices)
+
+  def _getPlays(self) -> int:
+    """Getter-function for the number of times the sound was played"""
+    return self._plays
+
+  def _getSteals(self) -> int:
+    """Getter-function for the number of times a playing voice was
+    stopped to play the sound again"""
+    return self._steals
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  voices = property(_getVoices, _noAcc, _noAcc)
+  polyphony = property(_getPolyphony, setPolyphony, _noAcc)
+  plays = property(_getPlays, _noAcc, _noAcc)
+  steals = property(_getSteals, _noAcc, _noAcc)
@@ -6,11 +6,12 @@ from __future__ import annotations
 from icecream import ic
 
 from ._fontfamily import Family
+from ._styleregistry import StyleRegistry, styleRegistry
 from ._basestyle import BaseStyle
 from ._styleinstances import backgroundStyle, labelStyle, headerStyle
 from ._styleinstances import debugStyle, lightSquareStyle, darkSquareStyle
 from ._styleinstances import outlineStyle, textButtonStyle, bezelStyle
 from ._styleinstances import baseButtonStyle, hoverButtonStyle, gridStyle
-from ._styleinstances import hoveredSquareStyle
+from ._styleinstances import hoveredSquareStyle, overlayStyle
 
 ic.configureOutput(includeContext=True)
@@ -7,14 +7,14 @@ from typing import NoReturn, TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QRect, QRectF
 from PySide6.QtGui import QBrush, QFont, QPen, QColor, QPainter, \
-  QFontMetrics, QFontMetricsF
+  QFontMetricsF
 from icecream import ic
 from worktoy.core import maybe
 from worktoy.typetools import TypeBag
 from worktoy.waitaminute import ProceduralError
 
-from workside.settings import Settings
-from workside.styles import Family
+from workside.styles import Family, styleRegistry
+from workside.styles._styleregistry import StyleObjects
 
 if TYPE_CHECKING:
   from workside.widgets import CoreWidget
@@ -44,15 +44,33 @@ class BaseStyle:
       raise TypeError
     self._viewPort = None
     self._name = name
-    self._data = data | BaseStyle._baseValues
     self._data = {}
     for (key, val) in BaseStyle._baseValues.items():
       self._data |= {key: data.get(key, val)}
-    self._fontMetrics = None
+    self._objects = None
 
   def getData(self) -> dict:
-    """Getter-function for data"""
-    return self._data
+    """Getter-function for data. This returns a copy, as changes must go
+    through setValue to reach the cached objects."""
+    return {**self._data}
+
+  def setValue(self, key: str, value: object) -> NoReturn:
+    """Sets the value of the given key and discards the cached objects.
+    The generation of the style registry is advanced, such that layers
+    rendered with the old value are rendered again."""
+    if key not in self._data:
+      raise KeyError(key)
+    self._data[key] = value
+    self._objects = None
+    styleRegistry.advanceGeneration()
+
+  def _getObjects(self) -> StyleObjects:
+    """Getter-function for the pen, brush, font and font metrics. These
+    are fetched from the shared registry on first use and after the data
+    changes."""
+    if self._objects is None:
+      self._objects = styleRegistry.get(self._data)
+    return self._objects
 
   def getViewPort(self) -> QRect:
     """Getter-function for viewport"""
@@ -66,27 +84,11 @@ class BaseStyle:
 
   def getFont(self, ) -> QFont:
     """Getter-function for QFont"""
-    font = self._data.get('fontFamily').asQFont()
-    weight = self._data.get('fontWeight')
-    font.setWeight(weight)
-    viewSize = min(self.getViewPort().width(), self.getViewPort().height())
-    fontSize = self._data.get('fontSize')
-    font.setPointSize(max(fontSize, Settings.minimumFontSize))
-    return font
-
-  def _createFontMetrics(self) -> NoReturn:
-    """Creator-function for font metrics"""
-    self._fontMetrics = QFontMetricsF(self.getFont())
+    return QFont(self._getObjects().font)
 
   def getFontMetrics(self) -> QFontMetricsF:
     """Getter-function for font metrics"""
-    if self._fontMetrics is None:
-      self._createFontMetrics()
-      return self._fontMetrics
-    if isinstance(self._fontMetrics, QFontMetricsF):
-      return self._fontMetrics
-    msg = """Expected front metrics to be of type %s, but received: %s!"""
-    raise TypeError(msg % (QFontMetricsF, type(self._fontMetrics)))
+    return self._getObjects().getFontMetrics()
 
   def getBoundingRect(self, text: str) -> QRectF:
     """Getter-function for bounding rect"""
@@ -94,26 +96,20 @@ class BaseStyle:
 
   def getBrush(self) -> QBrush:
     """Getter-function for QBrush"""
-    brush = QBrush()
-    brush.setStyle(self._data.get('fillStyle'))
-    brush.setColor(self._data.get('fillColor'))
-    return brush
+    return QBrush(self._getObjects().brush)
 
   def getPen(self) -> QPen:
     """Getter-function for QPen"""
-    pen = QPen()
-    pen.setStyle(self._data.get('lineStyle'))
-    pen.setColor(self._data.get('lineColor'))
-    pen.setWidth(self._data.get('lineWidth'))
-    return pen
+    return QPen(self._getObjects().pen)
 
   def __matmul__(self, other: Graphic) -> Graphic:
-    """Applies these settings to the given painter"""
+    """Applies these settings to the given painter. The cached objects
+    are passed directly, as the painter keeps its own copies."""
     if isinstance(other, QPainter):
-      self.setViewPort(other.viewport())
-      other.setPen(self.getPen())
-      other.setFont(self.getFont())
-      other.setBrush(self.getBrush())
+      objects = self._getObjects()
+      other.setPen(objects.pen)
+      other.setFont(objects.font)
+      other.setBrush(objects.brush)
       return other
     return NotImplemented
 
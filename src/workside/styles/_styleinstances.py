@@ -154,6 +154,16 @@ _textButton = dict(
   fontSize=14
   ,
 )
+_overlayData = dict(
+  fillColor=QColor(0, 0, 0, 191, ),
+  fillStyle=Qt.BrushStyle.SolidPattern,
+  lineColor=QColor(223, 255, 223, 255),
+  lineStyle=Qt.PenStyle.SolidLine,
+  lineWidth=1,
+  fontFamily=Family.courierNew,
+  fontWeight=QFont.Weight.Normal,
+  fontSize=10,
+)
 backgroundStyle = BaseStyle('Background', _backgroundData)
 bezelStyle = BaseStyle('Bezels', _bezelData)
 darkSquareStyle = BaseStyle('Dark Square', _darkSquareData)
@@ -167,3 +177,4 @@ debugStyle = BaseStyle('debug', _debugData)
 baseButtonStyle = BaseStyle('Base Button', _baseButton)
 hoverButtonStyle = BaseStyle('Hover Button', _hoverButton)
 textButtonStyle = BaseStyle('Text Button', _textButton)
+overlayStyle = BaseStyle('Overlay', _overlayData)
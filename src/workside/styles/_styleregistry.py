@@ -0,0 +1,119 @@
+"""The style registry holds the pen, brush, font and font metrics built
+from style data, such that styles with identical data share them and
+applying a style to a painter creates no new objects."""
+#  MIT Licence
+#  Copyright (c) 2023 Asger Jon Vistisen
+from __future__ import annotations
+
+from typing import Never, NoReturn
+
+from PySide6.QtGui import QBrush, QPen, QColor, QFontMetricsF
+from icecream import ic
+from worktoy.waitaminute import ReadOnlyError
+
+from workside.settings import Settings
+
+ic.configureOutput(includeContext=True)
+
+
+def styleKey(data: dict) -> tuple:
+  """Returns a hashable key identifying the style data. Colors are
+  represented by their rgba value."""
+  return tuple((key, val.rgba() if isinstance(val, QColor) else val)
+               for (key, val) in sorted(data.items()))
+
+
+class StyleObjects:
+  """StyleObjects holds the pen, brush and font built from style data.
+  The font metrics are created when first needed. The objects are shared
+  and must not be changed.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  __slots__ = ('pen', 'brush', 'font', '_fontMetrics')
+
+  def __init__(self, data: dict) -> None:
+    self.pen = QPen()
+    self.pen.setStyle(data.get('lineStyle'))
+    self.pen.setColor(data.get('lineColor'))
+    self.pen.setWidth(data.get('lineWidth'))
+    self.brush = QBrush()
+    self.brush.setStyle(data.get('fillStyle'))
+    self.brush.setColor(data.get('fillColor'))
+    self.font = data.get('fontFamily').asQFont()
+    self.font.setWeight(data.get('fontWeight'))
+    self.font.setPointSize(
+      max(data.get('fontSize'), Settings.minimumFontSize))
+    self._fontMetrics = None
+
+  def getFontMetrics(self) -> QFontMetricsF:
+    """Getter-function for the font metrics"""
+    if self._fontMetrics is None:
+      self._fontMetrics = QFontMetricsF(self.font)
+    return self._fontMetrics
+
+
+class StyleRegistry:
+  """StyleRegistry maps style data to shared StyleObjects. Each distinct
+  set of data is built once per process. Counts of hits and misses are
+  kept for profiling. The generation is advanced whenever the data of a
+  style changes, such that anything rendered from the styles may include
+  it in its cache key.
+  #  MIT Licence
+  #  Copyright (c) 2023 Asger Jon Vistisen"""
+
+  def __init__(self, *args, **kwargs) -> None:
+    self._entries = {}
+    self._hits = 0
+    self._misses = 0
+    self._generation = 0
+
+  def get(self, data: dict) -> StyleObjects:
+    """Returns the objects of the given style data"""
+    key = styleKey(data)
+    entry = self._entries.get(key)
+    if entry is None:
+      self._misses += 1
+      entry = self._entries.setdefault(key, StyleObjects(data))
+    else:
+      self._hits += 1
+    return entry
+
+  def clear(self) -> NoReturn:
+    """Discards all entries. Styles fetch new objects the next time their
+    data changes."""
+    self._entries = {}
+
+  def advanceGeneration(self) -> NoReturn:
+    """Advances the generation, which invalidates everything rendered
+    from the styles"""
+    self._generation += 1
+
+  def _getHits(self) -> int:
+    """Getter-function for the number of lookups finding an entry"""
+    return self._hits
+
+  def _getMisses(self) -> int:
+    """Getter-function for the number of entries built"""
+    return self._misses
+
+  def _getSize(self) -> int:
+    """Getter-function for the number of entries"""
+    return len(self._entries)
+
+  def _getGeneration(self) -> int:
+    """Getter-function for the generation of the style data"""
+    return self._generation
+
+  def _noAcc(self, *_) -> Never:
+    """Illegal Accessor Function"""
+    raise ReadOnlyError('General illegal accessor')
+
+  hits = property(_getHits, _noAcc, _noAcc)
+  misses = property(_getMisses, _noAcc, _noAcc)
+  size = property(_getSize, _noAcc, _noAcc)
+  generation = property(_getGeneration, _noAcc, _noAcc)
+
+
+#  The registry shared by all styles in the process
+styleRegistry = StyleRegistry()
@@ -25,6 +25,7 @@ class MainWindow(LayoutWindow):
     self.setMinimumWidth(480)
     self.setMinimumHeight(640)
     self.setWindowTitle('Welcome to WorkSide!')
+    Sound.preloadAll()
 
   def show(self) -> NoReturn:
     """Reimplementation of show method"""